@@ -0,0 +1,387 @@
+# academy/assignments.py
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import COL_NAME, COL_SCHOOL, COL_GRADE, COL_KEY
+from .utils import sanitize_letter, sanitize_letters
+
+TABLE_ASSIGNMENTS = "assignments"
+
+# 출석부 입력 편집기(st.data_editor) 컬럼
+EDITOR_KEY = "_skey"
+EDITOR_NAME = "이름"
+EDITOR_LETTER = "배정"
+EDITOR_ABSENT = "결석"
+
+# (교시, 학생키) -> {"letter": "A", "absent": False}
+AssignKey = Tuple[int, str]
+DayAssignments = Dict[AssignKey, dict]
+
+
+def normalize_entry(value) -> dict:
+    """예전 형식("A")/누락값까지 {"letter", "absent"}로 통일"""
+    if isinstance(value, dict):
+        letter = value.get("letter")
+        return {
+            # 편집기에서 지운 칸은 None/NaN으로 옴 ("None" -> "N" 방지)
+            "letter": sanitize_letter(letter) if isinstance(letter, str) else "",
+            "absent": bool(value.get("absent", False)),
+        }
+    return {"letter": sanitize_letter(value) if isinstance(value, str) else "", "absent": False}
+
+
+def is_blank(entry: dict) -> bool:
+    return not entry["letter"] and not entry["absent"]
+
+
+# 메모리 보관용 1바이트 코드: 하위 5비트 = 배정 글자(A=1..Z=26, 0=없음), 0x20 = 결석
+_ABSENT_BIT = 0x20
+_LETTER_MASK = 0x1F
+
+
+def pack_entry(entry: dict) -> int:
+    letter = entry["letter"]
+    code = (ord(letter) - ord("A") + 1) if letter else 0
+    return code | (_ABSENT_BIT if entry["absent"] else 0)
+
+
+def unpack_entry(code: int) -> dict:
+    letter = code & _LETTER_MASK
+    return {"letter": chr(ord("A") + letter - 1) if letter else "", "absent": bool(code & _ABSENT_BIT)}
+
+
+class _PeriodSlots:
+    """한 날짜/교시의 배정: 학생 번호(정렬) + 1바이트 코드 배열 (빈 칸은 보관하지 않음)"""
+
+    __slots__ = ("ids", "codes")
+
+    def __init__(self):
+        self.ids = np.empty(0, dtype=np.int32)
+        self.codes = np.empty(0, dtype=np.uint8)
+
+    def update(self, ids: List[int], codes: List[int]) -> None:
+        """같은 학생은 나중 값 우선, 코드 0(빈 칸)은 삭제"""
+        all_ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int32)])
+        all_codes = np.concatenate([self.codes, np.asarray(codes, dtype=np.uint8)])
+        uniq, last = np.unique(all_ids[::-1], return_index=True)
+        vals = all_codes[::-1][last]
+        keep = vals != 0
+        self.ids, self.codes = uniq[keep], vals[keep]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def editor_frame(df_p: pd.DataFrame, day, period: int) -> pd.DataFrame:
+    """교시 학생 명단 + 날짜 배정(dict 또는 배정 표) -> 편집기 입력 frame (행 루프 없이 키로 맞춰 붙임)"""
+    keys = df_p[COL_KEY].to_numpy(dtype=object)
+    letters, absent = period_state(assignment_table(day), period, keys)
+
+    return pd.DataFrame({
+        EDITOR_KEY: keys,
+        EDITOR_NAME: (
+            df_p[COL_NAME].astype(str) + " (" + df_p[COL_SCHOOL].astype(str)
+            + " " + df_p[COL_GRADE].astype(str) + ")"
+        ).to_numpy(dtype=object),
+        EDITOR_LETTER: letters,
+        EDITOR_ABSENT: absent,
+    })
+
+
+def editor_changes(period: int, before: pd.DataFrame, after: pd.DataFrame) -> DayAssignments:
+    """편집 전/후 frame 비교 -> 실제로 바뀐 칸의 학생만 {(교시, 학생키): entry}"""
+    after = after.reindex(before.index)
+    letters = sanitize_letters(after[EDITOR_LETTER])
+    absent = after[EDITOR_ABSENT].astype(object).where(after[EDITOR_ABSENT].notna(), False).astype(bool)
+
+    changed = (
+        (letters.to_numpy() != before[EDITOR_LETTER].to_numpy())
+        | (absent.to_numpy() != before[EDITOR_ABSENT].to_numpy())
+    )
+    return {
+        (period, skey): {"letter": letter, "absent": is_abs}
+        for skey, letter, is_abs in zip(
+            before[EDITOR_KEY].to_numpy()[changed].tolist(),
+            letters.to_numpy()[changed].tolist(),
+            absent.to_numpy()[changed].tolist(),
+        )
+    }
+
+
+# 배정 표 (assignment_table / AssignmentStore.day_table) 컬럼
+TABLE_COLUMNS = ["period", "skey", "letter", "absent"]
+
+# 1바이트 코드 하위 5비트 -> 배정 글자
+_LETTERS = np.asarray([""] + [chr(ord("A") + i) for i in range(26)] + [""] * 5, dtype=object)
+
+
+def assignment_table(day) -> pd.DataFrame:
+    """
+    날짜 배정 dict -> 표 (컬럼 = period/skey/letter/absent, 명단과 학생키로 맞춰 붙이기용)
+    이미 표면 그대로 반환. 예전 형식("A")도 허용하고 글자 정리는 고유값 단위로 1번씩만
+    """
+    if isinstance(day, pd.DataFrame):
+        return day
+    periods, skeys = (list(x) for x in zip(*day)) if day else ([], [])
+    entries = list(day.values())
+    codes, uniques = pd.factorize(
+        pd.Series([e.get("letter", "") if isinstance(e, dict) else e for e in entries], dtype=object)
+    )
+    clean = np.asarray([sanitize_letter(str(u)) for u in uniques] + [""], dtype=object)
+    return pd.DataFrame({
+        "period": np.asarray(periods, dtype=np.int64),
+        "skey": pd.Series(skeys, dtype=object),
+        "letter": clean[codes],  # code -1(None/NaN) -> ""
+        "absent": np.asarray(
+            [bool(e.get("absent", False)) if isinstance(e, dict) else False for e in entries], dtype=bool
+        ),
+    })
+
+
+def period_state(table: pd.DataFrame, period: int, skeys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """배정 표에서 한 교시 학생들(skeys 순서)의 (배정 글자, 결석) 배열. 배정 없으면 ("", False)"""
+    letters = np.full(len(skeys), "", dtype=object)
+    absent = np.zeros(len(skeys), dtype=bool)
+    mine = table["period"].to_numpy() == period
+    if mine.any() and len(skeys):
+        at = pd.Index(table["skey"].to_numpy(dtype=object)[mine]).get_indexer(skeys)
+        hit = at >= 0
+        letters[hit] = table["letter"].to_numpy(dtype=object)[mine][at[hit]]
+        absent[hit] = table["absent"].to_numpy(dtype=bool)[mine][at[hit]]
+    return letters, absent
+
+
+class AssignmentStore:
+    """
+    출석부 배정/결석 저장소 (프로세스 공용 1개, 직원 기기 간 공유)
+    - put(): 메모리에 즉시 반영하고 바로 반환 (저장 버튼이 디스크를 기다리지 않음)
+    - 백그라운드 스레드가 flush_interval마다 밀린 변경을 한 트랜잭션으로 SQLite에 기록
+    - day(): 날짜별 메모리 캐시, 처음 보는 날짜만 (date) 인덱스로 1회 조회
+    - 메모리 캐시는 학생키를 정수 번호로 바꾸고 교시별 작은 배열로 보관,
+      최근 max_days개 날짜만 유지 (밀려난 날짜는 디스크에서 다시 읽음)
+    - path가 없으면 메모리 전용 (밀어낼 곳이 없으므로 날짜 수 제한 없음)
+    """
+
+    def __init__(self, path: Optional[str] = None, flush_interval: float = 2.0, max_days: int = 31):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_days = max_days
+        self.last_error: Optional[Exception] = None
+        self.flushed_at: float = 0.0
+        self._key_ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._days: "OrderedDict[str, Dict[int, _PeriodSlots]]" = OrderedDict()
+        self._pending: Dict[Tuple[str, int, str], dict] = {}
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with self._connect() as con:
+                con.execute(
+                    f"CREATE TABLE IF NOT EXISTS {TABLE_ASSIGNMENTS} ("
+                    " date TEXT NOT NULL, period INTEGER NOT NULL, skey TEXT NOT NULL,"
+                    " letter TEXT NOT NULL DEFAULT '', absent INTEGER NOT NULL DEFAULT 0,"
+                    " updated_at REAL NOT NULL,"
+                    " PRIMARY KEY (date, period, skey)"
+                    ") WITHOUT ROWID"
+                )
+            con.close()
+            self._writer = threading.Thread(target=self._run, name="assignment-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.path, timeout=10)
+        con.execute("PRAGMA journal_mode=WAL")
+        return con
+
+    # -----------------------------
+    # 메모리 배치 (학생키 -> 정수 번호)
+    # -----------------------------
+    def _intern(self, skey: str) -> int:
+        sid = self._key_ids.get(skey)
+        if sid is None:
+            sid = self._key_ids[skey] = len(self._keys)
+            self._keys.append(skey)
+        return sid
+
+    def _apply(self, slots: Dict[int, _PeriodSlots], entries: Dict[AssignKey, dict]) -> None:
+        by_period: Dict[int, Tuple[List[int], List[int]]] = {}
+        for (p, skey), entry in entries.items():
+            ids, codes = by_period.setdefault(p, ([], []))
+            ids.append(self._intern(skey))
+            codes.append(pack_entry(entry))
+        for p, (ids, codes) in by_period.items():
+            slots.setdefault(p, _PeriodSlots()).update(ids, codes)
+
+    def _touch(self, date_iso: str) -> Dict[int, _PeriodSlots]:
+        """(잠금 안에서) 날짜 캐시를 최근 사용으로 옮기고, 넘치면 오래된 날짜부터 버림"""
+        slots = self._days[date_iso]
+        self._days.move_to_end(date_iso)
+        if self.path:
+            while len(self._days) > self.max_days:
+                # pending은 따로 보관되므로 버려도 안전 (다시 읽을 때 위에 덮어씀)
+                self._days.popitem(last=False)
+        return slots
+
+    # -----------------------------
+    # 읽기
+    # -----------------------------
+    def _day_slots(self, date_iso: str) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """해당 날짜 교시별 (학생 번호, 코드) 배열. 배열은 갱신 때 통째로 바뀌므로 받은 쪽에서 그대로 읽어도 안전"""
+        with self._lock:
+            if date_iso in self._days:
+                return {p: (ps.ids, ps.codes) for p, ps in self._touch(date_iso).items()}
+
+        # flush(꺼낸 뒤 기록 전)와 겹치면 그 변경을 놓치므로 디스크 읽기~pending 합치기를 한 번에
+        with self._io_lock:
+            loaded = self._load(date_iso)
+
+            with self._lock:
+                if date_iso not in self._days:
+                    slots: Dict[int, _PeriodSlots] = {}
+                    # 아직 기록 안 된 변경(pending)이 디스크 값보다 우선
+                    loaded.update({
+                        (p, skey): entry
+                        for (d, p, skey), entry in self._pending.items() if d == date_iso
+                    })
+                    self._apply(slots, loaded)
+                    self._days[date_iso] = slots
+                return {p: (ps.ids, ps.codes) for p, ps in self._touch(date_iso).items()}
+
+    def day(self, date_iso: str) -> DayAssignments:
+        """해당 날짜 배정 (복사본). 다른 세션이 동시에 고쳐도 렌더링 중에 바뀌지 않음"""
+        keys = self._keys
+        return {
+            (p, keys[sid]): unpack_entry(code)
+            for p, (ids, codes) in self._day_slots(date_iso).items()
+            for sid, code in zip(ids.tolist(), codes.tolist())
+        }
+
+    def day_table(self, date_iso: str) -> pd.DataFrame:
+        """해당 날짜 배정을 표로 (dict를 거치지 않고 코드 배열에서 바로 풀어냄)"""
+        keys = self._keys
+        parts = [(p, ids, codes) for p, (ids, codes) in self._day_slots(date_iso).items() if len(ids)]
+        if not parts:
+            return pd.DataFrame({c: pd.Series(dtype=t) for c, t in zip(TABLE_COLUMNS, ["int64", object, object, bool])})
+        ids = np.concatenate([x[1] for x in parts])
+        codes = np.concatenate([x[2] for x in parts])
+        return pd.DataFrame({
+            "period": np.repeat([x[0] for x in parts], [len(x[1]) for x in parts]).astype(np.int64),
+            "skey": pd.Series([keys[i] for i in ids.tolist()], dtype=object),
+            "letter": _LETTERS[codes & _LETTER_MASK],
+            "absent": (codes & _ABSENT_BIT) != 0,
+        })
+
+    def _load(self, date_iso: str) -> DayAssignments:
+        if not self.path:
+            return {}
+        with self._connect() as con:
+            rows = con.execute(
+                f"SELECT period, skey, letter, absent FROM {TABLE_ASSIGNMENTS} WHERE date = ?",
+                (date_iso,),
+            ).fetchall()
+        con.close()
+        return {(int(p), skey): {"letter": letter, "absent": bool(absent)} for p, skey, letter, absent in rows}
+
+    # -----------------------------
+    # 쓰기 (write-behind)
+    # -----------------------------
+    def put(self, date_iso: str, changes: Dict[AssignKey, dict]) -> None:
+        """변경분을 메모리에 즉시 반영하고 디스크 기록은 예약"""
+        if not changes:
+            return
+        entries = {k: normalize_entry(v) for k, v in changes.items()}
+        if not self.path:
+            self.day(date_iso)  # 메모리 전용: 날짜 캐시가 유일한 보관처
+
+        with self._lock:
+            if self.path:
+                for (p, skey), entry in entries.items():
+                    self._pending[(date_iso, p, skey)] = entry
+            # 캐시에 없는 날짜는 다음 day()에서 디스크 + pending으로 구성
+            if date_iso in self._days:
+                self._apply(self._touch(date_iso), entries)
+            elif not self.path:
+                self._apply(self._days.setdefault(date_iso, {}), entries)
+        self._wake.set()
+
+    def usage(self) -> Dict[str, int]:
+        """메모리 사용 현황 (진단용)"""
+        with self._lock:
+            return {
+                "days_cached": len(self._days),
+                "entries_cached": sum(len(ps) for slots in self._days.values() for ps in slots.values()),
+                "keys_interned": len(self._keys),
+                "pending": len(self._pending),
+            }
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """밀린 변경을 한 번에 기록. 실패하면 다음 주기에 다시 시도 (그 사이 새 변경이 우선)"""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch or not self.path:
+                return 0
+
+            now = time.time()
+            upserts = [
+                (d, p, skey, e["letter"], int(e["absent"]), now)
+                for (d, p, skey), e in batch.items() if not is_blank(e)
+            ]
+            deletes = [(d, p, skey) for (d, p, skey), e in batch.items() if is_blank(e)]
+            try:
+                with self._connect() as con:
+                    con.executemany(
+                        f"INSERT INTO {TABLE_ASSIGNMENTS} (date, period, skey, letter, absent, updated_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT (date, period, skey) DO UPDATE SET"
+                        " letter = excluded.letter, absent = excluded.absent, updated_at = excluded.updated_at",
+                        upserts,
+                    )
+                    con.executemany(
+                        f"DELETE FROM {TABLE_ASSIGNMENTS} WHERE date = ? AND period = ? AND skey = ?",
+                        deletes,
+                    )
+                con.close()
+            except Exception as e:
+                with self._lock:
+                    for k, v in batch.items():
+                        self._pending.setdefault(k, v)
+                self.last_error = e
+                return 0
+
+            self.last_error = None
+            self.flushed_at = now
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait()
+            # 연속 입력은 flush_interval 동안 모아서 한 번에
+            time.sleep(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """종료 시 남은 변경 기록"""
+        self._closed = True
+        self._wake.set()
+        self.flush()
@@ -0,0 +1,105 @@
+# academy/batch.py
+import datetime
+import hashlib
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .config import WEEKDAY_ORDER
+from .assignments import assignment_table
+from .tables import AttendanceDay, table3_body, table3_title
+
+
+def date_range(start: datetime.date, end: datetime.date) -> List[datetime.date]:
+    """start ~ end (양 끝 포함)"""
+    if end < start:
+        start, end = end, start
+    return [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def month_bounds(d: datetime.date) -> Tuple[datetime.date, datetime.date]:
+    """d가 속한 달의 (1일, 말일)"""
+    first = d.replace(day=1)
+    last = (first + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+    return first, last
+
+
+def _state_key(state: pd.DataFrame) -> bytes:
+    """배정 표 내용 지문 (같은 요일 날짜끼리 같은 상태면 본문을 한 번만 렌더링)"""
+    if state.empty:
+        return b""
+    ordered = state.sort_values(["period", "skey"], kind="stable")
+    h = pd.util.hash_pandas_object(ordered, index=False).to_numpy()
+    return hashlib.blake2b(h.tobytes(), digest_size=16).digest()
+
+
+def render_weekday(day: AttendanceDay, states: Sequence[Tuple[datetime.date, pd.DataFrame]]) -> List[Tuple[datetime.date, str]]:
+    """
+    같은 요일 날짜들의 출석부 (프로세스 풀 작업 단위)
+    명단 정렬/이름 칸은 day 하나를 공유하고, 배정 상태가 같은 날짜는 본문도 공유
+    """
+    bodies: Dict[bytes, str] = {}
+    out = []
+    for d, state in states:
+        key = _state_key(state)
+        body = bodies.get(key)
+        if body is None:
+            body = bodies[key] = table3_body(day, state)
+        out.append((d, table3_title(d, day.weekday) + body))
+    return out
+
+
+def attendance_packet(
+    df: pd.DataFrame,
+    dates: Sequence[datetime.date],
+    include_paused: bool,
+    day_state: Callable[[str], object],
+    executor: Optional[Executor] = None,
+) -> str:
+    """
+    여러 날짜 출석부를 인쇄용 문서 1개로 (날짜마다 A4 1장)
+    - day_state(date_iso): 날짜 배정 (dict 또는 배정 표, 예: AssignmentStore.day_table)
+    - 요일별 명단 준비는 요일마다 1번, 렌더링은 요일 단위
+    - executor를 주면 요일 단위로 나눠 맡김 (기본은 현재 프로세스. 준비한 명단을 보내고 HTML을 돌려받는
+      비용이 커서 측정한 크기에서는 모두 현재 프로세스가 더 빨랐음)
+    """
+    if df is None or df.empty or not dates:
+        return ""
+
+    days: Dict[str, AttendanceDay] = {}
+    groups: Dict[str, List[Tuple[datetime.date, pd.DataFrame]]] = {}
+    for d in dates:
+        weekday = WEEKDAY_ORDER[d.weekday()]
+        if weekday not in days:
+            days[weekday] = AttendanceDay(df, weekday, include_paused)
+        groups.setdefault(weekday, []).append((d, assignment_table(day_state(d.isoformat()))))
+
+    results = None
+    if executor is not None and len(groups) > 1:
+        try:
+            futures = [executor.submit(render_weekday, days[w], items) for w, items in groups.items()]
+            results = [f.result() for f in futures]
+        except BrokenProcessPool:
+            results = None  # 작업 프로세스가 죽었으면 여기서 직접
+    if results is None:
+        results = [render_weekday(days[w], items) for w, items in groups.items()]
+
+    sheets = dict(pair for part in results for pair in part)
+    return "".join(
+        f"<div class='a4-print-box'><div class='report-view'>{sheets[d]}</div></div>"
+        for d in dates
+    )
+
+
+def batch_executor(max_workers: int = 1) -> Optional[ProcessPoolExecutor]:
+    """
+    출석부 묶음용 프로세스 풀 (요일 7개까지 동시에). max_workers가 1 이하면 None (= 현재 프로세스에서, 기본)
+    Streamlit 서버는 스레드가 많으므로 fork 대신 spawn으로 띄움
+    """
+    if max_workers <= 1:
+        return None
+    workers = min(max_workers, len(WEEKDAY_ORDER))
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
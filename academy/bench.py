@@ -0,0 +1,291 @@
+# academy/bench.py
+# 성능 측정 도구 (테스트가 아니라 수동/CI에서 돌리는 벤치마크)
+#
+#   python -m academy.bench                              # 100 / 1k / 10k / 100k명, bench.json
+#   python -m academy.bench --sizes 1000 10000 --out new.json --compare old.json
+#
+# 고정 seed로 만든 가상 명단(시트 원본 형태: 마커/숫자 교시, NBSP/전각공백 섞임)에 대해
+# 단계별 실행 시간(최소/중앙값)과 최대 메모리(tracemalloc)를 재서 JSON으로 남김
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    COL_ID, COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS, COL_KEY,
+    WEEKDAY_ORDER,
+)
+from .sync import RosterSync
+from .schedule import ScheduleIndex
+from .filters import filter_students_for_day_period
+from .search import SearchIndex
+from .utils import match_attendance
+from .tables import (
+    generate_total_list_html, generate_table1, generate_table2, generate_table3, generate_table4
+)
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍전고문양손배백허유남심노하곽성차주우구민진나"
+_GIVEN = "민서준지현우연수하윤도예은진영호성재원유아시주채건태희동혁소빈율"
+_SCHOOL_BASES = ["서울", "한빛", "대치", "역삼", "휘문", "경기", "숙명", "반포", "개포", "도곡", "양재", "청담"]
+_LEVELS = [("초", ["초1", "초2", "초3", "초4", "초5", "초6"]), ("중", ["중1", "중2", "중3"]), ("고", ["고1", "고2", "고3"])]
+_WEEKDAYS = WEEKDAY_ORDER[:5]
+
+
+def _noise(r: random.Random, s: str, p: float) -> str:
+    """시트에서 흔한 잡음: 앞/뒤에 NBSP, 전각공백, 공백"""
+    if not s or r.random() >= p:
+        return s
+    pad = r.choice(["\u00A0", "\u3000", " "])
+    return s + pad if r.random() < .5 else pad + s
+
+
+def synthetic_roster(n: int, seed: int = 0) -> Tuple[List[str], List[list]]:
+    """
+    시트 원본 형태의 가상 명단 -> (헤더, 컬럼별 값). 같은 (n, seed)면 항상 같은 명단
+    - 학교/학년은 학교급이 맞게, 일부는 '기타'/빈 학교
+    - 등원요일 '월,수' (가끔 '월, 수'), 수업교시는 마커형 '월1,수2' / 숫자형 '1,2' · '1 2' · '1/2'
+    - 학생ID 일부 비어 있거나 중복, 상태 재원/휴원/퇴원
+    """
+    r = random.Random(seed)
+    schools = [(f"{b}{lv}", grades) for b in _SCHOOL_BASES for lv, grades in _LEVELS]
+    schools.append(("숙명여고", _LEVELS[2][1]))
+
+    cols: Dict[str, list] = {c: [] for c in [COL_ID, COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS, "비고"]}
+    for i in range(n):
+        school, grades = r.choice(schools)
+        grade = r.choice(grades)
+        if r.random() < .02:
+            school, grade = "", "기타"
+
+        days = sorted(r.sample(_WEEKDAYS, r.choice([1, 1, 2, 2, 2, 3, 3, 4])), key=_WEEKDAYS.index)
+        form = r.random()
+        if form < .45:
+            periods = ",".join(f"{d}{r.randint(1, 3)}" for d in days)
+        else:
+            nums = [str(x) for x in sorted(r.sample([1, 2, 3], r.randint(1, 2)))]
+            periods = r.choice([",", " ", "/"]).join(nums)
+        days_str = ", ".join(days) if r.random() < .1 else ",".join(days)
+
+        sid = i + 1
+        if r.random() < .03:
+            sid = ""
+        elif r.random() < .01 and i:
+            sid = r.randint(1, i)  # 중복 ID
+
+        cols[COL_ID].append(sid)
+        cols[COL_NAME].append(_noise(r, r.choice(_SURNAMES) + r.choice(_GIVEN) + r.choice(_GIVEN), .02))
+        cols[COL_SCHOOL].append(_noise(r, school, .05))
+        cols[COL_GRADE].append(_noise(r, grade, .05))
+        cols[COL_DAYS].append(_noise(r, days_str, .05))
+        cols[COL_PERIOD].append(_noise(r, periods, .05))
+        cols[COL_STATUS].append(r.choice(["재원"] * 8 + ["휴원", "퇴원"]))
+        cols["비고"].append("")
+    return list(cols), list(cols.values())
+
+
+def synthetic_assignments(df: pd.DataFrame, date: datetime.date, seed: int = 0, rate: float = .5) -> dict:
+    """해당 날짜 출석부의 가상 배정 (교시 학생 중 rate 비율에 글자/결석)"""
+    r = random.Random(seed)
+    weekday = WEEKDAY_ORDER[date.weekday()]
+    out = {}
+    for p in (1, 2, 3):
+        for skey in filter_students_for_day_period(df, weekday, p)[COL_KEY].tolist():
+            if r.random() < rate:
+                out[(p, skey)] = {"letter": r.choice("ABCD"), "absent": r.random() < .1}
+    return out
+
+
+# -----------------------------
+# 측정 단계: (이름, 준비(명단) -> 실행할 함수)
+# -----------------------------
+Stage = Tuple[str, Callable[[dict], Callable[[], object]]]
+
+
+def _touch_rows(header: List[str], cols: List[list], rate: float = .01, seed: int = 1) -> List[list]:
+    """행 일부(rate)의 수업교시만 바꾼 사본 (증분 동기화 측정용)"""
+    r = random.Random(seed)
+    out = [list(c) for c in cols]
+    pcol = header.index(COL_PERIOD)
+    for i in r.sample(range(len(out[pcol])), max(1, int(len(out[pcol]) * rate))):
+        out[pcol][i] = "1,2" if out[pcol][i] != "1,2" else "3"
+    return out
+
+
+def _incremental(ctx: dict) -> Callable[[], object]:
+    """1% 바뀐 명단과 원래 명단을 번갈아 반영 (매번 바뀐 행만 다시 정규화)"""
+    engine = RosterSync()
+    engine.apply(ctx["header"], ctx["cols"])
+    snapshots = itertools.cycle([ctx["touched"], ctx["cols"]])
+    return lambda: engine.apply(ctx["header"], next(snapshots))
+
+
+def _filter_all(ctx: dict) -> Callable[[], object]:
+    df = ctx["df"]
+    return lambda: [filter_students_for_day_period(df, d, p) for d in _WEEKDAYS for p in (1, 2, 3)]
+
+
+def _search_query(ctx: dict) -> Callable[[], object]:
+    idx = SearchIndex.build(ctx["df"])
+    return lambda: [idx.search(q) for q in ("김", "대치중", "ㄱㅁ", "월1")]
+
+
+def _match_attendance(ctx: dict) -> Callable[[], object]:
+    days = ctx["df"][COL_DAYS].tolist()
+    periods = ctx["df"][COL_PERIOD].tolist()
+    return lambda: sum(match_attendance(d, p, "수", 2) for d, p in zip(days, periods))
+
+
+STAGES: List[Stage] = [
+    ("load.normalize", lambda ctx: lambda: RosterSync().apply(ctx["header"], ctx["cols"])),
+    ("load.incremental_1pct", _incremental),
+    ("schedule_index.build", lambda ctx: lambda: ScheduleIndex.build(ctx["df"])),
+    ("filter_students_for_day_period.all_slots", _filter_all),
+    ("match_attendance.one_slot", _match_attendance),
+    ("search.build", lambda ctx: lambda: SearchIndex.build(ctx["df"])),
+    ("search.query", _search_query),
+    ("generate_total_list_html", lambda ctx: lambda: generate_total_list_html(ctx["df"])),
+    ("generate_table1", lambda ctx: lambda: generate_table1(ctx["df"], True, True, "2026.10")),
+    ("generate_table2", lambda ctx: lambda: generate_table2(ctx["df"], "2026-10")),
+    ("generate_table3", lambda ctx: lambda: generate_table3(ctx["df"], ctx["date"], False, ctx["assignments"])),
+    ("generate_table4", lambda ctx: lambda: generate_table4(ctx["df"], True, "2026.10")),
+]
+
+
+def _context(n: int, seed: int) -> dict:
+    header, cols = synthetic_roster(n, seed)
+    df = RosterSync().apply(header, cols)
+    date = datetime.date(2026, 10, 14)  # 수요일
+    return {
+        "header": header,
+        "cols": cols,
+        "touched": _touch_rows(header, cols, seed=seed + 1),
+        "df": df,
+        "date": date,
+        "assignments": synthetic_assignments(df, date, seed),
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int, min_time: float = 0.2) -> dict:
+    """
+    실행 시간: 1회 예열 후 repeat번(빠른 단계는 min_time을 채울 때까지 더) 재서 최소/중앙값
+    메모리: tracemalloc으로 따로 1회 (시간 측정에는 넣지 않음)
+    """
+    fn()
+    times: List[float] = []
+    started = time.perf_counter()
+    while len(times) < repeat or (time.perf_counter() - started < min_time and len(times) < 1000):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": len(times),
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_mb": peak / 2 ** 20,
+    }
+
+
+def run(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    seed: int = 0,
+    repeat: int = 3,
+    stages: Optional[Sequence[str]] = None,
+    log: Callable[[str], None] = lambda s: None,
+) -> dict:
+    """벤치마크 실행 -> 결과 dict (JSON 저장용)"""
+    selected = [s for s in STAGES if not stages or s[0] in stages]
+    results = []
+    for n in sizes:
+        ctx = _context(n, seed)
+        for name, prepare in selected:
+            fn = prepare(ctx)
+            row = {"size": n, "stage": name, **measure(fn, repeat)}
+            results.append(row)
+            log(f"{n:>7} {name:<42} {row['min_s'] * 1000:>10.2f} ms  {row['peak_mb']:>8.1f} MB")
+    return {"meta": _meta(seed, repeat), "results": results}
+
+
+def _meta(seed: int, repeat: int) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "-C", os.path.dirname(os.path.abspath(__file__)), "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "seed": seed,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare(old: dict, new: dict) -> List[str]:
+    """두 결과 파일 비교 (같은 size/stage끼리, min 기준 배율)"""
+    before = {(r["size"], r["stage"]): r for r in old.get("results", [])}
+    lines = [f"{'size':>7} {'stage':<42} {'old ms':>10} {'new ms':>10} {'ratio':>7}"]
+    for r in new.get("results", []):
+        o = before.get((r["size"], r["stage"]))
+        if o is None:
+            continue
+        ratio = r["min_s"] / o["min_s"] if o["min_s"] else float("inf")
+        lines.append(
+            f"{r['size']:>7} {r['stage']:<42} {o['min_s'] * 1000:>10.2f} {r['min_s'] * 1000:>10.2f} {ratio:>6.2f}x"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m academy.bench", description="명단 처리/보고서 렌더링 벤치마크")
+    p.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="학생 수 (기본: 100 1000 10000 100000)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=3, help="단계별 최소 반복 횟수")
+    p.add_argument("--stages", nargs="+", metavar="STAGE", help=f"측정할 단계만 ({', '.join(s[0] for s in STAGES)})")
+    p.add_argument("--out", default="bench.json", help="결과 JSON 경로 (기본: bench.json)")
+    p.add_argument("--compare", metavar="OLD_JSON", help="이전 결과와 비교해서 출력")
+    args = p.parse_args(argv)
+
+    unknown = set(args.stages or []) - {s[0] for s in STAGES}
+    if unknown:
+        p.error(f"알 수 없는 단계: {sorted(unknown)}")
+
+    result = run(args.sizes, args.seed, args.repeat, args.stages, log=print)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(args.out)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print("\n".join(compare(json.load(f), result)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,23 @@ SCOPE = [
 
 WORKSHEET_STUDENTS = "students"  # 시트 탭 이름(너 구글시트에서 쓰는 이름)
 
+ROSTER_TTL = 300  # 초: 이 시간이 지나면 백그라운드에서 시트 재확인
+REFRESH_MIN_INTERVAL = 10  # 초: 새로고침 버튼 연타/동시 클릭은 이 간격 안에서 1번만 시트 확인
+PREFETCH_LEAD = 30  # 초: 만료(ROSTER_TTL) 이만큼 전에 백그라운드에서 미리 시트 확인
+PREFETCH_RETRY = 60  # 초: 백그라운드 확인 실패 후 다시 시도할 때까지
+SNAPSHOT_PATH = ".cache/roster.sqlite3"  # 마지막 명단 스냅샷 (재시작/오프라인 대비)
+ASSIGNMENTS_PATH = ".cache/assignments.sqlite3"  # 출석부 배정/결석 저장소
+ASSIGNMENT_FLUSH_INTERVAL = 2.0  # 초: 배정 변경을 모아서 디스크에 기록하는 주기
+ASSIGNMENT_CACHE_DAYS = 31  # 메모리에 들고 있을 최근 날짜 수 (나머지는 필요할 때 디스크에서)
+SHEETS_READ_QUOTA_PER_MIN = 60  # 구글 시트 API 분당 읽기 한도(사용자당)
+FETCH_MODE = "columns"  # "columns": 필수 컬럼 범위만 받기 / "records": get_all_records 전체
+RENDER_CACHE_SIZE = 64  # 보고서 HTML 캐시 항목 수 (명단 지문 + 옵션별 1개)
+ROSTER_PAGE_SIZE = 50  # 탭 0 전체 목록 한 페이지 행 수
+BATCH_WORKERS = 1  # 기간 출석부 프로세스 수 (1 = 현재 프로세스에서, 2 이상 = spawn 프로세스 풀, 최대 요일 수 7)
+# 측정상 프로세스 풀은 1천~10만 명 모두 현재 프로세스보다 느렸음 (작업 전달/HTML 회수 비용 + 시작 비용)
+DIAG_HISTORY = 20  # 진단 패널(?diag=1)에 남길 최근 실행 기록 수 (세션별)
+PROFILE_DIR = ".cache/profiles"  # 진단 패널 프로파일(cProfile) 저장 위치
+
 COL_ID = "학생ID"
 COL_NAME = "이름"
 COL_SCHOOL = "학교"
@@ -17,6 +34,12 @@ COL_DAYS = "등원요일"
 COL_PERIOD = "수업교시"
 COL_STATUS = "상태"
 
+# load_data가 스냅샷마다 한 번 계산해 붙이는 파생 컬럼 (academy.roster.enrich_roster)
+COL_KEY = "_skey"                  # 배정 저장용 고유키 (get_student_key와 동일 규칙)
+COL_SCHOOL_GRADE = "_school_grade"  # '서울초'+'초3' -> '서울초3'
+COL_GRADE_ORDER = "_grade_order"    # GRADE_ORDER 순번 (없으면 999)
+COL_DAYS_COUNT = "days_count"       # 주 N회
+
 REQUIRED_COLUMNS = {
     COL_ID, COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS
 }
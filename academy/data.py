@@ -1,49 +1,188 @@
 # academy/data.py
+import threading
+from typing import List
+
 import streamlit as st
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
 
 from .config import (
-    SCOPE, WORKSHEET_STUDENTS,
-    REQUIRED_COLUMNS,
-    COL_PERIOD, COL_STATUS, COL_DAYS
+    WORKSHEET_STUDENTS, ROSTER_TTL, REFRESH_MIN_INTERVAL, SNAPSHOT_PATH,
+    FETCH_MODE, RENDER_CACHE_SIZE, ASSIGNMENTS_PATH, ASSIGNMENT_FLUSH_INTERVAL,
+    ASSIGNMENT_CACHE_DAYS, PREFETCH_LEAD, PREFETCH_RETRY, BATCH_WORKERS,
 )
-from .utils import norm
+from .sheets import SheetsClientManager
+from .loader import make_sheets_manager
+from .sync import RosterSync, HeaderMismatchError
+from .render_cache import RenderCache, ReportJob
+from .assignments import AssignmentStore
+from .prefetch import RosterPrefetcher
+from .batch import batch_executor
+from .tables import generate_table1, generate_table2, generate_table4
+from .utils import now_kst
 
 
-@st.cache_data(ttl=300, show_spinner="loading...")
-def load_data() -> pd.DataFrame:
+def default_report_jobs() -> List[ReportJob]:
+    """탭 기본값(이번 달 제목, 기본 옵션)으로 여는 보고서들: 학년별 / 수업시간 / 학교별"""
+    now = now_kst()
+    return [
+        (generate_table1, (True, True, now.strftime("%Y.%m"))),
+        (generate_table2, (now.strftime("%Y-%m"),)),
+        (generate_table4, (True, now.strftime("%Y.%m"))),
+    ]
+
+
+def _materialize_reports(reports: RenderCache, frame: pd.DataFrame) -> None:
     try:
-        creds_info = st.secrets["SERVICE_ACCOUNT_INFO"]
-        creds = Credentials.from_service_account_info(creds_info, scopes=SCOPE)
-        client = gspread.authorize(creds)
+        reports.materialize(frame, default_report_jobs())
+    except Exception:
+        # 미리 만들기 실패는 세션이 직접 렌더링하면 되므로 무시
+        pass
+
+
+@st.cache_resource
+def get_roster_sync() -> RosterSync:
+    """
+    프로세스 공용 동기화 엔진 (세션 간 공유).
+    새 명단이 발행될 때마다 기본 보고서를 백그라운드에서 한 번 만들어 공용 캐시에 고정
+    """
+    engine = RosterSync(snapshot_path=SNAPSHOT_PATH, fetch_mode=FETCH_MODE)
+    reports = get_render_cache()
+
+    def _on_publish(frame: pd.DataFrame) -> None:
+        threading.Thread(
+            target=_materialize_reports, args=(reports, frame), name="report-materialize", daemon=True
+        ).start()
+
+    engine.subscribe(_on_publish)
+    return engine
+
+
+@st.cache_resource
+def get_render_cache() -> RenderCache:
+    """프로세스 공용 보고서 HTML 캐시 (명단 지문 기준이라 명단이 바뀌면 자동으로 무효)"""
+    return RenderCache(maxsize=RENDER_CACHE_SIZE)
+
+
+@st.cache_resource
+def get_assignment_store() -> AssignmentStore:
+    """프로세스 공용 출석부 배정 저장소 (새로고침/재시작/다른 기기에서도 유지)"""
+    return AssignmentStore(
+        path=ASSIGNMENTS_PATH,
+        flush_interval=ASSIGNMENT_FLUSH_INTERVAL,
+        max_days=ASSIGNMENT_CACHE_DAYS,
+    )
+
+
+@st.cache_resource
+def get_batch_executor():
+    """프로세스 공용 출석부 묶음 렌더링 풀 (BATCH_WORKERS가 2 이상일 때만, 기본은 None = 현재 프로세스)"""
+    return batch_executor(BATCH_WORKERS)
+
+
+@st.cache_resource
+def get_sheets_manager() -> SheetsClientManager:
+    """
+    프로세스 공용 시트 클라이언트 (인증 세션/핸들 재사용, 재시도, 쿼터)
+    - secrets에 LOCAL_SHEETS_DIR가 있으면 로컬 CSV 백엔드 사용
+    """
+    local_dir = st.secrets.get("LOCAL_SHEETS_DIR")
+    if local_dir:
+        return make_sheets_manager(local_dir=local_dir)
+    return make_sheets_manager(creds_info=dict(st.secrets["SERVICE_ACCOUNT_INFO"]))
 
-        sh = client.open(st.secrets["SPREADSHEET_NAME"])
-        ws = sh.worksheet(WORKSHEET_STUDENTS)
 
-        df = pd.DataFrame(ws.get_all_records())
+def _spreadsheet_opener():
+    """
+    백그라운드 스레드에서도 쓸 수 있도록 secrets 값을 미리 읽어 둔 opener
+    - SPREADSHEET_KEY가 있으면 ID로 바로 열기 (Drive 이름 검색 생략)
+    """
+    manager = get_sheets_manager()
+    key = st.secrets.get("SPREADSHEET_KEY")
+    name = st.secrets.get("SPREADSHEET_NAME")
 
-        if df.empty:
-            return df
+    def _open():
+        return manager.spreadsheet(key=key, name=name)
 
-        # 1) 컬럼명 정규화
-        df.columns = [norm(c) for c in df.columns]
+    return _open
 
-        # 2) 필수 컬럼 검증
-        missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
-        if missing:
-            st.error(f"구글 시트 헤더가 일치하지 않습니다. 누락된 항목: {missing}")
-            st.info(f"현재 인식된 항목: {list(df.columns)}")
-            st.stop()
 
-        # 3) 주요 문자열 컬럼 정규화 (공백/특수공백 제거)
-        df[COL_PERIOD] = df[COL_PERIOD].astype(str).apply(norm)
-        df[COL_STATUS] = df[COL_STATUS].astype(str).apply(norm)
-        df[COL_DAYS]   = df[COL_DAYS].astype(str).apply(norm)
+@st.cache_resource
+def get_prefetcher() -> RosterPrefetcher:
+    """프로세스 공용 백그라운드 갱신 스레드 (만료 전에 미리 시트 확인, 달이 바뀌면 기본 보고서 다시 준비)"""
+    reports = get_render_cache()
+    return RosterPrefetcher(
+        get_roster_sync(),
+        _spreadsheet_opener(),
+        WORKSHEET_STUDENTS,
+        ttl=ROSTER_TTL,
+        lead=PREFETCH_LEAD,
+        retry_delay=PREFETCH_RETRY,
+        warm=lambda frame: _materialize_reports(reports, frame),
+    )
 
-        return df
+
+def _show_header_mismatch(e: HeaderMismatchError) -> None:
+    st.error(f"구글 시트 헤더가 일치하지 않습니다. 누락된 항목: {e.missing}")
+    st.info(f"현재 인식된 항목: {e.columns}")
+
+
+def _sync_now(engine: RosterSync, min_interval: float = 0.0) -> bool:
+    """
+    포그라운드 동기화 (스냅샷이 없을 때 / 새로고침).
+    여러 세션이 동시에 눌러도 시트 확인은 1번 (나머지는 그 결과를 기다림)
+    """
+    try:
+        with st.spinner("loading..."):
+            return engine.refresh(_spreadsheet_opener(), WORKSHEET_STUDENTS, min_interval)
+
+    except HeaderMismatchError as e:
+        _show_header_mismatch(e)
+        st.stop()
 
     except Exception as e:
-        st.error(f"데이터 로드 실패: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        engine.last_error = e
+        if not engine.loaded:
+            st.error(f"데이터 로드 실패: {e}")
+        return True  # 확인은 시도함 (다음 rerun에서 경고 표시)
+
+
+def load_data() -> pd.DataFrame:
+    """
+    stale-while-revalidate 로더
+    - 메모리/디스크 스냅샷이 있으면 즉시 반환
+    - 평소에는 백그라운드 갱신 스레드가 만료 전에 미리 확인하므로 rerun이 시트를 기다리지 않음
+    - 그래도 오래됐으면(스레드 실패 등) 백그라운드 재검증
+    - 스냅샷이 전혀 없을 때만 시트를 기다림
+    """
+    engine = get_roster_sync()
+    if not engine.loaded:
+        engine.restore()
+
+    if not engine.loaded:
+        _sync_now(engine)
+        if not engine.loaded:
+            return pd.DataFrame()
+
+    get_prefetcher().start()  # 이미 돌고 있으면 그대로
+
+    if engine.is_stale(ROSTER_TTL):
+        engine.revalidate_async(_spreadsheet_opener(), WORKSHEET_STUDENTS, ROSTER_TTL)
+
+    # 백그라운드 재검증/미리 확인 실패: 연결 문제와 시트 헤더 문제를 구분해서 안내 (둘 다 마지막 명단은 계속 표시)
+    if isinstance(engine.last_error, HeaderMismatchError):
+        _show_header_mismatch(engine.last_error)
+        st.caption("시트 헤더를 고치기 전까지 마지막으로 저장된 명단을 표시합니다.")
+    elif engine.last_error is not None:
+        st.warning(f"구글 시트에 연결하지 못해 마지막으로 저장된 명단을 표시합니다: {engine.last_error}")
+
+    return engine.frame
+
+
+def refresh_data() -> bool:
+    """
+    새로고침 버튼: 명단 스냅샷만 재확인 (변경 없으면 메타데이터 1회).
+    파생 캐시(색인/보고서)는 명단 지문 기준이라 따로 비우지 않음.
+    방금(REFRESH_MIN_INTERVAL 안) 확인했으면 시트를 부르지 않고 False
+    """
+    engine = get_roster_sync()
+    return _sync_now(engine, REFRESH_MIN_INTERVAL)
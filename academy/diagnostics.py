@@ -0,0 +1,179 @@
+# academy/diagnostics.py
+# 실행(rerun) 1회 단계별 계측 (Streamlit 없이 동작, 화면 표시는 ui 진단 패널)
+#   with tracing("run_app", sink=traces.append):
+#       with span("load_data"):
+#           ...
+#       with span("tab1.markdown") as s:
+#           st.markdown(s.payload(html), unsafe_allow_html=True)
+# 계측 중이 아니면 span()은 아무것도 하지 않는 공용 객체를 돌려줌 (스레드 로컬 조회 1번)
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+import pandas as pd
+
+_local = threading.local()  # Streamlit은 세션마다 스크립트 스레드가 따로
+
+
+def _arrow_size(df: pd.DataFrame) -> int:
+    """표 -> Streamlit이 st.dataframe/st.data_editor로 보낼 때와 같은 Arrow IPC 스트림 크기"""
+    import pyarrow as pa  # 진단 중일 때만 필요 (Streamlit 의존성으로 설치되어 있음)
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError):
+        table = pa.Table.from_pandas(df.astype(str))  # 타입이 섞인 컬럼은 Streamlit도 문자열로 바꿔 보냄
+    sink = pa.BufferOutputStream()
+    with pa.RecordBatchStreamWriter(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.tell()
+
+
+def payload_size(data) -> int:
+    """클라이언트로 보내는 크기 (HTML 문자열: UTF-8 바이트, 표: 직렬화된 Arrow 바이트)"""
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, pd.DataFrame):
+        return _arrow_size(data)
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
+class Trace:
+    """
+    실행 1회의 단계 기록
+    - spans: [이름, 깊이, ms, 전송 bytes] (시작 순서, 깊이로 중첩 표시)
+    - profile_path / profile_top: 프로파일을 켠 실행만
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started_at = time.time()
+        self.spans: List[list] = []
+        self.total_ms = 0.0
+        self.profile_path: Optional[str] = None
+        self.profile_top = ""
+        self._depth = 0
+
+    def rows(self) -> List[dict]:
+        return [
+            {"단계": "  " * depth + name, "ms": round(ms, 1), "전송 bytes": nbytes or None}
+            for name, depth, ms, nbytes in self.spans
+        ]
+
+
+class _Span:
+    __slots__ = ("trace", "row", "t0")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.row = [name, trace._depth, 0.0, 0]
+
+    def __enter__(self) -> "_Span":
+        self.trace.spans.append(self.row)
+        self.trace._depth += 1
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.row[2] = (time.perf_counter() - self.t0) * 1000
+        self.trace._depth -= 1
+        return False
+
+    def payload(self, data):
+        """보낼 데이터 크기를 이 단계에 더하고 data를 그대로 돌려줌 (크기 재는 시간은 단계 시간에서 뺌)"""
+        t = time.perf_counter()
+        self.row[3] += payload_size(data)
+        self.t0 += time.perf_counter() - t
+        return data
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def payload(self, data):
+        return data
+
+
+_NULL = _NullSpan()
+
+
+def active() -> Optional[Trace]:
+    return getattr(_local, "trace", None)
+
+
+def span(name: str):
+    """현재 실행의 단계 1개 (계측 중이 아니면 _NULL)"""
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NULL
+    return _Span(trace, name)
+
+
+def _start_profiler() -> Optional[cProfile.Profile]:
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None  # 다른 프로파일러가 이미 켜져 있음 (다른 세션의 프로파일 실행 등)
+    return profiler
+
+
+def _save_profile(trace: Trace, profiler: cProfile.Profile, profile_dir: str, top: int) -> None:
+    """pstats 파일 (snakeviz / flameprof / gprof2dot로 열 수 있음) + 누적 시간 상위 목록"""
+    os.makedirs(profile_dir, exist_ok=True)
+    ms = int(trace.started_at * 1000) % 1000
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(trace.started_at))
+    path = os.path.join(profile_dir, f"rerun-{stamp}.{ms:03d}-{threading.get_ident() % 10000:04d}.prof")
+    profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).strip_dirs().sort_stats("cumulative").print_stats(top)
+    trace.profile_path = path
+    trace.profile_top = out.getvalue()
+
+
+@contextmanager
+def tracing(
+    label: str,
+    sink: Optional[Callable[[Trace], None]] = None,
+    profile: bool = False,
+    profile_dir: str = ".cache/profiles",
+    profile_top: int = 30,
+) -> Iterator[Trace]:
+    """
+    실행 1회 계측. 끝나면(예외/st.rerun 포함) sink(trace) 호출
+    - 이미 계측 중이면 새 기록 없이 현재 기록 안의 단계 1개로 (전체 실행 안에서 부른 fragment)
+    - profile=True면 이 실행 동안 cProfile도 켬
+    """
+    current = active()
+    if current is not None:
+        with span(label):
+            yield current
+        return
+
+    trace = Trace(label)
+    profiler = _start_profiler() if profile else None
+    _local.trace = trace
+    t0 = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.total_ms = (time.perf_counter() - t0) * 1000
+        _local.trace = None
+        if profiler is not None:
+            profiler.disable()
+            _save_profile(trace, profiler, profile_dir, profile_top)
+        if sink is not None:
+            sink(trace)
@@ -1,19 +1,7 @@
 # academy/filters.py
-import re
 import pandas as pd
 
-from .config import COL_DAYS, COL_PERIOD, WEEKDAY_ORDER
-
-
-def norm_series(sr: pd.Series) -> pd.Series:
-    """Series 전용 정규화: NaN -> '', NBSP/전각공백/모든 공백 제거"""
-    return (
-        sr.fillna("")
-          .astype(str)
-          .str.replace("\u00A0", "", regex=False)  # NBSP
-          .str.replace("\u3000", "", regex=False)  # 전각공백
-          .str.replace(r"\s+", "", regex=True)     # 모든 공백류
-    )
+from .schedule import schedule_index
 
 
 def filter_students_for_day_period(df: pd.DataFrame, weekday: str, period: int) -> pd.DataFrame:
@@ -23,28 +11,10 @@ def filter_students_for_day_period(df: pd.DataFrame, weekday: str, period: int)
     - COL_PERIOD:
         * 요일마커 있음: "월1,수2" → 해당 weekday+period 토큰 포함
         * 숫자만 있음: "1,2,3" / "1 2 3" / "1/2/3" 등 → period 숫자 포함
+    판정은 df별로 한 번 만든 (요일, 교시) 역색인 조회 (academy.schedule)
+    두 컬럼은 색인을 만들 때 norm_series로 정규화하므로 정규화 전 명단도 그대로 넣어도 됨
     """
     if df is None or df.empty:
         return df.copy() if df is not None else pd.DataFrame()
 
-    days = norm_series(df[COL_DAYS])
-    pstr = norm_series(df[COL_PERIOD])
-
-    # 요일 포함 여부: (^|,)월(,|$)
-    day_pat = rf"(?:^|,){re.escape(weekday)}(?:,|$)"
-    mask_day = days.str.contains(day_pat, regex=True, na=False)
-
-    # 요일 마커 포함 여부
-    marker_pat = "(?:" + "|".join(map(re.escape, WEEKDAY_ORDER)) + ")"
-    has_marker = pstr.str.contains(marker_pat, regex=True, na=False)
-
-    # 마커가 있는 경우: (^|,)월1(,|$)
-    token_pat = rf"(?:^|,){re.escape(weekday)}{int(period)}(?:,|$)"
-    mask_marker = pstr.str.contains(token_pat, regex=True, na=False)
-
-    # 숫자만 있는 경우: 1이 10/11에 매칭되면 안 됨
-    num_pat = rf"(?<!\d){int(period)}(?!\d)"
-    mask_numeric = pstr.str.contains(num_pat, regex=True, na=False)
-
-    mask = mask_day & ((has_marker & mask_marker) | ((~has_marker) & mask_numeric))
-    return df.loc[mask].copy()
\ No newline at end of file
+    return df.iloc[schedule_index(df).positions(weekday, period)].copy()
@@ -0,0 +1,68 @@
+# academy/loader.py
+# Streamlit 없이 명단을 읽는 로더 (academy.render CLI / cron 사전 렌더링용)
+#   - 로컬 파일: CSV / Parquet (시트와 같은 헤더)
+#   - 시트: 구글 시트 (서비스 계정) 또는 LocalSheetsClient 디렉터리
+# 정규화/파생 컬럼은 앱과 같은 경로(RosterSync.apply)를 그대로 탐
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import gspread
+import pandas as pd
+from google.oauth2.service_account import Credentials
+
+from .config import SCOPE, SHEETS_READ_QUOTA_PER_MIN, WORKSHEET_STUDENTS, FETCH_MODE
+from .sheets import SheetsClientManager
+from .local_sheets import LocalSheetsClient
+from .sync import RosterSync
+
+
+def make_sheets_manager(local_dir: Optional[str] = None, creds_info: Optional[dict] = None) -> SheetsClientManager:
+    """
+    시트 클라이언트 관리자
+    - local_dir가 있으면 로컬 CSV 백엔드
+    - 아니면 서비스 계정 정보(creds_info)로 구글 시트 인증
+    """
+    if local_dir:
+        return SheetsClientManager(lambda: LocalSheetsClient(local_dir))
+    if not creds_info:
+        raise ValueError("서비스 계정 정보(SERVICE_ACCOUNT_INFO)가 없습니다.")
+
+    def _authorize():
+        creds = Credentials.from_service_account_info(creds_info, scopes=SCOPE)
+        return gspread.authorize(creds)
+
+    return SheetsClientManager(_authorize, read_quota_per_min=SHEETS_READ_QUOTA_PER_MIN)
+
+
+def read_roster_file(path: str) -> Tuple[List[str], List[Sequence]]:
+    """CSV/Parquet -> (헤더, 컬럼별 값). 모든 값은 시트처럼 문자열로 읽음"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".parquet", ".pq"):
+        raw = pd.read_parquet(path)
+        raw = raw.astype(object).where(raw.notna(), "")
+    elif ext in (".csv", ".txt"):
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    else:
+        raise ValueError(f"지원하지 않는 명단 파일 형식입니다: {path} (CSV/Parquet)")
+    return [str(c) for c in raw.columns], [raw[c].tolist() for c in raw.columns]
+
+
+def load_roster_file(path: str) -> pd.DataFrame:
+    """로컬 명단 파일 -> 화면용 명단 (앱과 같은 정규화/파생 컬럼)"""
+    return RosterSync().apply(*read_roster_file(path))
+
+
+def load_roster_sheet(
+    manager: SheetsClientManager,
+    key: Optional[str] = None,
+    name: Optional[str] = None,
+    worksheet_title: str = WORKSHEET_STUDENTS,
+    snapshot_path: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    시트 -> 화면용 명단.
+    snapshot_path를 주면 앱과 같은 스냅샷을 이어 씀 (수정시각이 같으면 시트를 다시 받지 않음)
+    """
+    engine = RosterSync(snapshot_path=snapshot_path, fetch_mode=FETCH_MODE)
+    engine.restore()
+    return engine.sync(manager.spreadsheet(key=key, name=name), worksheet_title)
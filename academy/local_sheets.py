@@ -0,0 +1,82 @@
+# academy/local_sheets.py
+# 로컬 CSV 기반 가짜 구글 시트 백엔드 (개발/오프라인 점검용)
+#   <root>/<스프레드시트 이름>/<워크시트 이름>.csv
+# SheetsClientManager의 client_factory로 넘기면 실제 시트 대신 로컬 파일을 읽음.
+# 수정시각은 워크시트 CSV들의 최신 mtime.
+import csv
+import glob
+import os
+from datetime import datetime, timezone
+from typing import List
+
+from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import numericise_all, a1_to_rowcol
+
+
+class LocalWorksheet:
+    def __init__(self, path: str):
+        self.path = path
+        self.title = os.path.splitext(os.path.basename(path))[0]
+
+    def get_all_values(self) -> List[List[str]]:
+        with open(self.path, newline="", encoding="utf-8-sig") as f:
+            return [row for row in csv.reader(f)]
+
+    def row_values(self, row: int) -> List[str]:
+        values = self.get_all_values()
+        return values[row - 1] if len(values) >= row else []
+
+    def batch_get(self, ranges, major_dimension: str = "ROWS") -> List[List[List[str]]]:
+        """'C1:C' 같은 단일 열 범위만 지원 (COLUMNS 기준 반환)"""
+        values = self.get_all_values()
+        out = []
+        for rng in ranges:
+            row, col = a1_to_rowcol(rng.split(":")[0])
+            cells = [r[col - 1] if len(r) >= col else "" for r in values[row - 1:]]
+            while cells and cells[-1] == "":
+                cells.pop()
+            out.append([cells] if cells else [])
+        return out
+
+    def get_all_records(self) -> List[dict]:
+        values = self.get_all_values()
+        if len(values) < 2:
+            return []
+        header, rows = values[0], values[1:]
+        width = len(header)
+        return [
+            dict(zip(header, numericise_all((r + [""] * width)[:width])))
+            for r in rows
+        ]
+
+
+class LocalSpreadsheet:
+    def __init__(self, path: str):
+        self.path = path
+        self.id = os.path.basename(path)
+        self.title = self.id
+
+    def get_lastUpdateTime(self) -> str:
+        files = glob.glob(os.path.join(self.path, "*.csv"))
+        mtime = max((os.path.getmtime(p) for p in files), default=0.0)
+        return datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+
+    def worksheet(self, title: str) -> LocalWorksheet:
+        path = os.path.join(self.path, f"{title}.csv")
+        if not os.path.exists(path):
+            raise WorksheetNotFound(title)
+        return LocalWorksheet(path)
+
+
+class LocalSheetsClient:
+    def __init__(self, root: str):
+        self.root = root
+
+    def open_by_key(self, key: str) -> LocalSpreadsheet:
+        path = os.path.join(self.root, key)
+        if not os.path.isdir(path):
+            raise SpreadsheetNotFound(key)
+        return LocalSpreadsheet(path)
+
+    def open(self, title: str) -> LocalSpreadsheet:
+        return self.open_by_key(title)
@@ -0,0 +1,35 @@
+# academy/markup.py
+from html import escape
+from typing import Iterable, List, Sequence
+
+import pandas as pd
+
+
+def esc(v) -> str:
+    """셀 값 -> HTML 텍스트 (&, <, > 이스케이프. 일반 이름/학교명은 그대로)"""
+    return escape(str(v), quote=False)
+
+
+def column_lists(df: pd.DataFrame, cols: Sequence[str]) -> List[list]:
+    """행마다 Series를 만들지 않도록 컬럼을 파이썬 리스트로 한 번에 꺼냄"""
+    return [df[c].tolist() for c in cols]
+
+
+class HtmlBuffer:
+    """
+    HTML 조각 버퍼: 문자열 += 반복 대신 조각을 모아 마지막에 한 번만 join
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def add(self, *parts: str) -> "HtmlBuffer":
+        self._parts.extend(parts)
+        return self
+
+    def extend(self, parts: Iterable[str]) -> "HtmlBuffer":
+        self._parts.extend(parts)
+        return self
+
+    def render(self) -> str:
+        return "".join(self._parts)
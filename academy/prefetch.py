@@ -0,0 +1,90 @@
+# academy/prefetch.py
+import threading
+import time
+from typing import Callable, Optional
+
+import pandas as pd
+
+from .sync import RosterSync
+
+
+class RosterPrefetcher:
+    """
+    프로세스 공용 백그라운드 갱신 스레드
+    - 명단이 만료(ttl)되기 lead초 전에 미리 시트를 확인 (RosterSync.refresh: 다른 확인과 합쳐짐)
+    - 확인할 때마다 warm(frame) 호출: 이미 만든 보고서는 건너뛰고, 달이 바뀌어 제목이 달라진 보고서만 새로 만듦
+      (색인은 RosterSync가 발행 전에 이미 만들어 두므로 세션은 완성된 명단만 봄)
+    - 실패하면 retry_delay 뒤 다시 시도, 그동안 세션은 마지막 스냅샷을 사용
+    """
+
+    def __init__(
+        self,
+        engine: RosterSync,
+        open_sheet: Callable[[], object],
+        worksheet_title: str,
+        ttl: float,
+        lead: float = 30.0,
+        retry_delay: float = 60.0,
+        warm: Optional[Callable[[pd.DataFrame], None]] = None,
+    ):
+        self.engine = engine
+        self.open_sheet = open_sheet
+        self.worksheet_title = worksheet_title
+        self.ttl = ttl
+        self.lead = min(lead, ttl)
+        self.retry_delay = retry_delay
+        self.warm = warm
+        self.last_error: Optional[Exception] = None
+        self.runs = 0
+        self._retry_at = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "RosterPrefetcher":
+        if not self.alive:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="roster-prefetch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def next_due(self) -> float:
+        """다음 확인 시각 (monotonic)"""
+        due = self.engine.synced_at + self.ttl - self.lead
+        return max(due, self._retry_at)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            wait = self.next_due() - time.monotonic()
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+            self.tick()
+
+    def tick(self) -> None:
+        """확인 1회 + 새 명단이면 보고서 준비"""
+        self.runs += 1
+        try:
+            self.engine.refresh(self.open_sheet, self.worksheet_title, self.ttl - self.lead)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+            self.engine.last_error = e
+            self._retry_at = time.monotonic() + self.retry_delay
+            return
+        self._warm(self.engine.frame)
+
+    def _warm(self, frame: pd.DataFrame) -> None:
+        if self.warm is None or frame.empty:
+            return
+        try:
+            self.warm(frame)
+        except Exception as e:
+            # 미리 만들기 실패는 세션이 직접 렌더링하면 되므로 기록만
+            self.last_error = e
@@ -0,0 +1,196 @@
+# academy/render.py
+# Streamlit 없이 보고서를 HTML 파일로 만드는 CLI (cron 사전 렌더링 / 일괄 출력용)
+#
+#   python -m academy.render --roster students.csv table1 table2 table4
+#   python -m academy.render --sheets-dir ./local_sheets --spreadsheet "학생명단" packet --from 2026-10-01 --to 2026-10-31
+#   python -m academy.render --credentials sa.json --spreadsheet-key <ID> table3 --date 2026-10-14
+import argparse
+import datetime
+import json
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import WORKSHEET_STUDENTS, SNAPSHOT_PATH, ASSIGNMENTS_PATH
+from .loader import make_sheets_manager, load_roster_file, load_roster_sheet
+from .sync import HeaderMismatchError
+from .tables import generate_total_list_html, generate_table1, generate_table2, generate_table3, generate_table4
+from .assignments import AssignmentStore
+from .batch import attendance_packet, batch_executor, date_range, month_bounds
+from .styles import get_print_css
+from .markup import esc
+from .utils import now_kst, today_kst
+
+REPORTS = ["total", "table1", "table2", "table3", "table4", "packet"]
+DEFAULT_REPORTS = ["table1", "table2", "table4"]
+
+
+def html_document(body: str, title: str, orientation: str = "세로") -> str:
+    """보고서 조각 -> 인쇄용 독립 HTML 문서 (앱과 같은 인쇄 CSS)"""
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<title>{esc(title)}</title>{get_print_css(orientation)}"
+        # 파일로 열었을 때는 인쇄 전용 영역도 화면에 보이게
+        "<style>.tab0-print-root { display: block !important; }</style>"
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def _boxed(html: str) -> str:
+    return f"<div class='a4-print-box'><div class='report-view'>{html}</div></div>"
+
+
+def _total_list(df: pd.DataFrame) -> str:
+    return (
+        "<div class='tab0-print-root'><div class='tab0-print-header'>"
+        f"<h2 class='tab0-print-title'>등록 학생 목록 <span class='tab0-print-count'>[총 {len(df)}명]</span></h2>"
+        "</div>"
+        f"{generate_total_list_html(df)}</div>"
+    )
+
+
+def load_roster(args: argparse.Namespace) -> pd.DataFrame:
+    """--roster 파일 또는 시트(--sheets-dir / --credentials)에서 명단 읽기"""
+    if args.roster:
+        return load_roster_file(args.roster)
+
+    if args.sheets_dir:
+        manager = make_sheets_manager(local_dir=args.sheets_dir)
+    else:
+        if not args.credentials:
+            raise SystemExit("명단 소스를 지정하세요: --roster, --sheets-dir 또는 --credentials")
+        with open(args.credentials, encoding="utf-8") as f:
+            manager = make_sheets_manager(creds_info=json.load(f))
+    if not (args.spreadsheet_key or args.spreadsheet):
+        raise SystemExit("--spreadsheet 또는 --spreadsheet-key를 지정하세요")
+
+    return load_roster_sheet(
+        manager,
+        key=args.spreadsheet_key,
+        name=args.spreadsheet,
+        worksheet_title=args.worksheet,
+        snapshot_path=args.snapshot or None,
+    )
+
+
+def _assignment_store(path: Optional[str]) -> AssignmentStore:
+    """앱이 쓰는 배정 저장소를 그대로 읽음 (없으면 빈 메모리 저장소)"""
+    if path and os.path.exists(path):
+        return AssignmentStore(path=path)
+    return AssignmentStore()
+
+
+def render_reports(df: pd.DataFrame, args: argparse.Namespace) -> List[Tuple[str, str]]:
+    """요청한 보고서들 -> [(파일 이름, HTML 문서)]"""
+    now = now_kst()
+    month_dot = args.month or now.strftime("%Y.%m")
+    month_dash = args.month or now.strftime("%Y-%m")
+    date = args.date or today_kst()
+
+    builders: Dict[str, Callable[[], Tuple[str, str]]] = {
+        "total": lambda: ("total", _total_list(df)),
+        "table1": lambda: ("table1", _boxed(generate_table1(df, not args.no_school, not args.no_count, month_dot))),
+        "table2": lambda: ("table2", _boxed(generate_table2(df, month_dash))),
+        "table4": lambda: ("table4", _boxed(generate_table4(df, not args.no_grade, month_dot))),
+    }
+
+    out = []
+    store = None
+    for name in dict.fromkeys(args.reports or DEFAULT_REPORTS):
+        if name in builders:
+            stem, body = builders[name]()
+        else:
+            if store is None:
+                store = _assignment_store(args.assignments)
+            if name == "table3":
+                stem = f"table3_{date.isoformat()}"
+                body = _boxed(generate_table3(df, date, args.include_paused, store.day_table(date.isoformat())))
+            else:  # packet
+                start = args.date_from or month_bounds(date)[0]
+                dates = date_range(start, args.date_to or month_bounds(start)[1])
+                stem = f"table3_{dates[0].isoformat()}_{dates[-1].isoformat()}"
+                executor = batch_executor(args.workers)
+                try:
+                    body = attendance_packet(df, dates, args.include_paused, store.day_table, executor=executor)
+                finally:
+                    if executor is not None:
+                        executor.shutdown()
+        out.append((f"{stem}.html", html_document(body, stem, args.orientation)))
+
+    if store is not None:
+        store.close()
+    return out
+
+
+def _date(s: str) -> datetime.date:
+    return datetime.date.fromisoformat(s)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="python -m academy.render",
+        description="학생 명단 보고서를 HTML 파일로 만듭니다 (Streamlit 없이).",
+    )
+    p.add_argument("reports", nargs="*", metavar="REPORT",
+                   help=f"만들 보고서 {REPORTS} (기본: {' '.join(DEFAULT_REPORTS)})")
+
+    src = p.add_argument_group("명단 소스")
+    src.add_argument("--roster", help="로컬 명단 파일 (CSV/Parquet, 시트와 같은 헤더)")
+    src.add_argument("--sheets-dir", help="로컬 CSV 시트 디렉터리 (LocalSheetsClient)")
+    src.add_argument("--credentials", help="서비스 계정 JSON 파일 (구글 시트)")
+    src.add_argument("--spreadsheet", help="스프레드시트 이름")
+    src.add_argument("--spreadsheet-key", help="스프레드시트 ID (이름 검색 생략)")
+    src.add_argument("--worksheet", default=WORKSHEET_STUDENTS, help=f"워크시트 이름 (기본: {WORKSHEET_STUDENTS})")
+    src.add_argument("--snapshot", default=SNAPSHOT_PATH,
+                     help="명단 스냅샷 경로 (앱과 공유하면 시트가 그대로일 때 다시 받지 않음, 빈 값 = 사용 안 함)")
+
+    opt = p.add_argument_group("보고서 옵션")
+    opt.add_argument("--out", default="reports", help="출력 디렉터리 (기본: reports)")
+    opt.add_argument("--month", help="제목의 연/월 표기 (기본: 이번 달)")
+    opt.add_argument("--date", type=_date, help="출석부 날짜 YYYY-MM-DD (기본: 오늘, KST)")
+    opt.add_argument("--from", dest="date_from", type=_date, help="기간 출석부 시작일 (기본: --date가 속한 달 1일)")
+    opt.add_argument("--to", dest="date_to", type=_date, help="기간 출석부 종료일 (기본: 시작일이 속한 달 말일)")
+    opt.add_argument("--assignments", default=ASSIGNMENTS_PATH, help="출석부 배정 저장소 (SQLite)")
+    opt.add_argument("--include-paused", action="store_true", help="출석부에 휴원생 포함")
+    opt.add_argument("--no-school", action="store_true", help="학년별 명단: 학교 표시 안 함")
+    opt.add_argument("--no-count", action="store_true", help="학년별 명단: 인원수 표시 안 함")
+    opt.add_argument("--no-grade", action="store_true", help="학교별 명단: 학년 표시 안 함")
+    opt.add_argument("--orientation", choices=["세로", "가로"], default="세로", help="용지 방향")
+    opt.add_argument("--workers", type=int, default=1,
+                     help="기간 출석부 프로세스 수 (기본 1 = 현재 프로세스, 2 이상이면 프로세스 풀)")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    unknown = [r for r in args.reports if r not in REPORTS]
+    if unknown:
+        parser.error(f"알 수 없는 보고서: {unknown} (가능: {REPORTS})")
+
+    try:
+        df = load_roster(args)
+    except HeaderMismatchError as e:
+        print(f"시트 헤더가 일치하지 않습니다. 누락된 항목: {e.missing}", file=sys.stderr)
+        return 2
+    except Exception as e:
+        print(f"명단을 읽지 못했습니다: {e}", file=sys.stderr)
+        return 1
+
+    if df.empty:
+        print("명단이 비어 있습니다.", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    for filename, html in render_reports(df, args):
+        path = os.path.join(args.out, filename)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# academy/render_cache.py
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# DataFrame 객체별 지문 (객체가 사라지면 같이 정리). schedule._INDEX_CACHE와 같은 방식
+_FINGERPRINTS: Dict[int, Tuple[weakref.ref, str]] = {}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _columns_bytes(columns) -> bytes:
+    return "\x1f".join(map(str, columns)).encode()
+
+
+def sigs_fingerprint(sigs: pd.Series, columns) -> str:
+    """컬럼명 + 행 키 + 행 원본 해시(sync.row_signatures)로 만든 명단 지문 (행 순서 포함)"""
+    h = pd.util.hash_pandas_object(sigs, index=True).to_numpy()
+    return _digest(h.tobytes() + _columns_bytes(columns))
+
+
+def register_fingerprint(df: pd.DataFrame, fingerprint: str) -> None:
+    """발행된 스냅샷 frame에 지문을 붙여 둠 (이후 frame_fingerprint는 O(1))"""
+    key = id(df)
+    _FINGERPRINTS[key] = (weakref.ref(df, lambda _, k=key: _FINGERPRINTS.pop(k, None)), fingerprint)
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    df 내용 지문.
+    등록된 스냅샷이면 그대로, 아니면 한 번 해시해서 같은 객체 동안 재사용
+    (df.attrs는 필터링 결과로 전파되므로 쓰지 않음)
+    """
+    hit = _FINGERPRINTS.get(id(df))
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+
+    h = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    fp = _digest(h.tobytes() + _columns_bytes(df.columns))
+    register_fingerprint(df, fp)
+    return fp
+
+
+class _Pending:
+    """렌더링 중인 항목 1개 (같은 키를 요청한 세션들이 결과를 같이 기다림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.html: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+ReportJob = Tuple[Callable[..., str], tuple]  # (생성 함수, 파라미터)
+
+
+class RenderCache:
+    """
+    보고서 HTML 캐시 (프로세스 공용, LRU)
+    - 키: (생성 함수, 명단 지문, 파라미터) → DataFrame을 매번 해시/피클하지 않음
+    - 명단이 바뀌면 지문이 달라지므로 옛 항목은 다시 쓰이지 않고 LRU로 밀려남
+    - 같은 키를 여러 세션이 동시에 요청하면 렌더링은 1번 (나머지는 기다렸다가 같은 결과)
+    - materialize(): 최신 명단 1개에 대한 기본 보고서를 미리 만들어 고정 (LRU로 밀려나지 않음)
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._pinned: Dict[Hashable, str] = {}
+        self._pinned_fp: Optional[str] = None
+        self._target_fp: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(fn: Callable[..., str], fingerprint: Hashable, args: tuple) -> Hashable:
+        return (fn.__module__, fn.__qualname__, fingerprint, args)
+
+    def render(
+        self,
+        fn: Callable[..., str],
+        df: pd.DataFrame,
+        *args,
+        fingerprint: Optional[Hashable] = None,
+    ) -> str:
+        """
+        fn(df, *args) 결과를 캐시해서 반환.
+        fingerprint: df가 스냅샷에서 파생된 임시 객체일 때 (스냅샷 지문, 조건) 등을 직접 지정
+        """
+        if fingerprint is None:
+            fingerprint = frame_fingerprint(df)
+        key = self._key(fn, fingerprint, args)
+
+        with self._lock:
+            html = self._pinned.get(key)
+            if html is None:
+                html = self._items.get(key)
+                if html is not None:
+                    self._items.move_to_end(key)
+            if html is not None:
+                self.hits += 1
+                return html
+
+            pending = self._pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = self._pending[key] = _Pending()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.html
+
+        try:
+            html = pending.html = fn(df, *args)
+        except BaseException as e:
+            pending.error = e
+            raise
+        else:
+            with self._lock:
+                self._items[key] = html
+                self._items.move_to_end(key)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.done.set()
+        return html
+
+    def materialize(self, df: pd.DataFrame, jobs: Sequence[ReportJob]) -> int:
+        """
+        명단 스냅샷 1개에 대해 jobs를 미리 렌더링해서 고정.
+        더 새 명단의 materialize가 시작됐으면 결과를 고정하지 않음 (옛 명단이 덮어쓰지 않도록)
+        반환: 새로 렌더링한 보고서 수
+        """
+        fp = frame_fingerprint(df)
+        with self._lock:
+            self._target_fp = fp
+
+        rendered = 0
+        results: Dict[Hashable, str] = {}
+        for fn, args in jobs:
+            key = self._key(fn, fp, tuple(args))
+            with self._lock:
+                known = key in self._pinned or key in self._items
+            results[key] = self.render(fn, df, *args)
+            rendered += 0 if known else 1
+
+        with self._lock:
+            if self._target_fp != fp:
+                return rendered
+            if self._pinned_fp != fp:
+                self._pinned = {}
+                self._pinned_fp = fp
+            self._pinned.update(results)
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._pinned = {}
+            self._pinned_fp = None
+
+    def __len__(self) -> int:
+        return len(self._items) + len(self._pinned)
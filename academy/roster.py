@@ -0,0 +1,80 @@
+# academy/roster.py
+import pandas as pd
+
+from .config import (
+    COL_ID, COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS,
+    COL_KEY, COL_SCHOOL_GRADE, COL_GRADE_ORDER, COL_DAYS_COUNT,
+    GRADE_ORDER
+)
+from .utils import norm_series, strip_series
+
+# 공백을 전부 제거해도 되는 코드성 컬럼
+NORM_COLUMNS = [COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]
+# 안쪽 띄어쓰기는 살려야 하는 표시용 컬럼
+STRIP_COLUMNS = [COL_ID, COL_NAME, COL_SCHOOL]
+# 값 종류가 적은 컬럼은 categorical로 보관 (메모리 절약)
+CATEGORY_COLUMNS = [COL_SCHOOL, COL_GRADE, COL_STATUS, COL_DAYS]
+
+GRADE_RANK = {g: i for i, g in enumerate(GRADE_ORDER)}
+UNKNOWN_GRADE_RANK = 999
+
+
+def normalize_roster(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    로드 시점 1회 정규화 (벡터화). 이후 모듈은 strip/NBSP 정리를 다시 하지 않음
+    - 학년/등원요일/수업교시/상태: 모든 공백 제거
+    - 학생ID/이름/학교: 특수공백 제거 + 양끝 공백 제거
+    """
+    for c in NORM_COLUMNS:
+        if c in df.columns:
+            df[c] = norm_series(df[c])
+    for c in STRIP_COLUMNS:
+        if c in df.columns:
+            df[c] = strip_series(df[c])
+    return df
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """정규화된 명단 -> 배포용 compact 스키마 (categorical)"""
+    for c in CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+
+
+def grade_rank(sr: pd.Series) -> pd.Series:
+    """학년 -> GRADE_ORDER 순번 (목록에 없으면 999)"""
+    return sr.astype(str).map(GRADE_RANK).fillna(UNKNOWN_GRADE_RANK)
+
+
+def student_keys(df: pd.DataFrame) -> pd.Series:
+    """utils.get_student_key의 벡터화 버전: 학생ID 우선, 없으면 (이름|학교|학년)"""
+    sid = df[COL_ID].astype(str)
+    has_id = (sid != "") & (sid.str.lower() != "nan")
+    ng = (
+        "ng:" + df[COL_NAME].astype(str)
+        + "|" + df[COL_SCHOOL].astype(str)
+        + "|" + df[COL_GRADE].astype(str)
+    )
+    return ("id:" + sid).where(has_id, ng)
+
+
+def school_grade_labels(df: pd.DataFrame) -> pd.Series:
+    """utils.school_grade_label의 벡터화 버전"""
+    s = df[COL_SCHOOL].astype(str)
+    g = df[COL_GRADE].astype(str)
+    same = (s != "") & (g != "") & (s.str[-1] == g.str[0])
+    return s + g.where(~same, g.str[1:])
+
+
+def enrich_roster(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    스냅샷마다 1회: 렌더링이 행마다 다시 계산하던 값을 컬럼으로 붙임
+    - COL_KEY / COL_SCHOOL_GRADE / COL_GRADE_ORDER / COL_DAYS_COUNT
+    """
+    df[COL_KEY] = student_keys(df)
+    df[COL_SCHOOL_GRADE] = school_grade_labels(df).astype("category")
+    df[COL_GRADE_ORDER] = grade_rank(df[COL_GRADE]).astype("int16")
+    # '월,수' -> 2 (빈 토큰 제외, split_days와 동일)
+    df[COL_DAYS_COUNT] = df[COL_DAYS].astype(str).str.count(r"[^,]+").astype("int8")
+    return df
@@ -0,0 +1,148 @@
+# academy/schedule.py
+import weakref
+from typing import Callable, Dict, List, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import COL_DAYS, COL_PERIOD, WEEKDAY_ORDER
+from .utils import RE_DIGITS, norm_series
+
+Slot = Tuple[str, int]
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def _is_canonical_int(s: str) -> bool:
+    """int(s)를 다시 문자열로 만들었을 때 그대로인지 ('01' / '-0' 제외)"""
+    try:
+        return str(int(s)) == s
+    except ValueError:
+        return False
+
+
+def parse_slots(days_str: str, periods_str: str) -> Set[Slot]:
+    """
+    한 학생의 (요일, 교시) 슬롯 집합.
+    filters.filter_students_for_day_period의 정규식 판정과 동일한 규칙:
+    - 요일: 등원요일을 콤마로 나눈 토큰에 정확히 있어야 함
+    - 수업교시에 요일 글자가 하나라도 있으면(마커형) 콤마 토큰이 '요일+교시'와 정확히 같아야 함
+    - 없으면(숫자형) 앞뒤가 숫자가 아닌 숫자열이 교시와 같아야 함 (1이 10/11에 매칭되지 않음)
+    """
+    # 정규식 (?:^|,)요일(?:,|$)과 맞추기 위해 빈 토큰도 그대로 둠
+    day_set = set(days_str.split(","))
+
+    out: Set[Slot] = set()
+    if any(d in periods_str for d in WEEKDAY_ORDER):
+        for tok in periods_str.split(","):
+            # 'ab12' -> ('ab', 12) / ('ab1', 2) 처럼 가능한 모든 (접두어, 정수) 분할
+            for i in range(len(tok)):
+                num = tok[i:]
+                if tok[:i] in day_set and _is_canonical_int(num):
+                    out.add((tok[:i], int(num)))
+        return out
+
+    nums: List[int] = []
+    for m in RE_DIGITS.finditer(periods_str):
+        run = m.group()
+        if _is_canonical_int(run):
+            nums.append(int(run))
+        # 음수 교시: '-'앞이 숫자가 아니면 '-N'도 독립 토큰
+        start = m.start()
+        if start >= 1 and periods_str[start - 1] == "-" and (start < 2 or not periods_str[start - 2].isdigit()):
+            if _is_canonical_int("-" + run):
+                nums.append(-int(run))
+    return {(d, n) for d in day_set for n in nums}
+
+
+def _normalized_codes(sr: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """컬럼 -> (행별 코드, 정규화된 고유값). norm_series는 고유값에만 적용 (NaN -> '')"""
+    codes, uniques = pd.factorize(sr.to_numpy(dtype=object), use_na_sentinel=False)
+    normed = norm_series(pd.Series(uniques, dtype=object))
+    norm_codes, norm_uniques = pd.factorize(normed.to_numpy(dtype=object))
+    return norm_codes[codes], np.asarray(norm_uniques, dtype=object)
+
+
+class ScheduleIndex:
+    """
+    명단 스냅샷 1개에 대한 (요일, 교시) -> 행 위치 역색인.
+    같은 (등원요일, 수업교시) 문자열 조합은 한 번만 파싱하므로 만드는 비용은 O(행 수 + 조합 수),
+    조회는 O(해당 학생 수).
+    """
+
+    def __init__(self, n_rows: int, slots: Dict[Slot, np.ndarray], days: Dict[str, np.ndarray]):
+        self.n_rows = n_rows
+        self._slots = slots
+        self._days = days
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        parse: Callable[[str, str], Set[Slot]] = parse_slots,
+    ) -> "ScheduleIndex":
+        """
+        parse: (등원요일, 수업교시) -> 슬롯 집합
+        - parse_slots: filter_students_for_day_period 규칙 (기본)
+        - utils.attendance_slots: match_attendance 규칙 (테이블2)
+        두 컬럼은 예전 정규식 판정처럼 norm_series로 정규화한 값으로 판정
+        (정규화되지 않은 frame이 들어와도 같은 결과, 이미 정규화된 명단이면 값이 그대로)
+        """
+        if df is None or df.empty:
+            return cls(0, {}, {})
+
+        day_codes, day_values = _normalized_codes(df[COL_DAYS])
+        period_codes, period_values = _normalized_codes(df[COL_PERIOD])
+
+        combos = day_codes.astype(np.int64) * len(period_values) + period_codes
+        codes, uniques = pd.factorize(combos)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+
+        slot_parts: Dict[Slot, List[np.ndarray]] = {}
+        day_parts: Dict[str, List[np.ndarray]] = {}
+        for k, combo in enumerate(uniques.tolist()):
+            d_str = day_values[combo // len(period_values)]
+            p_str = period_values[combo % len(period_values)]
+            rows = order[bounds[k]:bounds[k + 1]]
+            for d in {x for x in d_str.split(",") if x}:
+                day_parts.setdefault(d, []).append(rows)
+            for slot in parse(d_str, p_str):
+                slot_parts.setdefault(slot, []).append(rows)
+
+        def _merge(parts: List[np.ndarray]) -> np.ndarray:
+            # 원래 행 순서 유지
+            return np.sort(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+
+        return cls(
+            len(df),
+            {s: _merge(p) for s, p in slot_parts.items()},
+            {d: _merge(p) for d, p in day_parts.items()},
+        )
+
+    def positions(self, weekday: str, period: int) -> np.ndarray:
+        """해당 요일/교시 학생의 행 위치 (오름차순)"""
+        return self._slots.get((weekday, int(period)), _EMPTY)
+
+    def day_positions(self, weekday: str) -> np.ndarray:
+        """해당 요일 등원 학생의 행 위치 (오름차순)"""
+        return self._days.get(weekday, _EMPTY)
+
+
+# DataFrame 객체별 색인 캐시 (객체가 사라지면 같이 정리)
+_INDEX_CACHE: Dict[int, Tuple[weakref.ref, ScheduleIndex]] = {}
+
+
+def schedule_index(df: pd.DataFrame) -> ScheduleIndex:
+    """
+    df에 대한 ScheduleIndex (같은 객체면 재사용).
+    스냅샷 frame은 발행 후 수정하지 않는다는 전제 (sync.RosterSync가 발행 시점에 미리 만들어 둠)
+    """
+    key = id(df)
+    hit = _INDEX_CACHE.get(key)
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+
+    idx = ScheduleIndex.build(df)
+    _INDEX_CACHE[key] = (weakref.ref(df, lambda _, k=key: _INDEX_CACHE.pop(k, None)), idx)
+    return idx
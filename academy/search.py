@@ -0,0 +1,153 @@
+# academy/search.py
+import weakref
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS
+
+# 탭 0 검색 대상 (화면에 보이는 컬럼)
+SEARCH_COLUMNS = [COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]
+# 초성 검색 대상
+CHOSUNG_COLUMNS = [COL_NAME, COL_SCHOOL]
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = set(CHOSUNG)
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def to_chosung(text: str) -> str:
+    """'김민수' -> 'ㄱㅁㅅ' (한글 음절만 초성으로, 나머지 글자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSUNG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(q: str) -> bool:
+    return bool(q) and all(ch in _CHOSUNG_SET for ch in q)
+
+
+def _grams(text: str) -> set:
+    """1글자 + 2글자 조각"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class _ColumnIndex:
+    """
+    컬럼 1개: 고유값 단위 n-gram 색인 + 행별 고유값 코드
+    같은 값(학교/학년/요일...)은 한 번만 색인하므로 만드는 비용은 O(행 수 + 고유값 글자 수)
+    """
+
+    def __init__(self, values: Sequence[str]):
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        self.values: List[str] = list(uniques)
+        self._codes = codes
+
+        grams: Dict[str, List[int]] = {}
+        for code, v in enumerate(self.values):
+            for g in _grams(v):
+                grams.setdefault(g, []).append(code)
+        self._grams = {g: np.asarray(c, dtype=np.intp) for g, c in grams.items()}
+        self._lookup = {v: code for code, v in enumerate(self.values)}
+
+    def match_codes(self, q: str) -> np.ndarray:
+        """q를 포함하는 고유값 코드"""
+        if len(q) <= 2:
+            return self._grams.get(q, _EMPTY)
+
+        # 2글자 조각 목록이 모두 있는 값만 후보 -> 실제 포함 여부 확인
+        lists = []
+        for i in range(len(q) - 1):
+            hit = self._grams.get(q[i:i + 2])
+            if hit is None:
+                return _EMPTY
+            lists.append(hit)
+        lists.sort(key=len)
+        cand = lists[0]
+        for other in lists[1:]:
+            cand = np.intersect1d(cand, other, assume_unique=True)
+            if not len(cand):
+                return _EMPTY
+        return np.asarray([c for c in cand.tolist() if q in self.values[c]], dtype=np.intp)
+
+    def mark_rows(self, codes: np.ndarray, mask: np.ndarray) -> None:
+        """codes에 해당하는 행을 mask에 표시 (행 수만큼 벡터 연산 1번)"""
+        if len(codes):
+            hit = np.zeros(len(self.values), dtype=bool)
+            hit[codes] = True
+            mask |= hit[self._codes]
+
+    def exact_rows(self, q: str) -> np.ndarray:
+        code = self._lookup.get(q)
+        return _EMPTY if code is None else np.flatnonzero(self._codes == code)
+
+
+class SearchIndex:
+    """
+    명단 스냅샷 1개에 대한 탭 0 검색 색인
+    - 대소문자 무시 부분 문자열 검색 (화면 6개 컬럼 중 하나라도 포함하면 일치)
+    - 초성만 입력하면(ㄱㅁㅅ) 이름/학교 초성으로 검색
+    - 이름이 정확히 같은 학생을 맨 앞에, 나머지는 명단 순서
+    """
+
+    def __init__(self, n_rows: int, columns: Dict[str, _ColumnIndex], chosung: Dict[str, _ColumnIndex]):
+        self.n_rows = n_rows
+        self._columns = columns
+        self._chosung = chosung
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "SearchIndex":
+        if df is None or df.empty:
+            return cls(0, {}, {})
+
+        columns, chosung = {}, {}
+        for c in SEARCH_COLUMNS:
+            if c not in df.columns:
+                continue
+            lowered = df[c].astype(str).str.lower().to_numpy(dtype=object)
+            columns[c] = _ColumnIndex(lowered)
+            if c in CHOSUNG_COLUMNS:
+                chosung[c] = _ColumnIndex([to_chosung(v) for v in lowered])
+        return cls(len(df), columns, chosung)
+
+    def search(self, q: str) -> np.ndarray:
+        """검색어 -> 행 위치 (빈 검색어면 전체)"""
+        q = (q or "").strip().lower()
+        if not q:
+            return np.arange(self.n_rows)
+
+        target = self._chosung if is_chosung_query(q) else self._columns
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for col in target.values():
+            col.mark_rows(col.match_codes(q), mask)
+
+        name_col = self._columns.get(COL_NAME)
+        exact = name_col.exact_rows(q) if name_col is not None else _EMPTY
+        if not len(exact):
+            return np.flatnonzero(mask)
+        mask[exact] = False
+        return np.concatenate([exact, np.flatnonzero(mask)])
+
+
+# DataFrame 객체별 색인 캐시 (schedule._INDEX_CACHE와 같은 방식)
+_INDEX_CACHE: Dict[int, Tuple[weakref.ref, SearchIndex]] = {}
+
+
+def search_index(df: pd.DataFrame) -> SearchIndex:
+    """df에 대한 SearchIndex (같은 객체면 재사용. 스냅샷 발행 시점에 미리 생성)"""
+    key = id(df)
+    hit = _INDEX_CACHE.get(key)
+    if hit is not None and hit[0]() is df:
+        return hit[1]
+
+    idx = SearchIndex.build(df)
+    _INDEX_CACHE[key] = (weakref.ref(df, lambda _, k=key: _INDEX_CACHE.pop(k, None)), idx)
+    return idx
@@ -0,0 +1,234 @@
+# academy/sheets.py
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _status_of(e: Exception) -> Optional[int]:
+    if isinstance(e, APIError):
+        code = getattr(e, "code", None)
+        if isinstance(code, int) and code > 0:
+            return code
+        resp = getattr(e, "response", None)
+        return getattr(resp, "status_code", None)
+    return None
+
+
+def is_retryable(e: Exception) -> bool:
+    """429/5xx, 네트워크 단절/타임아웃만 재시도"""
+    if isinstance(e, (RequestsConnectionError, Timeout)):
+        return True
+    return _status_of(e) in RETRY_STATUS
+
+
+def is_stale_handle(e: Exception) -> bool:
+    """
+    캐시한 핸들을 더는 믿을 수 없는 오류: 시트/탭 없음(삭제, 이름 변경), 재시도하지 않는 4xx(권한, 잘못된 범위)
+    -> 핸들 캐시를 비우고 다음 호출에서 다시 열기
+    """
+    if isinstance(e, (SpreadsheetNotFound, WorksheetNotFound)):
+        return True
+    status = _status_of(e)
+    return status is not None and 400 <= status < 500 and status not in RETRY_STATUS
+
+
+class ReadQuota:
+    """분당 읽기 요청 추적 (슬라이딩 윈도우). 한도에 닿으면 창이 빌 때까지 대기"""
+
+    def __init__(self, limit: int, window: float = 60.0, clock=time.monotonic, sleep=time.sleep):
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+        self._sleep = sleep
+        self._stamps: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self.throttled = 0  # 한도 때문에 기다린 횟수
+
+    def _trim(self, now: float) -> None:
+        while self._stamps and now - self._stamps[0] >= self.window:
+            self._stamps.popleft()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._trim(now)
+                if len(self._stamps) < self.limit:
+                    self._stamps.append(now)
+                    return
+                wait = self.window - (now - self._stamps[0])
+                self.throttled += 1
+            self._sleep(max(wait, 0.0))
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._trim(self._clock())
+            return len(self._stamps)
+
+
+class SheetsClientManager:
+    """
+    프로세스 공용 구글 시트 클라이언트 (세션 간 공유)
+    - 인증된 HTTP 세션(gspread Client)을 한 번 만들어 재사용
+    - spreadsheet/worksheet 핸들을 키로 캐시 (이름 검색은 최초 1회만)
+    - 429/5xx는 지터가 들어간 지수 백오프로 재시도
+    - 시트/탭 없음, 재시도하지 않는 4xx가 나면 핸들 캐시를 비움 (다음 호출에서 다시 열기)
+    - 시트 읽기 요청을 분당 한도 안으로 조절
+    - 잠금은 캐시 조회/기록에만 (네트워크 호출, 백오프 대기 중에는 다른 세션을 막지 않음)
+
+    client_factory는 gspread.Client와 같은 open/open_by_key를 가진 객체를 돌려주면 됨
+    (로컬 가짜 백엔드: academy.local_sheets.LocalSheetsClient)
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        read_quota_per_min: int = 60,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        sleep=time.sleep,
+    ):
+        self._client_factory = client_factory
+        self._client = None
+        self._sleep = sleep
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.read_quota = ReadQuota(read_quota_per_min, sleep=sleep)
+        self._name_to_key: Dict[str, str] = {}
+        self._spreadsheets: Dict[str, Any] = {}
+        self._worksheets: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.RLock()
+        self.stats = {"calls": 0, "retries": 0, "errors": 0}
+
+    # -----------------------------
+    # 공통 호출 (재시도 + 쿼터)
+    # -----------------------------
+    def backoff_delay(self, attempt: int) -> float:
+        """attempt(0부터)번째 재시도 대기: 지수 증가 상한 + full jitter"""
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def call(self, fn: Callable, *args, read: bool = True, **kwargs):
+        attempt = 0
+        while True:
+            if read:
+                self.read_quota.acquire()
+            self.stats["calls"] += 1
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    self.stats["errors"] += 1
+                    if is_stale_handle(e):
+                        self.invalidate()
+                    raise
+                self.stats["retries"] += 1
+                self._sleep(self.backoff_delay(attempt))
+                attempt += 1
+
+    # -----------------------------
+    # 핸들 캐시
+    # -----------------------------
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory()
+            return self._client
+
+    def spreadsheet(self, key: Optional[str] = None, name: Optional[str] = None) -> "ManagedSpreadsheet":
+        """key(스프레드시트 ID) 우선. 이름만 있으면 첫 호출 때만 Drive 검색"""
+        if not (key or name):
+            raise ValueError("spreadsheet key 또는 name이 필요합니다.")
+
+        with self._lock:
+            if not key:
+                key = self._name_to_key.get(name)
+            sh = self._spreadsheets.get(key) if key else None
+        if sh is not None:
+            return ManagedSpreadsheet(self, sh)
+
+        # 여는 동안(재시도 대기 포함)은 잠금 없이: 동시에 열면 먼저 넣은 핸들을 같이 씀
+        if key:
+            sh = self.call(self.client.open_by_key, key)
+        else:
+            sh = self.call(self.client.open, name)
+
+        with self._lock:
+            if name:
+                self._name_to_key[name] = sh.id
+            sh = self._spreadsheets.setdefault(sh.id, sh)
+        return ManagedSpreadsheet(self, sh)
+
+    def worksheet(self, sh, title: str):
+        wkey = (sh.id, title)
+        with self._lock:
+            ws = self._worksheets.get(wkey)
+        if ws is None:
+            ws = self.call(sh.worksheet, title)
+            with self._lock:
+                ws = self._worksheets.setdefault(wkey, ws)
+        return ws
+
+    def invalidate(self) -> None:
+        """핸들 캐시 비우기 (시트 구조 변경/권한 오류 후 재연결용). 인증 세션은 유지"""
+        with self._lock:
+            self._name_to_key.clear()
+            self._spreadsheets.clear()
+            self._worksheets.clear()
+
+    def usage(self) -> Dict[str, int]:
+        return {
+            **self.stats,
+            "reads_last_min": self.read_quota.used,
+            "read_limit_per_min": self.read_quota.limit,
+            "throttled": self.read_quota.throttled,
+        }
+
+
+class ManagedSpreadsheet:
+    """RosterSync가 쓰는 스프레드시트 인터페이스를 재시도/쿼터 경유로 감싼 얇은 프록시"""
+
+    def __init__(self, manager: SheetsClientManager, sh):
+        self._manager = manager
+        self._sh = sh
+
+    @property
+    def id(self) -> str:
+        return self._sh.id
+
+    def get_lastUpdateTime(self) -> str:
+        # Drive 메타데이터 호출: 시트 읽기 쿼터와 별개
+        return self._manager.call(self._sh.get_lastUpdateTime, read=False)
+
+    def worksheet(self, title: str) -> "ManagedWorksheet":
+        return ManagedWorksheet(self._manager, self._manager.worksheet(self._sh, title))
+
+
+class ManagedWorksheet:
+    def __init__(self, manager: SheetsClientManager, ws):
+        self._manager = manager
+        self._ws = ws
+
+    @property
+    def title(self) -> str:
+        return self._ws.title
+
+    def get_all_records(self, **kwargs):
+        return self._manager.call(self._ws.get_all_records, **kwargs)
+
+    def row_values(self, row: int, **kwargs):
+        return self._manager.call(self._ws.row_values, row, **kwargs)
+
+    def batch_get(self, ranges, **kwargs):
+        return self._manager.call(self._ws.batch_get, ranges, **kwargs)
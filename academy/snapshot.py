@@ -0,0 +1,75 @@
+# academy/snapshot.py
+import json
+import os
+import sqlite3
+import tempfile
+from typing import Optional, Tuple
+
+import pandas as pd
+
+TABLE_ROSTER = "roster"
+TABLE_META = "meta"
+
+# 스냅샷 내부 보조 컬럼 (행 키 / 원본 해시)
+SNAP_KEY = "_key"
+SNAP_SIG = "_sig"
+
+
+def save_snapshot(path: str, keyed: pd.DataFrame, sigs: pd.Series, version: Optional[str]) -> None:
+    """
+    마지막 정규화 명단을 SQLite 파일로 저장.
+    임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완성된 파일만 봄
+    임시 파일은 저장마다 새 이름 (앱과 render CLI처럼 여러 프로세스가 같은 경로에 동시에 저장해도 서로 덮어쓰지 않음)
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+
+    out = keyed.copy()
+    out[SNAP_SIG] = sigs.reindex(out.index, fill_value=0).to_numpy()
+    out.index.name = SNAP_KEY
+    out = out.reset_index()
+
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)  # 빈 파일은 sqlite가 새 DB로 씀
+    try:
+        with sqlite3.connect(tmp) as con:
+            out.to_sql(TABLE_ROSTER, con, index=False)
+            meta = {
+                "version": version,
+                "columns": list(keyed.columns),
+            }
+            con.execute(f"CREATE TABLE {TABLE_META} (k TEXT PRIMARY KEY, v TEXT)")
+            con.executemany(
+                f"INSERT INTO {TABLE_META} VALUES (?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False)) for k, v in meta.items()],
+            )
+        con.close()
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_snapshot(path: str) -> Optional[Tuple[pd.DataFrame, pd.Series, Optional[str]]]:
+    """저장된 스냅샷 -> (행 키 index 명단, 행 해시, 버전). 없거나 깨졌으면 None"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with sqlite3.connect(path) as con:
+            meta = {
+                k: json.loads(v)
+                for k, v in con.execute(f"SELECT k, v FROM {TABLE_META}")
+            }
+            df = pd.read_sql_query(f"SELECT * FROM {TABLE_ROSTER}", con)
+        con.close()
+
+        sigs = pd.Series(df[SNAP_SIG].to_numpy(dtype="int64"), index=df[SNAP_KEY].to_numpy())
+        keyed = df.drop(columns=[SNAP_SIG]).set_index(SNAP_KEY)
+        keyed.index.name = None
+        keyed = keyed[meta.get("columns", list(keyed.columns))]
+    except Exception:
+        # 예전 형식/손상된 파일이면 버리고 시트에서 새로 받음
+        return None
+
+    return keyed, sigs, meta.get("version")
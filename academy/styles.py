@@ -1,5 +1,5 @@
 # academy/styles.py
-import streamlit as st
+from functools import lru_cache
 
 def get_print_css(orientation: str = "세로") -> str:
     page_size = "A4 portrait" if orientation == "세로" else "A4 landscape"
@@ -462,6 +462,6 @@ def get_print_css(orientation: str = "세로") -> str:
     </style>
     """
 
-@st.cache_data
+@lru_cache(maxsize=None)
 def get_print_css_cached(orientation: str) -> str:
     return get_print_css(orientation)
\ No newline at end of file
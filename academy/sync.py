@@ -0,0 +1,334 @@
+# academy/sync.py
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from gspread.utils import rowcol_to_a1
+
+from .config import REQUIRED_COLUMNS, COL_ID
+from .utils import norm, norm_series
+from .roster import normalize_roster, apply_schema, enrich_roster
+from .schedule import schedule_index
+from .search import search_index
+from .snapshot import save_snapshot, load_snapshot
+from .render_cache import sigs_fingerprint, register_fingerprint
+
+
+class HeaderMismatchError(ValueError):
+    """구글 시트 헤더에 필수 컬럼이 없을 때"""
+
+    def __init__(self, missing: List[str], columns: List[str]):
+        super().__init__(f"누락된 항목: {missing}")
+        self.missing = missing
+        self.columns = columns
+
+
+def row_keys(raw: pd.DataFrame) -> pd.Index:
+    """
+    행 키: 학생ID 우선, 없으면 시트상 위치.
+    중복 ID는 등장 순서대로 '#n'을 붙여 구분
+    """
+    sid = norm_series(raw[COL_ID]).to_numpy(dtype=object)
+    pos = np.arange(len(raw)).astype(str)
+    base = pd.Series(np.where(sid != "", "id:" + sid, "row:" + pos.astype(object)))
+    dup = base.groupby(base, sort=False).cumcount()
+    keys = base.where(dup == 0, base + "#" + dup.astype(str))
+    return pd.Index(keys.to_numpy())
+
+
+def row_signatures(raw: pd.DataFrame, keys: pd.Index) -> pd.Series:
+    """행 원본값 해시 (변경 감지용, int64)"""
+    h = pd.util.hash_pandas_object(raw.astype(str), index=False).to_numpy()
+    return pd.Series(h.view("int64"), index=keys)
+
+
+def fetch_records(ws) -> Tuple[List[str], List[Sequence]]:
+    """get_all_records 방식 (모든 컬럼) -> (헤더, 컬럼별 값)"""
+    records = ws.get_all_records()
+    if not records:
+        return [], []
+    header = list(records[0].keys())
+    return header, [list(c) for c in zip(*(r.values() for r in records))]
+
+
+def _col_letter(col: int) -> str:
+    return rowcol_to_a1(1, col)[:-1]
+
+
+class ColumnProjector:
+    """
+    필요한 컬럼만 범위로 가져오기 (values batchGet 1회)
+    - 헤더 위치를 기억해 두고, 범위 첫 칸(헤더)이 기대와 다르면 헤더를 다시 읽음
+    - 관리용 추가 컬럼은 아예 전송/파싱하지 않음
+    """
+
+    def __init__(self, columns=REQUIRED_COLUMNS):
+        self.columns = set(columns)
+        self._positions: Dict[str, int] = {}  # 정규화 헤더 -> 1부터 시작하는 열 번호
+
+    def fetch(self, ws) -> Tuple[List[str], List[Sequence]]:
+        for _ in range(2):
+            if not self._positions and not self._locate(ws):
+                return [], []
+            result = self._fetch_ranges(ws)
+            if result is not None:
+                return result
+        raise RuntimeError("시트 헤더 위치가 계속 바뀌고 있습니다. 잠시 후 다시 시도하세요.")
+
+    def _locate(self, ws) -> bool:
+        header = [norm(h) for h in ws.row_values(1)]
+        if not any(header):
+            return False
+
+        positions: Dict[str, int] = {}
+        for i, h in enumerate(header, start=1):
+            positions.setdefault(h, i)
+
+        missing = [c for c in self.columns if c not in positions]
+        if missing:
+            raise HeaderMismatchError(missing, header)
+
+        # 시트상 열 순서 유지
+        self._positions = {c: positions[c] for c in sorted(self.columns, key=positions.get)}
+        return True
+
+    def _fetch_ranges(self, ws) -> Optional[Tuple[List[str], List[Sequence]]]:
+        names = list(self._positions)
+        ranges = [f"{_col_letter(p)}1:{_col_letter(p)}" for p in self._positions.values()]
+        blocks = ws.batch_get(ranges, major_dimension="COLUMNS")
+
+        cols = [list(b[0]) if b and b[0] else [] for b in blocks]
+        if [norm(c[0]) if c else "" for c in cols] != names:
+            self._positions = {}
+            return None
+
+        bodies = [c[1:] for c in cols]
+        n = max((len(b) for b in bodies), default=0)
+        return names, [b + [""] * (n - len(b)) for b in bodies]
+
+
+class _Flight:
+    """진행 중인 시트 확인 1건 (같이 기다리는 호출들이 결과/오류를 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class RosterSync:
+    """
+    students 시트 증분 동기화 엔진 (프로세스 공용 1개)
+    - 스프레드시트 수정시각(modifiedTime)이 그대로면 시트를 다시 받지 않음
+    - 바뀌었으면 학생ID 기준으로 달라진 행만 다시 정규화해서 명단에 반영
+    - snapshot_path가 있으면 마지막 명단을 디스크에 보관 (재시작 직후 즉시 제공)
+    - fetch_mode: "columns" = 필수 컬럼 범위만 원본값으로 / "records" = get_all_records 전체
+    """
+
+    def __init__(self, snapshot_path: Optional[str] = None, fetch_mode: str = "columns"):
+        self.version: Optional[str] = None
+        self.synced_at: float = 0.0           # 마지막 확인 시각 (monotonic, 0 = 미확인)
+        self.last_error: Optional[Exception] = None
+        self.snapshot_path = snapshot_path
+        self.fetch_mode = fetch_mode
+        self._projector = ColumnProjector()
+        self._header: Optional[Tuple[str, ...]] = None
+        self._keyed = pd.DataFrame()          # index = 행 키
+        self._sigs = pd.Series(dtype="int64")  # 행 키 -> 원본 해시
+        self._frame = pd.DataFrame()
+        self._lock = threading.Lock()
+        self._flight_lock = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._listeners: List[Callable[[pd.DataFrame], None]] = []
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._frame
+
+    @property
+    def loaded(self) -> bool:
+        return self.version is not None
+
+    def is_stale(self, max_age: float) -> bool:
+        return (time.monotonic() - self.synced_at) >= max_age
+
+    def restore(self) -> bool:
+        """디스크 스냅샷으로 명단 복원 (확인 시각은 0으로 두어 곧바로 재검증 대상)"""
+        if not self.snapshot_path:
+            return False
+        with self._lock:
+            if self.loaded:
+                return True
+            snap = load_snapshot(self.snapshot_path)
+            if snap is None:
+                return False
+            keyed, sigs, version = snap
+            self._header = tuple(keyed.columns) if len(keyed.columns) else None
+            self._keyed = keyed
+            self._sigs = sigs
+            self._frame = self._publish(keyed, sigs)
+            self.version = version
+            self._notify()
+            return True
+
+    def sync(self, sh, worksheet_title: str) -> pd.DataFrame:
+        """수정시각 확인(메타데이터 1회) 후 필요할 때만 시트 재조회"""
+        with self._lock:
+            modified = sh.get_lastUpdateTime()
+            if self.version is None or modified != self.version:
+                self.apply(*self.fetch(sh.worksheet(worksheet_title)))
+                self.version = modified
+                if self.snapshot_path:
+                    save_snapshot(self.snapshot_path, self._keyed, self._sigs, self.version)
+
+            self.synced_at = time.monotonic()
+            self.last_error = None
+            return self._frame
+
+    def subscribe(self, fn: Callable[[pd.DataFrame], None]) -> None:
+        """새 명단이 발행될 때마다 fn(frame) 호출 (동기화 잠금 안에서 불리므로 오래 걸리는 일은 스레드로)"""
+        self._listeners.append(fn)
+
+    def _notify(self) -> None:
+        if self._frame.empty:
+            return
+        for fn in self._listeners:
+            fn(self._frame)
+
+    @property
+    def refreshing(self) -> bool:
+        return self._flight is not None
+
+    def refresh(
+        self,
+        open_sheet: Callable[[], object],
+        worksheet_title: str,
+        min_interval: float = 0.0,
+    ) -> bool:
+        """
+        single-flight 동기화.
+        - 이미 진행 중인 확인이 있으면 새로 부르지 않고 그 결과를 같이 기다림 (오류도 공유)
+        - 마지막 확인 후 min_interval이 안 지났으면 시트를 부르지 않음 (연타 방지)
+        반환: 이번 호출로 실제 확인이 일어났거나 진행 중인 확인을 기다렸으면 True
+        """
+        with self._flight_lock:
+            flight = self._flight
+            if flight is None:
+                if self.loaded and (time.monotonic() - self.synced_at) < min_interval:
+                    return False
+                flight = self._flight = _Flight()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return True
+
+        try:
+            self.sync(open_sheet(), worksheet_title)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flight_lock:
+                self._flight = None
+            flight.done.set()
+        return True
+
+    def revalidate_async(
+        self,
+        open_sheet: Callable[[], object],
+        worksheet_title: str,
+        min_interval: float = 0.0,
+    ) -> None:
+        """
+        백그라운드 재검증 (stale-while-revalidate).
+        진행 중인 확인이 있거나 min_interval 안에 확인했으면 새로 부르지 않음. 실패는 last_error에 기록
+        """
+        if self.refreshing:
+            return
+
+        def _run():
+            try:
+                self.refresh(open_sheet, worksheet_title, min_interval)
+            except Exception as e:
+                # 실패해도 다음 주기까지는 스냅샷으로 버팀 (매 rerun 재시도 방지)
+                self.last_error = e
+                self.synced_at = time.monotonic()
+
+        threading.Thread(target=_run, name="roster-revalidate", daemon=True).start()
+
+    def fetch(self, ws) -> Tuple[List[str], List[Sequence]]:
+        if self.fetch_mode == "records":
+            return fetch_records(ws)
+        return self._projector.fetch(ws)
+
+    def apply(self, header: Sequence[str], columns: List[Sequence]) -> pd.DataFrame:
+        """(헤더, 컬럼별 값) 스냅샷을 반영: 바뀐 행만 정규화"""
+        if not columns or not len(columns[0]):
+            self._reset()
+            return self._frame
+
+        # 1) 컬럼명 정규화
+        header = tuple(norm(c) for c in header)
+
+        # 2) 필수 컬럼 검증
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise HeaderMismatchError(missing, list(header))
+
+        # 컬럼 단위로 DataFrame 구성 (행 dict를 만들지 않음)
+        raw = pd.DataFrame(dict(enumerate(columns)))
+        raw.columns = list(header)
+
+        keys = row_keys(raw)
+        sigs = row_signatures(raw, keys)
+        raw.index = keys
+
+        # 헤더가 바뀌면 전체 재구성
+        full = header != self._header or self._keyed.empty
+        if full:
+            changed = np.ones(len(raw), dtype=bool)
+        else:
+            changed = self._sigs.reindex(keys, fill_value=0).to_numpy() != sigs.to_numpy()
+
+        # 3) 바뀐 행만 정규화
+        if changed.any():
+            delta = normalize_roster(raw.loc[changed].copy())
+
+        if full:
+            keyed = delta
+        elif changed.any():
+            kept = self._keyed.drop(index=delta.index, errors="ignore")
+            keyed = pd.concat([kept, delta]).reindex(keys)
+        else:
+            # 삭제/순서 변경만 있는 경우
+            keyed = self._keyed.reindex(keys)
+
+        self._header = header
+        self._keyed = keyed
+        self._sigs = sigs
+        self._frame = self._publish(keyed, sigs)
+        self._notify()
+        return self._frame
+
+    @staticmethod
+    def _publish(keyed: pd.DataFrame, sigs: pd.Series) -> pd.DataFrame:
+        """내부(행 키 index) 명단 -> 화면용 명단 (RangeIndex + compact 스키마 + 파생 컬럼)"""
+        if not len(keyed.columns):
+            return pd.DataFrame()
+        frame = enrich_roster(apply_schema(keyed.reset_index(drop=True)))
+        schedule_index(frame)  # (요일, 교시) 역색인도 발행 시점에 미리 생성
+        search_index(frame)    # 탭 0 검색 색인
+        register_fingerprint(frame, sigs_fingerprint(sigs, keyed.columns))  # 보고서 캐시 키
+        return frame
+
+    def _reset(self):
+        self._header = None
+        self._keyed = pd.DataFrame()
+        self._sigs = pd.Series(dtype="int64")
+        self._frame = pd.DataFrame()
@@ -1,97 +1,120 @@
 # academy/tables.py
+from typing import List, Tuple
+
+import numpy as np
 import pandas as pd
 
 from .config import (
     COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS,
+    COL_KEY, COL_SCHOOL_GRADE, COL_GRADE_ORDER, COL_DAYS_COUNT,
     GRADE_ORDER, WEEKDAY_ORDER
 )
-from .utils import split_days, extract_period_numbers, match_attendance, get_student_key, sanitize_letter
-from .filters import filter_students_for_day_period
+from .utils import attendance_slots, extract_period_numbers
+from .schedule import ScheduleIndex, schedule_index
+from .markup import HtmlBuffer, column_lists, esc
+from .assignments import assignment_table, period_state
+
+
+def _format_group(prefix: str, names: List[str], count_text: str) -> str:
+    """한 명이면 그대로, 여러 명이면 [이름 이름] 으로 묶기 (이름은 이스케이프된 상태로 받음)"""
+    names_str = " ".join(names)
+    if len(names) == 1:
+        return f"{prefix}{names_str}{count_text}"
+    return f"{prefix}[{names_str}]{count_text}"
+
+
+def _runs(codes: np.ndarray) -> List[Tuple[int, int]]:
+    """정렬된 코드 배열에서 같은 값이 이어지는 구간 [(시작, 끝), ...]"""
+    if not len(codes):
+        return []
+    cuts = (np.flatnonzero(codes[1:] != codes[:-1]) + 1).tolist()
+    bounds = [0, *cuts, len(codes)]
+    return list(zip(bounds[:-1], bounds[1:]))
 
 
 def generate_total_list_html(df: pd.DataFrame) -> str:
-    html = "<table class='total-list-table' style='width:100%;'><thead><tr>"
+    html = HtmlBuffer()
+    html.add("<table class='total-list-table' style='width:100%;'><thead><tr>")
     cols = [COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]
     widths = {COL_NAME: "15%", COL_SCHOOL: "25%", COL_GRADE: "10%", COL_DAYS: "20%", COL_PERIOD: "20%", COL_STATUS: "10%"}
 
     for c in cols:
         w = widths.get(c, "15%")
-        html += f"<th style='width:{w};'>{c}</th>"
-    html += "</tr></thead><tbody>"
+        html.add(f"<th style='width:{w};'>{c}</th>")
+    html.add("</tr></thead><tbody>")
 
-    for _, r in df.iterrows():
-        html += "<tr>"
-        for c in cols:
-            html += f"<td>{r[c]}</td>"
-        html += "</tr>"
-    html += "</tbody></table>"
-    return html
+    html.extend(
+        "<tr>" + "".join(f"<td>{esc(v)}</td>" for v in row) + "</tr>"
+        for row in zip(*column_lists(df, cols))
+    )
+    html.add("</tbody></table>")
+    return html.render()
 
 
 def generate_table1(df: pd.DataFrame, show_school: bool, show_count: bool, month_text: str) -> str:
-    df_active = df[df[COL_STATUS] == "재원"].copy()
-    html = f"<h2 style='text-align:center; font-size:16pt;'>학년별 명단 ({month_text})</h2>"
-    
-    html += "<table class='table1-custom'><thead><tr><th>학년</th><th>학생 명단</th><th>인원수</th></tr></thead><tbody>"
-
-    total = 0
-    for grade in GRADE_ORDER:
-        group = df_active[df_active[COL_GRADE] == grade]
-        if group.empty:
-            continue
-
-        group_sorted = group.sort_values(by=[COL_SCHOOL, COL_NAME])
+    df_active = df[df[COL_STATUS] == "재원"]
+    html = HtmlBuffer()
+    html.add(f"<h2 style='text-align:center; font-size:16pt;'>학년별 명단 ({esc(month_text)})</h2>")
+
+    html.add("<table class='table1-custom'><thead><tr><th>학년</th><th>학생 명단</th><th>인원수</th></tr></thead><tbody>")
+
+    # ✅ 정렬은 1번만: 학교 -> 이름 순 (주 N회 요약 순서)
+    #    학년별 표는 이 순서 위에 학년 순 안정 정렬 = 학년 -> 학교 -> 이름
+    by_school = df_active.sort_values(by=[COL_SCHOOL, COL_NAME])
+    names = [esc(n) for n in by_school[COL_NAME].tolist()]
+    schools = by_school[COL_SCHOOL].tolist()
+    school_codes = pd.factorize(by_school[COL_SCHOOL])[0]
+    grade_ranks = by_school[COL_GRADE_ORDER].to_numpy()
+    days_count = by_school[COL_DAYS_COUNT].to_numpy()
+
+    def school_groups(rows: np.ndarray, is_show_school: bool, is_show_count: bool) -> List[str]:
+        formatted_groups = []
+        for start, end in _runs(school_codes[rows]):
+            if school_codes[rows[start]] < 0:
+                continue  # 학교 값 없음 (groupby와 같이 제외)
+            names_list = [names[i] for i in rows[start:end]]
+            count = len(names_list)
 
-        if show_school or show_count:
-            formatted_groups = []
-            for school, school_group in group_sorted.groupby(COL_SCHOOL, sort=False):
-                names_list = school_group[COL_NAME].tolist()
-                names_str = " ".join(names_list)
-                count = len(names_list)
+            school_text = f"【{esc(schools[rows[start]])}】" if is_show_school else ""
+            count_text = f" {count}명" if (is_show_count and count >= 4) else ""
 
-                school_text = f"【{school}】" if show_school else ""
-                count_text = f" {count}명" if (show_count and count >= 4) else ""
+            # ✅ <div>를 벗겨내고 원래대로 텍스트만 묶습니다.
+            formatted_groups.append(_format_group(school_text, names_list, count_text))
+        return formatted_groups
 
-                # ✅ <div>를 벗겨내고 원래대로 텍스트만 묶습니다.
-                if count == 1:
-                    formatted_groups.append(f"{school_text}{names_str}{count_text}")
-                else:
-                    formatted_groups.append(f"{school_text}[{names_str}]{count_text}")
+    total = 0
+    by_grade = np.argsort(grade_ranks, kind="stable")
+    for start, end in _runs(grade_ranks[by_grade]):
+        rank = grade_ranks[by_grade[start]]
+        if rank >= len(GRADE_ORDER):
+            continue  # GRADE_ORDER에 없는 학년은 표에 넣지 않음
+        rows = by_grade[start:end]
 
+        if show_school or show_count:
             # ✅ 띄어쓰기(" ")를 기준으로 가로로 쭉 이어 붙입니다.
-            names_final_str = "&nbsp;&nbsp;&nbsp;&nbsp;".join(formatted_groups)
+            names_final_str = "&nbsp;&nbsp;&nbsp;&nbsp;".join(school_groups(rows, show_school, show_count))
         else:
-            names_final_str = " ".join(group_sorted[COL_NAME].tolist())
+            names_final_str = " ".join(names[i] for i in rows)
 
-        html += f"<tr><th>{grade}</th><td class='t1-names'>{names_final_str}</td><td>{len(group)}</td></tr>"
-        total += len(group)
+        html.add(f"<tr><th>{GRADE_ORDER[rank]}</th><td class='t1-names'>{names_final_str}</td><td>{len(rows)}</td></tr>")
+        total += len(rows)
 
     # --- 주 N회 합계 요약 부분 ---
-    df_active["days_count"] = df_active[COL_DAYS].apply(lambda x: len(split_days(x)))
     summary_texts = []
 
     def get_summary_str(count_target, label, is_show_school, is_show_count):
-        df_target = df_active[df_active["days_count"] == count_target].sort_values(by=[COL_SCHOOL, COL_NAME])
-        if df_target.empty:
+        rows = np.flatnonzero(days_count == count_target)
+        if not len(rows):
             return ""
 
-        groups = []
         if is_show_school or is_show_count:
-            for school, school_group in df_target.groupby(COL_SCHOOL, sort=False):
-                names_list = school_group[COL_NAME].tolist()
-                names_str = " ".join(names_list)
-                count = len(names_list)
-
-                school_text = f"【{school}】" if is_show_school else ""
-                count_text = f" {count}명" if (is_show_count and count >= 4) else ""
-
-                if count == 1:
-                    groups.append(f"{school_text}{names_str}{count_text}")
-                else:
-                    groups.append(f"{school_text}[{names_str}]{count_text}")
+            groups = school_groups(rows, is_show_school, is_show_count)
         else:
-            for _, school_group in df_target.groupby(COL_SCHOOL, sort=False):
-                groups.append(" ".join(school_group[COL_NAME].tolist()))
+            groups = [
+                " ".join(names[i] for i in rows[start:end])
+                for start, end in _runs(school_codes[rows])
+                if school_codes[rows[start]] >= 0
+            ]
 
         return (
             f"<div class='t1-summary-line'><strong>{label}:</strong> "
@@ -106,268 +129,261 @@ def generate_table1(df: pd.DataFrame, show_school: bool, show_count: bool, month
     if str_3day: summary_texts.append(str_3day)
 
     summary_final_str = "".join(summary_texts)
-    
-    html += f"<tr><th>합계</th><td class='t1-names t1-summary'>{summary_final_str}</td><td>{total}</td></tr></tbody></table>"
-    return html
+
+    html.add(f"<tr><th>합계</th><td class='t1-names t1-summary'>{summary_final_str}</td><td>{total}</td></tr></tbody></table>")
+    return html.render()
 
 
 def generate_table2(df: pd.DataFrame, month_text: str) -> str:
-    df_active = df[df[COL_STATUS] == "재원"].copy()
-    html = f"<h2 class='no-print' style='text-align:center; font-size:16pt;'>{month_text} 반편성 내역</h2>"
+    df_active = df[df[COL_STATUS] == "재원"]
+    month_html = esc(month_text)
+    html = HtmlBuffer()
+    html.add(f"<h2 class='no-print' style='text-align:center; font-size:16pt;'>{month_html} 반편성 내역</h2>")
     target_days = ["월", "화", "수", "목"]
 
-    periods_set = set()
-    for p_str in df_active[COL_PERIOD]:
-        for n in extract_period_numbers(p_str):
-            if n > 0:
-                periods_set.add(n)
+    # 수업교시에 등장하는 모든 양수 교시 (고유 문자열마다 extract_period_numbers, 긴 숫자열도 파이썬 int로)
+    periods_set = {n for s in df_active[COL_PERIOD].unique().tolist() for n in extract_period_numbers(s)}
     periods = sorted(periods_set) if periods_set else [1, 2, 3]
 
-    # ✅ 학년 정렬용 딕셔너리
-    grade_sort_map = {g: i for i, g in enumerate(GRADE_ORDER)}
+    # 학년(GRADE_ORDER) -> 학교 -> 이름 정렬을 한 번만 하고,
+    # 한 번의 패스로 학생을 자기 (요일, 교시) 칸 전부에 넣어 둠 (match_attendance 규칙)
+    ordered = df_active.sort_values([COL_GRADE_ORDER, COL_SCHOOL, COL_NAME])
+    buckets = ScheduleIndex.build(ordered, parse=attendance_slots)
+
+    # 칸마다 Series를 만들지 않도록 컬럼 배열로 미리 변환
+    grades, labels = column_lists(ordered, [COL_GRADE, COL_SCHOOL_GRADE])
+    name_divs = [
+        f"<div class='weekly-name' style='text-align:left;'>{esc(n)} ({esc(sg)})</div>"
+        for n, sg in zip(ordered[COL_NAME].tolist(), labels)
+    ]
 
     for p in periods:
-        html += "<div class='a4-print-box'><table class='weekly-table'><thead><tr>"
-        html += "<th style='width:10%;'>수업시간</th>"
+        html.add("<div class='a4-print-box'><table class='weekly-table'><thead><tr>")
+        html.add("<th style='width:10%;'>수업시간</th>")
         for d in target_days:
-            html += f"<th style='width:20%;'>{d}</th>"
-        html += "<th style='width:10%;'>비고</th></tr></thead><tbody>"
-        
+            html.add(f"<th style='width:20%;'>{d}</th>")
+        html.add("<th style='width:10%;'>비고</th></tr></thead><tbody>")
+
         # ✅ 수정 1: 인라인 스타일을 지우고 'period-cell' 클래스만 부여 (CSS가 중앙 정렬 담당)
-        html += f"<tr><td class='period-cell'>{p}교시</td>"
+        html.add(f"<tr><td class='period-cell'>{p}교시</td>")
 
         for d in target_days:
-            condition = df_active.apply(
-                lambda row: match_attendance(row[COL_DAYS], row[COL_PERIOD], d, p), 
-                axis=1
-            )
-            students = df_active[condition].copy()
+            positions = buckets.positions(d, p)
 
             student_list = []
             last_grade = None
 
-            if not students.empty:
-                # 학년(GRADE_ORDER) -> 학교 -> 이름 정렬
-                students["_grade_order"] = students[COL_GRADE].map(grade_sort_map).fillna(999)
-                students = students.sort_values(["_grade_order", COL_SCHOOL, COL_NAME])
+            for i in positions:
+                grade = str(grades[i])
 
-                for _, r in students.iterrows():
-                    grade = str(r[COL_GRADE]).strip()
+                # 학년 바뀌면 띄우기
+                if last_grade is not None and grade != last_grade:
+                    # 💡 &nbsp;(빈 줄)를 지우고 height로 조정
+                    student_list.append("<div style='height: 8px;'></div>")
 
-                   # 학년 바뀌면 띄우기
-                    if last_grade is not None and grade != last_grade:
-                        # 💡 &nbsp;(빈 줄)를 지우고 height로 조정
-                        student_list.append("<div style='height: 8px;'></div>")
-
-                    s_str, g_str = str(r[COL_SCHOOL]).strip(), grade
-                    school_grade = s_str + (g_str[1:] if s_str and g_str and s_str[-1] == g_str[0] else g_str)
-
-                    student_list.append(
-                        f"<div class='weekly-name' style='text-align:left;'>{r[COL_NAME]} ({school_grade})</div>"
-                    )
-                    last_grade = grade
+                student_list.append(name_divs[i])
+                last_grade = grade
 
             # 총 인원수
             count_html = (
-                f"<div class='weekly-name' style='text-align:left; font-weight:bold; margin-top:4px;'>{len(students)}명</div>"
-                if len(students) > 0 else ""
+                f"<div class='weekly-name' style='text-align:left; font-weight:bold; margin-top:4px;'>{len(positions)}명</div>"
+                if len(positions) > 0 else ""
             )
 
             # ✅ 수정 2: 스타일 코드를 최소화 (vertical-align 등은 CSS에서 처리)
-            html += (
+            html.add(
                 f"<td style='text-align:left !important;'>"
                 f"{''.join(student_list)}{count_html}</td>"
             )
 
-        html += f"<td></td></tr></tbody></table><div class='date-footer'>{month_text}</div></div>"
-        
-    return html
+        html.add(f"<td></td></tr></tbody></table><div class='date-footer'>{month_html}</div></div>")
 
+    return html.render()
 
-def generate_table3(df: pd.DataFrame, target_date, include_paused: bool, assignment_map: dict) -> str:
-    weekday = WEEKDAY_ORDER[target_date.weekday()]
-    day_mask = df[COL_DAYS].astype(str).apply(lambda x: weekday in split_days(x))
-    df_day = df[day_mask].copy()
 
-    if not include_paused:
-        df_day = df_day[df_day[COL_STATUS] == "재원"]
+class AttendanceDay:
+    """
+    출석부 1장의 날짜와 무관한 부분 (요일 + 재원 필터 기준)
+    세 교시 명단을 한 표로 정렬해 둔 것: 같은 요일 날짜들은 이것을 공유하고 배정 상태만 달리해서 렌더링
+    (프로세스 풀로 넘길 수 있도록 배열/리스트만 보관)
+    """
+
+    __slots__ = ("weekday", "has_students", "periods", "skeys", "name_texts", "new_grade", "bounds")
 
-    grade_sort_map = {g: i for i, g in enumerate(GRADE_ORDER)}
+    def __init__(self, df: pd.DataFrame, weekday: str, include_paused: bool):
+        index = schedule_index(df)
+        day_rows = index.day_positions(weekday)
+        if not include_paused and len(day_rows):
+            day_rows = day_rows[df[COL_STATUS].to_numpy()[day_rows] == "재원"]
+        self.weekday = weekday
+        self.has_students = bool(len(day_rows))
 
+        periods = [1, 2, 3]
+        parts = [index.positions(weekday, p) for p in periods]
+        slots = df.iloc[np.concatenate(parts)].assign(
+            _period=np.repeat(periods, [len(x) for x in parts])
+        )
+        if not include_paused:
+            slots = slots[slots[COL_STATUS] == "재원"]
+        slots = slots.sort_values(["_period", COL_GRADE_ORDER, COL_SCHOOL, COL_NAME])
+
+        self.periods = slots["_period"].to_numpy()
+        self.skeys = slots[COL_KEY].to_numpy(dtype=object)
+        self.bounds = np.searchsorted(self.periods, [1, 2, 3, 4])
+
+        pauses = np.where(slots[COL_STATUS].to_numpy(dtype=object) == "휴원", " (휴)", "").tolist()
+        self.name_texts = [
+            f"{esc(name)} ({esc(label)}){pause}"
+            for name, label, pause in zip(slots[COL_NAME].tolist(), slots[COL_SCHOOL_GRADE].tolist(), pauses)
+        ]
+
+        # 학년이 바뀌는 첫 행 (교시 안에서만)
+        grades = slots[COL_GRADE].astype(str).to_numpy(dtype=object)
+        self.new_grade = np.zeros(len(slots), dtype=bool)
+        self.new_grade[1:] = (grades[1:] != grades[:-1]) & (self.periods[1:] == self.periods[:-1])
+
+
+def table3_title(target_date, weekday: str) -> str:
     # ✅ 제목 (inline 유지: 기존과 동일)
-    html = (
+    return (
         f"<h2 class='t3-title' style='text-align:left; font-size:16pt; border-bottom:2px solid black;"
         f" padding-bottom:5px; margin:0 0 8px 0;'>"
         f"{target_date.month}-{target_date.day} {weekday}</h2>"
     )
-    html += "<div class='daily-grid-container'>"
+
+
+def table3_body(day: AttendanceDay, state: pd.DataFrame) -> str:
+    """출석부 본문 (세 교시 표). state: 배정 표 (assignments.assignment_table)"""
+    periods = [1, 2, 3]
+    bounds = day.bounds
 
     # -----------------------------
-    # 1) 각 교시 rows[p] 만들기
+    # 1) 교시별로 학생키 기준 배정 상태 맞춰 붙이기 (배정 없는 학생은 빈 칸)
     # -----------------------------
-    rows = {1: [], 2: [], 3: []}
-
-    for p in [1, 2, 3]:
-        df_p = filter_students_for_day_period(df_day, weekday, p)
-        if df_p.empty:
-            # 교시가 아예 없으면 빈 표를 만들긴 하되, 헤더/마감선 구조는 유지
-            rows[p] = []
-            continue
-
-        df_p["_grade_order"] = df_p[COL_GRADE].map(grade_sort_map).fillna(999)
-        df_p = df_p.sort_values(["_grade_order", COL_SCHOOL, COL_NAME])
-
-        last_grade = None
-        p_count, p_absent = 0, 0
-        p_alpha_counts = {}
-
-        # 학생 행
-        for _, row in df_p.iterrows():
-            grade = str(row[COL_GRADE]).replace("\u00A0", "").replace("\u3000", "").strip()
-            is_new_grade = (last_grade is not None and grade != last_grade)
-
-            pause = " (휴)" if row[COL_STATUS] == "휴원" else ""
-            s_str = str(row[COL_SCHOOL]).strip()
-            school_grade = s_str + (grade[1:] if s_str and grade and s_str[-1] == grade[0] else grade)
-            name_text = f"{row[COL_NAME]} ({school_grade}){pause}"
-
-            skey = get_student_key(row)
-            akey = (p, skey)
-
-            data = assignment_map.get(akey, {"letter": "", "absent": False})
-            if not isinstance(data, dict):
-                data = {"letter": sanitize_letter(str(data)), "absent": False}
-
-            letter = sanitize_letter(data.get("letter", ""))
-            is_abs = bool(data.get("absent", False))
-
-            if is_abs:
-                p_absent += 1
-            else:
-                p_count += 1
-                if letter:
-                    p_alpha_counts[letter] = p_alpha_counts.get(letter, 0) + 1
-
-            rows[p].append({
-                "type": "student",
-                "name_text": name_text,
-                "letter": letter,
-                "is_abs": is_abs,
-                "is_new_grade": is_new_grade,
-            })
-
-            last_grade = grade
+    letters = np.full(len(day.skeys), "", dtype=object)
+    absent = np.zeros(len(day.skeys), dtype=bool)
+    for p in periods:
+        at = slice(bounds[p - 1], bounds[p])
+        letters[at], absent[at] = period_state(state, p, day.skeys[at])
+
+    # 집계: 교시별 출석/결석 수 + 출석자 배정 글자별 수
+    p_codes = day.periods - 1
+    p_absent = np.bincount(p_codes[absent], minlength=3)
+    p_count = np.bincount(p_codes[~absent], minlength=3)
+    lettered = ~absent & (letters != "")
+    alpha_counts: dict = {}
+    tally = pd.DataFrame({"p": day.periods[lettered], "letter": letters[lettered]}).groupby(["p", "letter"]).size()
+    for (p, L), n in tally.items():
+        alpha_counts.setdefault(p, []).append(f"{L} : {n}명")
+
+    # 학생 행 HTML (한 행=한 줄)
+    student_rows = [
+        "<tr class='t3-row'>"
+        f"<td class='name-cell{abs_class}'><div class='student-inner{gap_class}'>{name_text}</div></td>"
+        f"<td><div class='student-inner{gap_class}'><div class='check-box'></div></div></td>"
+        f"<td><div class='student-inner{gap_class}'><div class='check-box'></div></div></td>"
+        f"<td class='assign-cell'><div class='student-inner{gap_class}'>{esc(letter)}</div></td>"
+        "</tr>"
+        for name_text, letter, abs_class, gap_class in zip(
+            day.name_texts, letters.tolist(),
+            np.where(absent, " absent", "").tolist(),
+            np.where(day.new_grade, " new-grade-gap", "").tolist(),
+        )
+    ]
+
+    gap_row = (
+        "<tr class='t3-gap-row'>"
+        "<td class='t3-gap'>&nbsp;</td>"
+        "<td class='t3-gap'>&nbsp;</td>"
+        "<td class='t3-gap'>&nbsp;</td>"
+        "<td class='t3-gap'>&nbsp;</td>"
+        "</tr>"
+    )
+    # ✅ 빈칸 찌그러짐 방지: &nbsp;
+    blank_row = (
+        "<tr class='t3-row t3-blank-row'>"
+        "<td class='t3-blank'>&nbsp;</td>"
+        "<td class='t3-blank'>&nbsp;</td>"
+        "<td class='t3-blank'>&nbsp;</td>"
+        "<td class='t3-blank'>&nbsp;</td>"
+        "</tr>"
+    )
+    bottom_row = (
+        "<tr class='t3-bottom'>"
+        "<td></td><td></td><td></td><td></td>"
+        "</tr>"
+    )
+
+    rows = {}
+    for p in periods:
+        rows[p] = student_rows[bounds[p - 1]:bounds[p]]
 
         # 요약(집계) — “한 줄=한 행”
-        total_in_period = p_count + p_absent
-        if total_in_period > 0:
+        count, n_absent = int(p_count[p - 1]), int(p_absent[p - 1])
+        if count + n_absent > 0:
             summary_lines = []
-            if p_count > 0:
-                summary_lines.append(f"{p_count}명")
-            for L in sorted(p_alpha_counts.keys()):
-                summary_lines.append(f"{L} : {p_alpha_counts[L]}명")
-            if p_absent > 0:
+            if count > 0:
+                summary_lines.append(f"{count}명")
+            summary_lines.extend(alpha_counts.get(p, []))
+            if n_absent > 0:
                 summary_lines.append(
-                    f"<span style='color:#d9534f; font-weight:600;'>결석 : {p_absent}명</span>"
+                    f"<span style='color:#d9534f; font-weight:600;'>결석 : {n_absent}명</span>"
                 )
 
-            if summary_lines:
-                # ✅ colspan 금지: 4칸 gap으로 세로선 유지
-                rows[p].append({"type": "gap"})
-                for line_text in summary_lines:
-                    rows[p].append({"type": "summary", "text": line_text})
+            # ✅ colspan 금지: 4칸 gap으로 세로선 유지
+            rows[p].append(gap_row)
+            for line_text in summary_lines:
+                rows[p].append(
+                    "<tr class='t3-row'>"
+                    f"<td class='summary-cell'>{line_text}</td>"
+                    "<td></td><td></td><td></td>"
+                    "</tr>"
+                )
 
     # -----------------------------
     # 2) max_len 구해서 blank padding
     # -----------------------------
-    max_len = max(len(rows[1]), len(rows[2]), len(rows[3])) if not df_day.empty else 0
-
-    for p in [1, 2, 3]:
-        while len(rows[p]) < max_len:
-            rows[p].append({"type": "blank"})
-        # ✅ 마지막 마감선은 “각 교시 표에 1번씩만” (모양 정합성 위해)
-        rows[p].append({"type": "bottom"})
+    max_len = max(len(rows[1]), len(rows[2]), len(rows[3])) if day.has_students else 0
 
     # -----------------------------
     # 3) 렌더링(각 교시 표 독립)
     # -----------------------------
+    html = HtmlBuffer()
+    html.add("<div class='daily-grid-container'>")
+
     # ✅ 헤더 폭: 출석/숙제/배정이 답답하면 여기서 더 넓힘
     th_name = "66%"
     th_small = "11.33%"  # 3개 합이 34% = 66 + 34 = 100
 
-    for p in [1, 2, 3]:
-        html += "<div class='period-column'>"
-        html += "<table class='table3-custom daily-table'><thead><tr>"
-        html += (
+    for p in periods:
+        html.add("<div class='period-column'>")
+        html.add("<table class='table3-custom daily-table'><thead><tr>")
+        html.add(
             f"<th style='width:{th_name};'>{p}교시</th>"
             f"<th style='width:{th_small};'>출석</th>"
             f"<th style='width:{th_small};'>숙제</th>"
             f"<th style='width:{th_small};'>배정</th>"
         )
-        html += "</tr></thead><tbody>"
-
-        for item in rows[p]:
-            t = item.get("type")
-
-            if t == "student":
-                abs_class = " absent" if item.get("is_abs") else ""
-                gap_class = " new-grade-gap" if item.get("is_new_grade") else ""
-                name_text = item.get("name_text", "")
-                letter = item.get("letter", "")
-
-                html += (
-                    "<tr class='t3-row'>"
-                    f"<td class='name-cell{abs_class}'><div class='student-inner{gap_class}'>{name_text}</div></td>"
-                    f"<td><div class='student-inner{gap_class}'><div class='check-box'></div></div></td>"
-                    f"<td><div class='student-inner{gap_class}'><div class='check-box'></div></div></td>"
-                    f"<td class='assign-cell'><div class='student-inner{gap_class}'>{letter}</div></td>"
-                    "</tr>"
-                )
-
-            elif t == "summary":
-                text = item.get("text", "")
-                html += (
-                    "<tr class='t3-row'>"
-                    f"<td class='summary-cell'>{text}</td>"
-                    "<td></td><td></td><td></td>"
-                    "</tr>"
-                )
+        html.add("</tr></thead><tbody>")
+        html.extend(rows[p])
+        html.extend([blank_row] * max(max_len - len(rows[p]), 0))
+        # ✅ 마지막 마감선은 “각 교시 표에 1번씩만” (모양 정합성 위해)
+        html.add(bottom_row)
+        html.add("</tbody></table></div>")
 
-            elif t == "gap":
-                html += (
-                    "<tr class='t3-gap-row'>"
-                    "<td class='t3-gap'>&nbsp;</td>"
-                    "<td class='t3-gap'>&nbsp;</td>"
-                    "<td class='t3-gap'>&nbsp;</td>"
-                    "<td class='t3-gap'>&nbsp;</td>"
-                    "</tr>"
-                )
+    html.add("</div>")  # daily-grid-container end
+    return html.render()
 
-            elif t == "blank":
-                # ✅ 빈칸 찌그러짐 방지: &nbsp;
-                html += (
-                    "<tr class='t3-row t3-blank-row'>"
-                    "<td class='t3-blank'>&nbsp;</td>"
-                    "<td class='t3-blank'>&nbsp;</td>"
-                    "<td class='t3-blank'>&nbsp;</td>"
-                    "<td class='t3-blank'>&nbsp;</td>"
-                    "</tr>"
-                )
 
-            elif t == "bottom":
-                html += (
-                    "<tr class='t3-bottom'>"
-                    "<td></td><td></td><td></td><td></td>"
-                    "</tr>"
-                )
+def generate_table3(df: pd.DataFrame, target_date, include_paused: bool, assignment_map) -> str:
+    """출석부. assignment_map: {(교시, 학생키): {"letter", "absent"}} 또는 배정 표 (AssignmentStore.day_table)"""
+    weekday = WEEKDAY_ORDER[target_date.weekday()]
+    day = AttendanceDay(df, weekday, include_paused)
+    return table3_title(target_date, weekday) + table3_body(day, assignment_table(assignment_map))
 
-        html += "</tbody></table></div>"
 
-    html += "</div>"  # daily-grid-container end
-    return html
-    
 def generate_table4(df: pd.DataFrame, show_grade: bool, month_text: str) -> str:
-    df_active = df[df[COL_STATUS] == "재원"].copy()
+    df_active = df[df[COL_STATUS] == "재원"]
     
     # ✅ 1) 학교급 정렬용 보조 함수: 초(1) -> 중(2) -> 고(3) -> 기타(4)
     def get_school_rank(school_name):
@@ -379,58 +395,70 @@ def generate_table4(df: pd.DataFrame, show_grade: bool, month_text: str) -> str:
         else: return 4
 
     # ✅ 2) 학교 이름 추출 후 [1순위: 학교급(초/중/고), 2순위: 가나다순] 정렬
-    unique_schools = df_active[COL_SCHOOL].dropna().unique().tolist()
-    unique_schools.sort(key=lambda x: (get_school_rank(x), str(x)))
-
-    # 학년 정렬 기준표 (GRADE_ORDER: 초1 -> 초2 -> ... 고3)
-    grade_sort_map = {str(g).strip(): i for i, g in enumerate(GRADE_ORDER)}
+    school_codes, unique_schools = pd.factorize(df_active[COL_SCHOOL])
+    school_order = sorted(range(len(unique_schools)), key=lambda c: (get_school_rank(unique_schools[c]), str(unique_schools[c])))
+    school_pos = np.empty(len(unique_schools) + 1, dtype=np.intp)
+    school_pos[school_order] = np.arange(len(school_order))
+    school_pos[-1] = -1  # 학교 값 없음 (code -1) -> 제외
+
+    # ✅ 3) 정렬 1번: 학교 순 -> 학년 순 -> 이름 가나다순
+    school_key = school_pos[school_codes]
+    keep = school_key >= 0
+    ordered = df_active[keep].assign(_school_key=school_key[keep]).sort_values(
+        by=["_school_key", COL_GRADE_ORDER, COL_NAME]
+    )
+    school_key = ordered["_school_key"].to_numpy()
+    names = [esc(n) for n in ordered[COL_NAME].tolist()]
+
+    # 같은 학교 안에서 학년은 처음 나온 순서대로 묶음 (groupby(sort=False)와 같은 결과)
+    # -> 학년 순위가 같은 다른 학년 값(기타 등)이 섞여 있어도 학년 단위로 모임
+    grade_codes = pd.factorize(ordered[COL_GRADE])[0]
+    first_seen = (
+        pd.Series(np.arange(len(ordered)))
+        .groupby([school_key, grade_codes], sort=False)
+        .transform("min")
+        .to_numpy()
+    )
+    order = np.lexsort((first_seen, school_key))  # 학교 구간은 그대로, 묶음 안은 이름 순 유지
+    grades = ordered[COL_GRADE].tolist()
 
-    html = f"<h2 style='text-align:center; font-size:16pt;'>학교별 명단 ({month_text})</h2>"
+    html = HtmlBuffer()
+    html.add(f"<h2 style='text-align:center; font-size:16pt;'>학교별 명단 ({esc(month_text)})</h2>")
     
     # 1번 표의 비율(8%, 84%, 8%)과 큼직한 글자 스타일(table1-custom)유지, 첫번째 비율은 변경
-    html += "<table class='table1-custom table4-custom'><thead><tr><th>학교</th><th>학생 명단</th><th>인원수</th></tr></thead><tbody>"
+    html.add("<table class='table1-custom table4-custom'><thead><tr><th>학교</th><th>학생 명단</th><th>인원수</th></tr></thead><tbody>")
     
     total = 0
-    for school in unique_schools:
-        group = df_active[df_active[COL_SCHOOL] == school].copy()
-        if group.empty:
-            continue
-
-        # 데이터에 묻어있는 공백 찌꺼기 청소
-        group["_grade_clean"] = group[COL_GRADE].astype(str).str.strip()
-
-        # [같은 학교 내 정렬] 1순위: 학년 순서, 2순위: 이름 가나다순
-        group["_grade_order"] = group["_grade_clean"].map(grade_sort_map).fillna(999)
-        group_sorted = group.sort_values(by=["_grade_order", COL_NAME])
+    for start, end in _runs(school_key[order]):
+        rows = order[start:end]
+        school = unique_schools[school_order[school_key[rows[0]]]]
 
         formatted_groups = []
         
         if show_grade:
-            # 정렬된 순서를 그대로 유지하면서(sort=False) 학년별로 묶어줍니다.
-            for grade, grade_group in group_sorted.groupby("_grade_clean", sort=False):
-                names_list = grade_group[COL_NAME].tolist()
-                names_str = " ".join(names_list)
+            # 정렬된 순서를 그대로 유지하면서 학년별로 묶어줍니다.
+            for g_start, g_end in _runs(first_seen[rows]):
+                if grade_codes[rows[g_start]] < 0:
+                    continue  # 학년 값 없음 (groupby와 같이 제외)
+                names_list = [names[i] for i in rows[g_start:g_end]]
                 count = len(names_list)
                 
                 # 【학년】 뒤에 한 칸 띄우기 적용!
-                grade_text = f"【{grade}】 "
+                grade_text = f"【{esc(grades[rows[g_start]])}】 "
                 count_text = f" {count}명" if count >= 4 else ""
                 
-                if count == 1:
-                    formatted_groups.append(f"{grade_text}{names_str}{count_text}")
-                else:
-                    formatted_groups.append(f"{grade_text}[{names_str}]{count_text}")
+                formatted_groups.append(_format_group(grade_text, names_list, count_text))
             
             # ✅ 띄어쓰기 4칸(&nbsp; 4개)을 기준으로 학년 덩어리들을 이어 붙입니다!
             names_final_str = "&nbsp;&nbsp;&nbsp;&nbsp;".join(formatted_groups)
         else:
-            names_final_str = " ".join(group_sorted[COL_NAME].tolist())
+            names_final_str = " ".join(names[start:end])
 
         # t1-names 클래스를 적용해 좌상단 정렬과 행간 띄우기 적용
-        html += f"<tr><th>{school}</th><td class='t1-names'>{names_final_str}</td><td>{len(group)}</td></tr>"
-        total += len(group)
+        html.add(f"<tr><th>{esc(school)}</th><td class='t1-names'>{names_final_str}</td><td>{len(rows)}</td></tr>")
+        total += len(rows)
 
     # 합계 칸
-    html += f"<tr><th>합계</th><td class='t1-names'></td><td>{total}</td></tr></tbody></table>"
+    html.add(f"<tr><th>합계</th><td class='t1-names'></td><td>{total}</td></tr></tbody></table>")
     
-    return html
\ No newline at end of file
+    return html.render()
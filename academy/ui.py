@@ -1,36 +1,88 @@
 # academy/ui.py
+import functools
+import time
+from contextlib import nullcontext
+
 import streamlit as st
 import pandas as pd
 
 from .config import (
     COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS,
-    GRADE_ORDER, WEEKDAY_ORDER
+    COL_GRADE_ORDER, WEEKDAY_ORDER, ROSTER_PAGE_SIZE,
+    DIAG_HISTORY, PROFILE_DIR
 )
-from .data import load_data
+from .data import load_data, refresh_data, get_render_cache, get_assignment_store, get_batch_executor
 from .styles import get_print_css_cached
 from .tables import (
     generate_total_list_html,
     generate_table1, generate_table2, generate_table3, generate_table4
 )
 from .filters import filter_students_for_day_period
-from .utils import get_student_key, sanitize_letter, now_kst, today_kst
-from .utils import split_days
+from .render_cache import RenderCache, frame_fingerprint
+from .search import search_index
+from .batch import attendance_packet, date_range, month_bounds
+from .assignments import (
+    EDITOR_KEY, EDITOR_NAME, EDITOR_LETTER, EDITOR_ABSENT, editor_frame, editor_changes
+)
+from .diagnostics import Trace, span, tracing
+from .utils import now_kst, today_kst
+
+
+def _diag_enabled() -> bool:
+    """진단 패널은 주소에 ?diag=1 을 붙였을 때만"""
+    return st.query_params.get("diag") == "1"
+
+
+def _keep_trace(trace: Trace) -> None:
+    history = st.session_state.setdefault("_diag_traces", [])
+    history.append(trace)
+    del history[:-DIAG_HISTORY]
+
+
+def _traced(label: str):
+    """진단 중이면 이번 실행 계측 (프로파일 요청이 있으면 이 실행 1회만 cProfile), 아니면 아무것도 안 함"""
+    if not _diag_enabled():
+        return nullcontext()
+    profile = st.session_state.pop("_diag_profile", False)
+    return tracing(label, sink=_keep_trace, profile=profile, profile_dir=PROFILE_DIR)
+
+
+def _traced_fragment(func):
+    """탭 fragment 계측: 전체 실행 안에서는 run_app 기록의 한 단계, 탭만 다시 실행되면 따로 기록"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _traced(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _markdown(stage: str, html: str) -> None:
+    """HTML 전송 (진단 중이면 직렬화 시간/크기 기록)"""
+    with span(stage) as s:
+        st.markdown(s.payload(html), unsafe_allow_html=True)
+
 
 def run_app():
-    df = load_data()
+    with _traced("run_app"):
+        _run_app()
+    if _diag_enabled():
+        _diagnostics_panel()
 
-    # ✅ 배정 저장소(session_state)
-    if "assignments" not in st.session_state:
-        st.session_state["assignments"] = {}  # {date_iso: {(period, student_key): "A"}}
+
+def _run_app():
+    with span("load_data"):
+        df = load_data()
+    reports = get_render_cache()
 
     # 사이드바
     with st.sidebar:
         print_orientation = st.radio("용지 방향", ["세로", "가로"])
-        st.markdown(get_print_css_cached(print_orientation), unsafe_allow_html=True)
+        _markdown("print_css.markdown", get_print_css_cached(print_orientation))
 
         if st.button("새로고침"):
-            st.cache_data.clear()
-            st.rerun()
+            if refresh_data():
+                st.rerun()
+            st.toast("방금 최신 명단을 확인했습니다.")
 
     st.markdown(
         '<div class="no-print" style="background-color:#f1f3f5;padding:15px;border-radius:8px;'
@@ -38,224 +90,307 @@ def run_app():
         unsafe_allow_html=True,
     )
 
-    tab_list = st.tabs(["전체 목록", "학년별 명단", "수업시간 명단", "출석부", "학교별 명단"])
+    tabs = st.tabs(TAB_LABELS, key="main_tab", on_change="rerun")
+    if df.empty:
+        return
 
-   # 탭 0
-    with tab_list[0]:
-        if not df.empty:
-            display_df = df[[COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]]
-            total_n = len(display_df)
+    # ✅ 선택된 탭만 계산/전송 (나머지 탭은 비워 둠)
+    for tab, render in zip(tabs, TAB_RENDERERS):
+        with tab:
+            if tab.open:
+                render(df, reports)
 
-            q = (st.session_state.get("tab0_search", "") or "").strip()
 
+def _diagnostics_panel():
+    """사이드바 진단 패널: 최근 실행 단계별 ms / 전송 bytes, 다음 실행 1회 프로파일"""
+    history = st.session_state.get("_diag_traces", [])
+    with st.sidebar.expander("🩺 진단", expanded=True):
+        if st.button("다음 실행 프로파일", help="다음 실행 1회를 cProfile로 기록합니다 (snakeviz/flameprof로 열 수 있는 .prof)"):
+            st.session_state["_diag_profile"] = True
+            st.rerun()
+        if not history:
+            st.caption("기록 없음")
+            return
+
+        # 탭만 다시 실행된 기록은 다음 전체 실행 때 함께 보임 (fragment는 사이드바에 못 씀)
+        st.dataframe(
+            pd.DataFrame([
+                {"시각": time.strftime("%H:%M:%S", time.localtime(t.started_at)), "실행": t.label, "ms": round(t.total_ms, 1)}
+                for t in reversed(history)
+            ]),
+            hide_index=True, use_container_width=True,
+        )
+        for t in reversed(history[-3:]):
+            st.caption(f"{t.label} · {t.total_ms:.1f} ms")
+            st.dataframe(pd.DataFrame(t.rows(), columns=["단계", "ms", "전송 bytes"]), hide_index=True, use_container_width=True)
+
+        profiled = next((t for t in reversed(history) if t.profile_path), None)
+        if profiled is not None:
+            st.caption(f"프로파일: {profiled.profile_path}")
+            try:
+                with open(profiled.profile_path, "rb") as f:
+                    st.download_button("⬇️ .prof", f.read(), file_name=profiled.profile_path.rsplit("/", 1)[-1])
+            except OSError:
+                pass
+            st.code(profiled.profile_top, language=None)
+
+
+@st.fragment
+@_traced_fragment
+def _tab_total_list(df: pd.DataFrame, reports: RenderCache):
+    """탭 0: 전체 목록 (검색/Reset은 이 탭만 다시 실행)"""
+    display_df = df[[COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]]
+    total_n = len(display_df)
+
+    q = (st.session_state.get("tab0_search", "") or "").strip()
+
+    # 스냅샷마다 한 번 만든 검색 색인 조회 (초성 검색, 이름 정확히 일치 우선)
+    with span("search"):
+        filtered_df = display_df.iloc[search_index(df).search(q)] if q else display_df
+
+    # ✅ 화면용 UI는 no-print로 감싸서 인쇄에서 완전 제거
+    st.markdown("<div class='no-print'>", unsafe_allow_html=True)
+
+    col_title, col_tools = st.columns([3, 2], vertical_alignment="bottom")
+    with col_title:
+        st.markdown(
+            f"""
+            <h2 class="no-print" style="font-size:16pt; margin:0;">
+                등록 학생 목록
+                <span style="font-size:11pt; color:#666;">[총 {total_n}명]</span>
+            </h2>
+            """,
+            unsafe_allow_html=True
+        )
+
+    with col_tools:
+        col_reset, col_input = st.columns([1.0, 4.5], vertical_alignment="bottom")
+        with col_reset:
             if q:
-                mask = display_df.apply(
-                    lambda col: col.astype(str).str.contains(q, case=False, na=False)
-                ).any(axis=1)
-                filtered_df = display_df[mask]
+                if st.button("Reset", use_container_width=True):
+                    st.session_state["tab0_search"] = ""
+                    st.rerun(scope="fragment")
             else:
-                filtered_df = display_df
-
-            # ✅ 화면용 UI는 no-print로 감싸서 인쇄에서 완전 제거
-            st.markdown("<div class='no-print'>", unsafe_allow_html=True)
-
-            col_title, col_tools = st.columns([3, 2], vertical_alignment="bottom")
-            with col_title:
-                st.markdown(
-                    f"""
-                    <h2 class="no-print" style="font-size:16pt; margin:0;">
-                        등록 학생 목록
-                        <span style="font-size:11pt; color:#666;">[총 {total_n}명]</span>
-                    </h2>
-                    """,
-                    unsafe_allow_html=True
-                )
-
-            with col_tools:
-                col_reset, col_input = st.columns([1.0, 4.5], vertical_alignment="bottom")
-                with col_reset:
-                    if q:
-                        if st.button("Reset", use_container_width=True):
-                            st.session_state["tab0_search"] = ""
-                            st.rerun()
-                    else:
-                        st.empty()
-
-                with col_input:
-                    st.text_input("", placeholder="🔍 Search", label_visibility="collapsed", key="tab0_search")
-
-            col_left_blank, col_right_msg = st.columns([3, 2])
-            with col_right_msg:
-                col_reset_spacer, col_msg = st.columns([1.0, 4.5])
-                with col_reset_spacer:
-                    st.empty()
-                with col_msg:
-                    q_now = (st.session_state.get("tab0_search", "") or "").strip()
-                    msg = f"'{q_now}' 검색 결과: {len(filtered_df)}명" if q_now else "&nbsp;"
-                    
-                    # 💡 div 안에 class='no-print' 를 추가
-                    st.markdown(
-                        f"<div class='no-print' style='font-size:12px;color:#666;text-align:left;margin-top:-6px;min-height:18px;'>{msg}</div>",
-                        unsafe_allow_html=True
-                    )
-
-            st.markdown("<div style='height:6px;'></div>", unsafe_allow_html=True)
-
-            height = len(filtered_df) * 35 + 40
-            st.dataframe(filtered_df, use_container_width=True, hide_index=True, height=height)
-
-            st.markdown("</div>", unsafe_allow_html=True)  # ✅ no-print 닫기
-
-            # ✅ 인쇄 전용(제목+표)만 남김
-            # 💡 인쇄용 검색 결과 텍스트 생성 (없으면 빈칸)
+                st.empty()
+
+        with col_input:
+            st.text_input("", placeholder="🔍 Search", label_visibility="collapsed", key="tab0_search")
 
+    col_left_blank, col_right_msg = st.columns([3, 2])
+    with col_right_msg:
+        col_reset_spacer, col_msg = st.columns([1.0, 4.5])
+        with col_reset_spacer:
+            st.empty()
+        with col_msg:
             q_now = (st.session_state.get("tab0_search", "") or "").strip()
-            print_msg = f"'{q_now}' 검색 결과: {len(filtered_df)}명" if q_now else ""
+            msg = f"'{q_now}' 검색 결과: {len(filtered_df)}명" if q_now else "&nbsp;"
 
+            # 💡 div 안에 class='no-print' 를 추가
             st.markdown(
-                f"""
-                <div class="tab0-print-root">
-                    <div class="tab0-print-header">
-                        <h2 class="tab0-print-title">
-                            등록 학생 목록 <span class="tab0-print-count">[총 {total_n}명]</span>
-                        </h2>
-                        <div class="tab0-print-search-msg">{print_msg}</div>
-                    </div>
-                    {generate_total_list_html(filtered_df)}
-                </div>
-                """,
+                f"<div class='no-print' style='font-size:12px;color:#666;text-align:left;margin-top:-6px;min-height:18px;'>{msg}</div>",
                 unsafe_allow_html=True
             )
 
-    # 탭 1
-    with tab_list[1]:
-        if not df.empty:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                m1 = st.text_input("제목(연/월)", value=now_kst().strftime("%Y.%m"), key="m1")
-            with col2:
-                show_school_t1 = st.checkbox("학교명 표시", value=True, key="chk_school_m1")
-                show_count_t1 = st.checkbox("학교별 인원수 표시", value=True, key="chk_count_m1")
+    st.markdown("<div style='height:6px;'></div>", unsafe_allow_html=True)
+
+    # ✅ 현재 페이지 행만 브라우저로 전송 (검색어가 바뀌면 1페이지로)
+    n_pages = max(1, -(-len(filtered_df) // ROSTER_PAGE_SIZE))
+    if st.session_state.get("tab0_page_q") != q or st.session_state.get("tab0_page", 1) > n_pages:
+        st.session_state["tab0_page"] = 1
+    st.session_state["tab0_page_q"] = q
+
+    page = st.session_state.get("tab0_page", 1)
+    start = (page - 1) * ROSTER_PAGE_SIZE
+    page_df = filtered_df.iloc[start:start + ROSTER_PAGE_SIZE]
+
+    height = len(page_df) * 35 + 40
+    with span("roster.dataframe") as s:
+        st.dataframe(s.payload(page_df), use_container_width=True, hide_index=True, height=height)
+
+    col_pager, col_range, col_print = st.columns([1.2, 2.8, 1.5], vertical_alignment="center")
+    with col_pager:
+        st.number_input(
+            "페이지", min_value=1, max_value=n_pages, step=1,
+            key="tab0_page", label_visibility="collapsed",
+        )
+    with col_range:
+        shown = f"{start + 1}–{start + len(page_df)}" if len(page_df) else "0"
+        st.caption(f"{shown} / {len(filtered_df)}명 · {page}/{n_pages} 페이지")
+    with col_print:
+        print_view = st.toggle("🖨️ 인쇄용 목록", key="tab0_print", help="켜면 검색 결과 전체를 인쇄용 표로 준비합니다.")
+
+    st.markdown("</div>", unsafe_allow_html=True)  # ✅ no-print 닫기
+
+    # ✅ 인쇄 전용(제목+표)은 인쇄용 목록을 켰을 때만 생성/전송 (전체 검색 결과)
+    if not print_view:
+        return
+
+    # 💡 인쇄용 검색 결과 텍스트 생성 (없으면 빈칸)
+    q_now = (st.session_state.get("tab0_search", "") or "").strip()
+    print_msg = f"'{q_now}' 검색 결과: {len(filtered_df)}명" if q_now else ""
+
+    # 검색 결과는 SearchIndex와 같이 정규화한 검색어로 결정 ('Kim'/'kim'은 같은 목록)
+    with span("total_list.render"):
+        body = reports.render(generate_total_list_html, filtered_df, fingerprint=(frame_fingerprint(df), q.lower()))
+    _markdown(
+        "total_list.markdown",
+        f"""
+        <div class="tab0-print-root">
+            <div class="tab0-print-header">
+                <h2 class="tab0-print-title">
+                    등록 학생 목록 <span class="tab0-print-count">[총 {total_n}명]</span>
+                </h2>
+                <div class="tab0-print-search-msg">{print_msg}</div>
+            </div>
+            {body}
+        </div>
+        """,
+    )
 
-            st.markdown(
-                f"<div class='a4-print-box'><div class='report-view'>{generate_table1(df, show_school_t1, show_count_t1, m1)}</div></div>",
-                unsafe_allow_html=True,
-            )
 
-    # 탭 2
-    with tab_list[2]:
-        if not df.empty:
-            m2 = st.text_input("하단 표기", value=now_kst().strftime("%Y-%m"), key="m2")
-            st.markdown(f"<div class='a4-print-box'><div class='report-view'>{generate_table2(df, m2)}</div></div>", unsafe_allow_html=True)
-
-    # 탭 3
-    with tab_list[3]:
-        if not df.empty:
-            # ✅ 여기 중요: 배포(UTC)에서도 KST 기준 날짜로 기본값 고정
-            d3 = st.date_input("날짜 선택", value=today_kst())
-
-            weekday = WEEKDAY_ORDER[d3.weekday()]
-            date_key = d3.isoformat()
-            
-            # ✅ day_store 스키마: {(p, skey): {"letter": "A", "absent": False}}
-            day_store = st.session_state["assignments"].setdefault(date_key, {})
-
-            # 해당 요일 + 재원만 (✅ split_days 적용)
-            day_mask = df[COL_DAYS].astype(str).apply(lambda x: weekday in split_days(x))
-            df_day = df[day_mask].copy()
-            df_day = df_day[df_day[COL_STATUS] == "재원"]
-
-            grade_sort_map = {g: i for i, g in enumerate(GRADE_ORDER)}
-
-            # 교시별 학생 목록 (안정 필터)
-            per_period_students = {}
-            for p in [1, 2, 3]:
-                df_p = filter_students_for_day_period(df_day, weekday, p).copy()
-                df_p["_grade_order"] = df_p[COL_GRADE].map(grade_sort_map).fillna(999)
-                df_p = df_p.sort_values(["_grade_order", COL_SCHOOL, COL_NAME])
-                per_period_students[p] = df_p
-
-            # 배정/결석 입력 UI (인쇄 제외) - 엑셀형 최종 확정!
-            with st.expander("📝 배정, 결석 입력", expanded=False):
-                st.caption("💡 배정: 알파벳 1글자 입력 · Enter / 방향키 이동")
-                
-                # 버퍼링 방지용 폼
-                with st.form(key=f"assign_form_{date_key}", clear_on_submit=False):
-                    ec1, ec2, ec3 = st.columns(3)
-                    edited_dfs = {}
-
-                    def render_data_editor(col, p):
-                        with col:
-                            st.markdown(f"**{p}교시**")
-                            df_p = per_period_students.get(p, pd.DataFrame())
-                            if df_p.empty:
-                                st.caption("해당 교시 학생 없음")
-                                return None
-                                
-                            editor_data = []
-                            for _, row in df_p.iterrows():
-                                skey = get_student_key(row)
-                                
-                                current = day_store.get((p, skey), {})
-                                if isinstance(current, str):
-                                    c_let = sanitize_letter(current)
-                                    c_abs = False
-                                else:
-                                    c_let = sanitize_letter(current.get("letter", ""))
-                                    c_abs = bool(current.get("absent", False))
-                                
-                                editor_data.append({
-                                    "_skey": skey,
-                                    "이름": f"{row[COL_NAME]} ({row[COL_SCHOOL]} {row[COL_GRADE]})",
-                                    "배정": c_let,
-                                    "결석": c_abs
-                                })
-                            
-                            df_editor = pd.DataFrame(editor_data)
-                            
-                            # 스크롤 없애기 (자동 높이 계산)
-                            dynamic_height = (len(df_editor) * 35) + 40
-                            
-                            edited_df = st.data_editor(
-                                df_editor,
-                                height=dynamic_height,
-                                column_config={
-                                    "_skey": None, # 숨김 키
-                                    "이름": st.column_config.TextColumn("이름", disabled=True),
-                                    "배정": st.column_config.TextColumn("배정", max_chars=1),
-                                    "결석": st.column_config.CheckboxColumn("결석")
-                                },
-                                hide_index=True,
-                                key=f"editor_{date_key}_{p}",
-                                use_container_width=True
-                            )
-                            return edited_df
-
-                    edited_dfs[1] = render_data_editor(ec1, 1)
-                    edited_dfs[2] = render_data_editor(ec2, 2)
-                    edited_dfs[3] = render_data_editor(ec3, 3)
-
-                    # 적용 버튼
-                    if st.form_submit_button("적용"):
-                        for p in [1, 2, 3]:
-                            df_edited = edited_dfs.get(p)
-                            if df_edited is not None and not df_edited.empty:
-                                for _, row in df_edited.iterrows():
-                                    skey = row["_skey"]
-                                    v_let = row["배정"]
-                                    v_abs = row["결석"]
-                                    
-                                    day_store[(p, skey)] = {
-                                        "letter": sanitize_letter(v_let), 
-                                        "absent": bool(v_abs)
-                                    }
-                        
-                        st.success("출석부에 반영되었습니다.")
-
-            # 출석부 표 렌더링
-            st.markdown(f"<div class='a4-print-box'><div class='report-view'>{generate_table3(df, d3, False, day_store)}</div></div>", unsafe_allow_html=True)
-    # 탭 4
-    with tab_list[4]:
-        if not df.empty:
-            m4 = st.text_input("제목(연/월)", value=now_kst().strftime("%Y.%m"), key="m4")
-            st.markdown(f"<div class='a4-print-box'><div class='report-view'>{generate_table4(df, True, m4)}</div></div>", unsafe_allow_html=True)
\ No newline at end of file
+@st.fragment
+@_traced_fragment
+def _tab_grade_report(df: pd.DataFrame, reports: RenderCache):
+    """탭 1: 학년별 명단"""
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        m1 = st.text_input("제목(연/월)", value=now_kst().strftime("%Y.%m"), key="m1")
+    with col2:
+        show_school_t1 = st.checkbox("학교명 표시", value=True, key="chk_school_m1")
+        show_count_t1 = st.checkbox("학교별 인원수 표시", value=True, key="chk_count_m1")
+
+    with span("table1.render"):
+        body = reports.render(generate_table1, df, show_school_t1, show_count_t1, m1)
+    _markdown("table1.markdown", f"<div class='a4-print-box'><div class='report-view'>{body}</div></div>")
+
+
+@st.fragment
+@_traced_fragment
+def _tab_weekly_table(df: pd.DataFrame, reports: RenderCache):
+    """탭 2: 수업시간 명단"""
+    m2 = st.text_input("하단 표기", value=now_kst().strftime("%Y-%m"), key="m2")
+    with span("table2.render"):
+        body = reports.render(generate_table2, df, m2)
+    _markdown("table2.markdown", f"<div class='a4-print-box'><div class='report-view'>{body}</div></div>")
+
+
+@st.fragment
+@_traced_fragment
+def _tab_attendance(df: pd.DataFrame, reports: RenderCache):
+    """탭 3: 출석부 (날짜 변경/배정 입력은 이 탭만 다시 실행)"""
+    # ✅ 여기 중요: 배포(UTC)에서도 KST 기준 날짜로 기본값 고정
+    d3 = st.date_input("날짜 선택", value=today_kst())
+
+    # 기간 출석부: 날짜를 하나씩 바꿔 가며 인쇄하는 대신 한 번에 묶어서
+    if st.toggle("🗂️ 기간 출석부", key="t3_batch", help="켜면 기간 안의 출석부를 날짜별 한 장씩 묶어 인쇄용으로 만듭니다."):
+        _attendance_packet(df, d3)
+        return
+
+    weekday = WEEKDAY_ORDER[d3.weekday()]
+    date_key = d3.isoformat()
+
+    # ✅ day_table: 날짜 배정 표 (period, skey, letter, absent) (공용 저장소에서 날짜로 조회)
+    store = get_assignment_store()
+    with span("assignments.day_table"):
+        day_table = store.day_table(date_key)
+
+    # 교시별 학생 목록: 해당 요일/교시 + 재원만 (스냅샷 역색인 조회)
+    per_period_students = {}
+    with span("filter_students_for_day_period"):
+        for p in [1, 2, 3]:
+            df_p = filter_students_for_day_period(df, weekday, p)
+            df_p = df_p[df_p[COL_STATUS] == "재원"]
+            df_p = df_p.sort_values([COL_GRADE_ORDER, COL_SCHOOL, COL_NAME])
+            per_period_students[p] = df_p
+
+    # 배정/결석 입력 UI (인쇄 제외) - 엑셀형 최종 확정!
+    with st.expander("📝 배정, 결석 입력", expanded=False):
+        st.caption("💡 배정: 알파벳 1글자 입력 · Enter / 방향키 이동")
+
+        # 버퍼링 방지용 폼
+        with st.form(key=f"assign_form_{date_key}", clear_on_submit=False):
+            ec1, ec2, ec3 = st.columns(3)
+            edited_dfs = {}
+            editor_bases = {}  # 편집 전 상태 (적용 시 비교 기준)
+
+            def render_data_editor(col, p):
+                with col:
+                    st.markdown(f"**{p}교시**")
+                    df_p = per_period_students.get(p, pd.DataFrame())
+                    if df_p.empty:
+                        st.caption("해당 교시 학생 없음")
+                        return None
+
+                    df_editor = editor_frame(df_p, day_table, p)
+                    editor_bases[p] = df_editor
+
+                    # 스크롤 없애기 (자동 높이 계산)
+                    dynamic_height = (len(df_editor) * 35) + 40
+
+                    with span(f"editor{p}.data_editor") as s:
+                        edited_df = st.data_editor(
+                            s.payload(df_editor),
+                            height=dynamic_height,
+                            column_config={
+                                EDITOR_KEY: None, # 숨김 키
+                                EDITOR_NAME: st.column_config.TextColumn("이름", disabled=True),
+                                EDITOR_LETTER: st.column_config.TextColumn("배정", max_chars=1),
+                                EDITOR_ABSENT: st.column_config.CheckboxColumn("결석")
+                            },
+                            hide_index=True,
+                            key=f"editor_{date_key}_{p}",
+                            use_container_width=True
+                        )
+                    return edited_df
+
+            edited_dfs[1] = render_data_editor(ec1, 1)
+            edited_dfs[2] = render_data_editor(ec2, 2)
+            edited_dfs[3] = render_data_editor(ec3, 3)
+
+            # 적용 버튼
+            if st.form_submit_button("적용"):
+                # 바뀐 칸만 기록 (다른 기기에서 고친 칸은 건드리지 않음)
+                changes = {}
+                for p in [1, 2, 3]:
+                    df_edited = edited_dfs.get(p)
+                    if df_edited is not None and not df_edited.empty:
+                        changes.update(editor_changes(p, editor_bases[p], df_edited))
+
+                # 메모리에 즉시 반영, 디스크 기록은 백그라운드
+                store.put(date_key, changes)
+                day_table = store.day_table(date_key)
+                st.success("출석부에 반영되었습니다.")
+
+    # 출석부 표 렌더링
+    with span("table3.render"):
+        body = generate_table3(df, d3, False, day_table)
+    _markdown("table3.markdown", f"<div class='a4-print-box'><div class='report-view'>{body}</div></div>")
+
+
+def _attendance_packet(df: pd.DataFrame, d3):
+    """탭 3 기간 출석부 (기본: 선택한 날짜가 속한 달 전체)"""
+    picked = st.date_input("기간", value=month_bounds(d3), key="t3_range")
+    if not isinstance(picked, (tuple, list)) or len(picked) < 2:
+        st.caption("시작일과 종료일을 선택하세요.")
+        return
+
+    dates = date_range(picked[0], picked[1])
+    store = get_assignment_store()
+    with st.spinner(f"출석부 {len(dates)}장 준비 중..."), span("attendance_packet.render"):
+        packet = attendance_packet(df, dates, False, store.day_table, executor=get_batch_executor())
+    st.caption(f"{dates[0].isoformat()} ~ {dates[-1].isoformat()} · {len(dates)}장")
+    _markdown("attendance_packet.markdown", packet)
+
+
+@st.fragment
+@_traced_fragment
+def _tab_school_report(df: pd.DataFrame, reports: RenderCache):
+    """탭 4: 학교별 명단"""
+    m4 = st.text_input("제목(연/월)", value=now_kst().strftime("%Y.%m"), key="m4")
+    with span("table4.render"):
+        body = reports.render(generate_table4, df, True, m4)
+    _markdown("table4.markdown", f"<div class='a4-print-box'><div class='report-view'>{body}</div></div>")
+
+
+TAB_LABELS = ["전체 목록", "학년별 명단", "수업시간 명단", "출석부", "학교별 명단"]
+TAB_RENDERERS = [_tab_total_list, _tab_grade_report, _tab_weekly_table, _tab_attendance, _tab_school_report]
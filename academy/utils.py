@@ -1,6 +1,6 @@
 # academy/utils.py
 import re
-from typing import List
+from typing import List, Set, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from datetime import date
@@ -38,6 +38,28 @@ def norm(v) -> str:
     return RE_SPACES.sub("", s)
 
 
+def norm_series(sr: pd.Series) -> pd.Series:
+    """Series 전용 정규화: NaN -> '', NBSP/전각공백/모든 공백 제거"""
+    return (
+        sr.fillna("")
+          .astype(str)
+          .str.replace("\u00A0", "", regex=False)  # NBSP
+          .str.replace("\u3000", "", regex=False)  # 전각공백
+          .str.replace(r"\s+", "", regex=True)     # 모든 공백류
+    )
+
+
+def strip_series(sr: pd.Series) -> pd.Series:
+    """Series 전용 정리: NaN -> '', NBSP/전각공백 제거, 양끝 공백 제거 (안쪽 띄어쓰기는 유지)"""
+    return (
+        sr.fillna("")
+          .astype(str)
+          .str.replace("\u00A0", "", regex=False)
+          .str.replace("\u3000", "", regex=False)
+          .str.strip()
+    )
+
+
 def split_days(days_str: str) -> List[str]:
     """'월,수' -> ['월','수'] (공백 제거 포함)"""
     s = norm(days_str)
@@ -86,10 +108,37 @@ def match_attendance(days_str, periods_str, target_day, target_period) -> bool:
     return str(target_period) in [str(n) for n in extract_period_numbers(pstr)]
 
 
-def format_student_name(name, school, grade, pause_mark=""):
+def school_grade_label(school, grade) -> str:
+    """'서울초' + '초3' -> '서울초3' (학교 끝 글자와 학년 첫 글자가 같으면 한 번만)"""
     s_str, g_str = str(school).strip(), str(grade).strip()
-    school_grade = s_str + (g_str[1:] if s_str and g_str and s_str[-1] == g_str[0] else g_str)
-    return f"{name}({school_grade}){pause_mark}"
+    return s_str + (g_str[1:] if s_str and g_str and s_str[-1] == g_str[0] else g_str)
+
+
+def attendance_slots(days_str, periods_str) -> Set[Tuple[str, int]]:
+    """
+    match_attendance와 같은 규칙으로 한 학생의 (요일, 교시) 칸을 한 번에 계산.
+    (d, p) in attendance_slots(...) == match_attendance(..., d, p)  (p는 int)
+    """
+    days = split_days(days_str)
+    pstr = norm(periods_str)
+    if not days or not pstr:
+        return set()
+
+    if periods_has_day_markers(pstr):
+        out: Set[Tuple[str, int]] = set()
+        for tok in [x for x in pstr.split(",") if x]:
+            for d in days:
+                rest = tok[len(d):]
+                if tok.startswith(d) and rest.isdecimal() and str(int(rest)) == rest:
+                    out.add((d, int(rest)))
+        return out
+
+    nums = extract_period_numbers(pstr)
+    return {(d, n) for d in days for n in nums}
+
+
+def format_student_name(name, school, grade, pause_mark=""):
+    return f"{name}({school_grade_label(school, grade)}){pause_mark}"
 
 
 def get_student_key(row: pd.Series) -> str:
@@ -110,4 +159,10 @@ def sanitize_letter(v: str) -> str:
     if not s:
         return ""
     ch = s[0]
-    return ch if ("A" <= ch <= "Z") else ""
\ No newline at end of file
+    return ch if ("A" <= ch <= "Z") else ""
+
+
+def sanitize_letters(sr: pd.Series) -> pd.Series:
+    """sanitize_letter 벡터 버전 (빈 칸/None/NaN -> "")"""
+    first = sr.astype(object).where(sr.notna(), "").astype(str).str.strip().str.upper().str[:1]
+    return first.where(first.str.fullmatch(r"[A-Z]"), "")
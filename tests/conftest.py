@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# 저장소 루트에서 `pytest`로 바로 돌려도 academy 패키지를 찾도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
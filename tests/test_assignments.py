@@ -0,0 +1,115 @@
+# tests/test_assignments.py
+# 출석부 배정 저장소 (write-behind): 메모리 즉시 반영, 디스크 기록, 날짜 캐시 밀어내기/다시 읽기
+import string
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from academy.assignments import AssignmentStore, assignment_table
+
+DAY = "2026-10-14"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "assignments.sqlite3")
+
+
+def _store(path, **kwargs) -> AssignmentStore:
+    # 백그라운드 기록은 테스트가 직접 flush()로 대신 (주기를 길게)
+    return AssignmentStore(path=path, flush_interval=3600, **kwargs)
+
+
+def _sorted_table(table: pd.DataFrame) -> pd.DataFrame:
+    return table.sort_values(["period", "skey"]).reset_index(drop=True)
+
+
+def test_put_flush_reload(path):
+    store = _store(path)
+    store.put(DAY, {(1, "id:1"): {"letter": "A", "absent": False}, (2, "id:2"): {"letter": "b", "absent": True}})
+    assert store.pending == 2
+    assert store.flush() == 2
+    assert store.pending == 0
+
+    fresh = _store(path)
+    assert fresh.day(DAY) == {(1, "id:1"): {"letter": "A", "absent": False}, (2, "id:2"): {"letter": "B", "absent": True}}
+    assert fresh.day("2026-10-15") == {}
+
+
+def test_delete(path):
+    store = _store(path)
+    store.put(DAY, {(1, "id:1"): {"letter": "A", "absent": False}, (1, "id:2"): {"letter": "B", "absent": False}})
+    store.flush()
+
+    # 글자도 결석도 없는 칸 = 삭제 (메모리에서 바로, 디스크는 flush 때)
+    store.put(DAY, {(1, "id:1"): {"letter": "", "absent": False}})
+    assert (1, "id:1") not in store.day(DAY)
+    store.flush()
+    assert _store(path).day(DAY) == {(1, "id:2"): {"letter": "B", "absent": False}}
+
+
+def test_pending_merged_into_day_table_before_flush(path):
+    store = _store(path)
+    store.put(DAY, {(1, "id:1"): {"letter": "A", "absent": False}})
+    store.flush()
+
+    # 새 인스턴스: 디스크 값 + 아직 기록 안 된 변경이 합쳐져 보여야 함 (pending 우선)
+    other = _store(path)
+    other.put(DAY, {(1, "id:1"): {"letter": "C", "absent": False}, (3, "id:9"): {"letter": "", "absent": True}})
+    assert other.pending == 2
+    table = _sorted_table(other.day_table(DAY))
+    assert table.to_dict("records") == [
+        {"period": 1, "skey": "id:1", "letter": "C", "absent": False},
+        {"period": 3, "skey": "id:9", "letter": "", "absent": True},
+    ]
+    # 기록 전 디스크는 그대로
+    assert _store(path).day(DAY) == {(1, "id:1"): {"letter": "A", "absent": False}}
+
+
+def test_max_days_eviction_and_lazy_reload(path):
+    store = _store(path, max_days=2)
+    days = ["2026-10-12", "2026-10-13", "2026-10-14", "2026-10-15"]
+    for i, d in enumerate(days):
+        store.put(d, {(1, "id:1"): {"letter": string.ascii_uppercase[i], "absent": False}})
+        store.day(d)
+    assert store.usage()["days_cached"] == 2
+
+    # 밀려난 날짜 (아직 flush 전): pending에서 다시 구성
+    assert store.day(days[0]) == {(1, "id:1"): {"letter": "A", "absent": False}}
+    store.flush()
+
+    # 기록 후 밀려난 날짜: 디스크에서 다시 읽음
+    for d in days[1:]:
+        store.day(d)
+    assert days[0] not in store._days
+    assert store.day(days[0]) == {(1, "id:1"): {"letter": "A", "absent": False}}
+    assert store.usage()["days_cached"] == 2
+
+
+def test_uint8_codes_round_trip(path):
+    store = _store(path)
+    changes = {
+        (p, f"id:{i}"): {"letter": letter, "absent": absent}
+        for i, (letter, absent) in enumerate(
+            (letter, absent) for letter in ["", *string.ascii_uppercase] for absent in (False, True)
+        )
+        for p in (1, 2, 3)
+        if letter or absent
+    }
+    store.put(DAY, changes)
+    for ids, codes in store._day_slots(DAY).values():
+        assert codes.dtype == np.uint8
+    assert store.day(DAY) == changes
+
+    store.flush()
+    fresh = _store(path)
+    assert fresh.day(DAY) == changes
+    pd.testing.assert_frame_equal(_sorted_table(fresh.day_table(DAY)), _sorted_table(assignment_table(changes)))
+
+
+def test_memory_only_store():
+    store = AssignmentStore()
+    store.put(DAY, {(1, "id:1"): {"letter": "A", "absent": False}})
+    assert store.day(DAY) == {(1, "id:1"): {"letter": "A", "absent": False}}
+    assert store.flush() == 0
@@ -0,0 +1,81 @@
+# tests/test_prefetch.py
+# RosterPrefetcher.tick: 실패 기록/재시도 시각, 성공 후 보고서 준비(warm)
+import time
+
+import pytest
+
+from academy.bench import synthetic_roster
+from academy.prefetch import RosterPrefetcher
+from academy.sync import HeaderMismatchError, RosterSync
+
+
+class FakeSheet:
+    def __init__(self, header, rows):
+        self.header = header
+        self.rows = rows
+        self.version = "v1"
+        self.error = None
+
+    def get_lastUpdateTime(self):
+        if self.error is not None:
+            raise self.error
+        return self.version
+
+    def worksheet(self, title):
+        return self
+
+    def get_all_records(self):
+        return [dict(zip(self.header, row)) for row in self.rows]
+
+
+@pytest.fixture
+def sheet():
+    header, cols = synthetic_roster(50, seed=1)
+    return FakeSheet(header, [list(r) for r in zip(*cols)])
+
+
+def _prefetcher(sheet, warmed, **kwargs):
+    engine = RosterSync(fetch_mode="records")
+    return RosterPrefetcher(engine, lambda: sheet, "students", ttl=300, lead=30, retry_delay=60,
+                            warm=warmed.append, **kwargs)
+
+
+def test_tick_success_warms(sheet):
+    warmed = []
+    pf = _prefetcher(sheet, warmed)
+    pf.tick()
+    assert pf.last_error is None and pf.engine.last_error is None
+    assert len(warmed) == 1 and warmed[0] is pf.engine.frame
+    assert pf.next_due() == pytest.approx(pf.engine.synced_at + 270)
+
+
+@pytest.mark.parametrize("error", [ConnectionError("시트 연결 실패"), HeaderMismatchError(["상태"], ["이름"])])
+def test_tick_failure_records_error_and_retries_later(sheet, error):
+    warmed = []
+    pf = _prefetcher(sheet, warmed)
+    sheet.error = error
+    before = time.monotonic()
+    pf.tick()  # 예외를 밖으로 던지지 않음 (백그라운드 스레드가 죽지 않게)
+
+    # 세션(load_data)이 보는 engine.last_error에도 같은 오류 (헤더 오류는 헤더 안내로 구분됨)
+    assert pf.last_error is error and pf.engine.last_error is error
+    assert warmed == []
+    assert pf.next_due() >= before + 60  # retry_delay 전에는 다시 확인하지 않음
+
+    # 회복하면 오류가 지워지고 보고서를 준비
+    sheet.error = None
+    pf.tick()
+    assert pf.last_error is None and pf.engine.last_error is None
+    assert len(warmed) == 1
+    assert pf.runs == 2
+
+
+def test_tick_warm_failure_is_recorded_not_raised(sheet):
+    def broken_warm(frame):
+        raise RuntimeError("보고서 준비 실패")
+
+    pf = RosterPrefetcher(RosterSync(fetch_mode="records"), lambda: sheet, "students", ttl=300, warm=broken_warm)
+    pf.tick()
+    assert isinstance(pf.last_error, RuntimeError)
+    assert pf.engine.last_error is None  # 명단 자체는 정상 (세션에 연결 경고를 띄우지 않음)
+    assert not pf.engine.frame.empty
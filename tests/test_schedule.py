@@ -0,0 +1,96 @@
+# tests/test_schedule.py
+# ScheduleIndex / filter_students_for_day_period 차등 테스트: 역색인 이전의 정규식 판정과 같은 학생을 돌려주는지
+import random
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from academy.config import COL_NAME, COL_DAYS, COL_PERIOD, WEEKDAY_ORDER
+from academy.filters import filter_students_for_day_period
+from academy.utils import norm_series
+from academy.schedule import ScheduleIndex, schedule_index
+
+PERIODS = range(-1, 13)
+
+_DAY_FORMS = ["월", "월,수", "화,목", "월, 수", " 월,수 ", "월 ,　금", "월,,수", ",화", "수,", "토,일", "월수", ""]
+_PERIOD_FORMS = [
+    "월1", "월1,수2", "월 1, 수 2", "화2,목3", "월01", "월1,1", "월12", "수3,", ",금1", "월-1", "월1수2",
+    "1", "1,2,3", "1 2 3", "1/2/3", "10,11", "2-3", "-1", "03", "1 2", "3　", "12", "", "교시 2",
+]
+
+
+def messy_roster(n: int, seed: int) -> pd.DataFrame:
+    """고정 seed 명단 (등원요일/수업교시에 공백/NBSP/전각공백/빈 토큰/NaN 섞임, 정규화 전)"""
+    r = random.Random(seed)
+    days, periods = [], []
+    for _ in range(n):
+        days.append(np.nan if r.random() < .03 else r.choice(_DAY_FORMS))
+        periods.append(np.nan if r.random() < .03 else r.choice(_PERIOD_FORMS))
+    return pd.DataFrame({
+        COL_NAME: [f"학생{i}" for i in range(n)],
+        COL_DAYS: pd.Series(days, dtype=object),
+        COL_PERIOD: pd.Series(periods, dtype=object),
+    })
+
+
+def baseline_mask(df: pd.DataFrame, weekday: str, period: int) -> pd.Series:
+    """역색인 이전 filter_students_for_day_period의 정규식 판정 (비교 기준)"""
+    days = norm_series(df[COL_DAYS])
+    pstr = norm_series(df[COL_PERIOD])
+
+    mask_day = days.str.contains(rf"(?:^|,){re.escape(weekday)}(?:,|$)", regex=True, na=False)
+    marker_pat = "(?:" + "|".join(map(re.escape, WEEKDAY_ORDER)) + ")"
+    has_marker = pstr.str.contains(marker_pat, regex=True, na=False)
+    mask_marker = pstr.str.contains(rf"(?:^|,){re.escape(weekday)}{int(period)}(?:,|$)", regex=True, na=False)
+    mask_numeric = pstr.str.contains(rf"(?<!\d){int(period)}(?!\d)", regex=True, na=False)
+    return mask_day & ((has_marker & mask_marker) | ((~has_marker) & mask_numeric))
+
+
+@pytest.fixture(scope="module", params=[0, 1, 2])
+def roster(request) -> pd.DataFrame:
+    return messy_roster(600, seed=request.param)
+
+
+def test_index_matches_regex(roster):
+    index = ScheduleIndex.build(roster)
+    for weekday in WEEKDAY_ORDER:
+        for period in PERIODS:
+            expected = np.flatnonzero(baseline_mask(roster, weekday, period).to_numpy())
+            np.testing.assert_array_equal(index.positions(weekday, period), expected, err_msg=f"{weekday}{period}")
+
+
+def test_filter_matches_regex(roster):
+    for weekday in WEEKDAY_ORDER:
+        for period in PERIODS:
+            got = filter_students_for_day_period(roster, weekday, period)
+            expected = roster.loc[baseline_mask(roster, weekday, period)]
+            pd.testing.assert_frame_equal(got, expected)
+
+
+def test_day_positions(roster):
+    index = ScheduleIndex.build(roster)
+    days = norm_series(roster[COL_DAYS])
+    for weekday in WEEKDAY_ORDER:
+        expected = np.flatnonzero(days.str.contains(rf"(?:^|,){weekday}(?:,|$)", regex=True).to_numpy())
+        np.testing.assert_array_equal(index.day_positions(weekday), expected)
+
+
+def test_normalized_input_same_result(roster):
+    normalized = roster.assign(**{COL_DAYS: norm_series(roster[COL_DAYS]), COL_PERIOD: norm_series(roster[COL_PERIOD])})
+    raw, clean = ScheduleIndex.build(roster), ScheduleIndex.build(normalized)
+    for weekday in WEEKDAY_ORDER:
+        for period in PERIODS:
+            np.testing.assert_array_equal(raw.positions(weekday, period), clean.positions(weekday, period))
+
+
+def test_index_cached_per_frame(roster):
+    assert schedule_index(roster) is schedule_index(roster)
+    assert schedule_index(roster.copy()) is not schedule_index(roster)
+
+
+def test_empty_frame():
+    empty = messy_roster(0, seed=0)
+    assert filter_students_for_day_period(empty, "월", 1).empty
+    assert len(ScheduleIndex.build(empty).positions("월", 1)) == 0
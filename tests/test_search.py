@@ -0,0 +1,111 @@
+# tests/test_search.py
+# SearchIndex 차등 테스트: 색인 이전의 단순 부분 문자열 검색(대소문자 무시)과 같은 행을 같은 순서로 돌려주는지
+import random
+
+import numpy as np
+import pytest
+
+from academy.bench import synthetic_roster
+from academy.config import COL_NAME, COL_SCHOOL
+from academy.search import CHOSUNG_COLUMNS, SEARCH_COLUMNS, SearchIndex, search_index, to_chosung
+from academy.sync import RosterSync
+
+# 대소문자 섞인 이름/학교 (합성 명단은 한글뿐)
+MIXED = {
+    COL_NAME: ["Kim Minsu", "KIM", "kim", "Lee Ann", "이Ann"],
+    COL_SCHOOL: ["SeoulHS", "seoul고", "A&B고", "", "Seoul중"],
+}
+
+
+@pytest.fixture(scope="module")
+def df():
+    header, cols = synthetic_roster(400, seed=11)
+    for col, values in MIXED.items():
+        cols[header.index(col)][:len(values)] = values
+    return RosterSync().apply(header, cols)
+
+
+def baseline(df, q: str) -> np.ndarray:
+    """단순 검색: 정규화한 검색어를 포함하는 행, 이름이 정확히 같은 행을 맨 앞에"""
+    q = q.strip().lower()
+    if not q:
+        return np.arange(len(df))
+    chosung = all(ch in "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ" for ch in q)
+    cols = CHOSUNG_COLUMNS if chosung else SEARCH_COLUMNS
+
+    mask = np.zeros(len(df), dtype=bool)
+    for c in cols:
+        values = df[c].astype(str).str.lower()
+        if chosung:
+            values = values.map(to_chosung)
+        mask |= values.str.contains(q, regex=False).to_numpy(dtype=bool)
+    exact = (df[COL_NAME].astype(str).str.lower() == q).to_numpy(dtype=bool)
+    return np.concatenate([np.flatnonzero(exact), np.flatnonzero(mask & ~exact)])
+
+
+def _queries(df, seed: int, n: int) -> list:
+    """명단 값에서 잘라낸 1~4글자 조각 (대소문자/앞뒤 공백 섞어서)"""
+    r = random.Random(seed)
+    out = []
+    for _ in range(n):
+        v = str(df[r.choice(SEARCH_COLUMNS)].iat[r.randrange(len(df))])
+        if not v:
+            continue
+        i = r.randrange(len(v))
+        q = v[i:i + r.randint(1, 4)]
+        q = q.upper() if r.random() < .3 else q
+        out.append(f" {q} " if r.random() < .2 else q)
+    return out
+
+
+def _check(df, q: str) -> None:
+    got = search_index(df).search(q)
+    np.testing.assert_array_equal(got, baseline(df, q), err_msg=repr(q))
+
+
+def test_substring_queries(df):
+    for q in _queries(df, seed=5, n=300):
+        _check(df, q)
+
+
+@pytest.mark.parametrize("q", ["kim", "KIM", "Kim", "seoul", "SEOUL고", "ann", "이a", "a&b", "&", "  "])
+def test_case_insensitive(df, q):
+    _check(df, q)
+
+
+def test_exact_name_first(df):
+    got = search_index(df).search("KIM")
+    assert set(got[:2].tolist()) == {1, 2}  # 'KIM', 'kim'
+    assert 0 in got[2:].tolist()  # 'Kim Minsu'는 부분 일치 -> 뒤쪽
+
+
+def test_one_char_queries(df):
+    chars = {ch for c in SEARCH_COLUMNS for v in df[c].astype(str) for ch in v.lower()}
+    for q in sorted(chars):
+        _check(df, q)
+
+
+def test_chosung_queries(df):
+    names = df[COL_NAME].astype(str).tolist()
+    schools = df[COL_SCHOOL].astype(str).tolist()
+    queries = {to_chosung(v) for v in names[:40] + schools[:40] if v}
+    queries |= {q[:2] for q in queries} | {q[-2:] for q in queries} | {"ㄱ", "ㅁㅅ", "ㄲ", "ㅎㅎㅎㅎ"}
+    for q in sorted(queries):
+        if all("ㄱ" <= ch <= "ㅎ" for ch in q):
+            _check(df, q)
+
+    # 초성 검색은 이름/학교만 (초성만 입력하면 다른 컬럼은 보지 않음)
+    got = search_index(df).search(to_chosung(names[10]))
+    assert 10 in got.tolist()
+
+
+@pytest.mark.parametrize("q", ["없는학생", "zzzz", "ㅃㅃㅃ", "김민수수수수", "고9", " 없음"])
+def test_no_match(df, q):
+    assert len(baseline(df, q)) == 0
+    assert len(search_index(df).search(q)) == 0
+
+
+def test_empty_index():
+    idx = SearchIndex.build(None)
+    assert len(idx.search("")) == 0
+    assert len(idx.search("김")) == 0
@@ -0,0 +1,76 @@
+# tests/test_sheets.py
+# SheetsClientManager 핸들 캐시: 오류 후 무효화, 느린 열기가 다른 호출을 막지 않는지
+import threading
+
+import pytest
+from gspread.exceptions import WorksheetNotFound
+
+from academy.sheets import SheetsClientManager
+
+
+class FakeSheet:
+    def __init__(self, key: str, tabs):
+        self.id = key
+        self.tabs = set(tabs)
+
+    def worksheet(self, title: str):
+        if title not in self.tabs:
+            raise WorksheetNotFound(title)
+        return (self.id, title)
+
+
+class FakeClient:
+    def __init__(self):
+        self.opens = 0
+        self.sheets = {"a": FakeSheet("a", ["students"]), "b": FakeSheet("b", ["students"])}
+        self.gate = {}  # key -> Event (열기를 붙잡아 두는 용도)
+
+    def open_by_key(self, key: str):
+        self.opens += 1
+        if key in self.gate:
+            self.gate[key].wait(5)
+        return self.sheets[key]
+
+
+def _manager(client: FakeClient) -> SheetsClientManager:
+    return SheetsClientManager(lambda: client, read_quota_per_min=1000, sleep=lambda s: None)
+
+
+def test_handles_cached():
+    client = FakeClient()
+    manager = _manager(client)
+    manager.spreadsheet(key="a").worksheet("students")
+    manager.spreadsheet(key="a").worksheet("students")
+    assert client.opens == 1
+
+
+def test_missing_worksheet_invalidates_cache():
+    client = FakeClient()
+    manager = _manager(client)
+    sh = manager.spreadsheet(key="a")
+    sh.worksheet("students")
+
+    # 탭 이름이 바뀜: 캐시한 스프레드시트/탭 핸들을 버리고 다음 호출에서 다시 엶
+    client.sheets["a"] = FakeSheet("a", ["학생"])
+    with pytest.raises(WorksheetNotFound):
+        sh.worksheet("학생2")
+    assert manager.spreadsheet(key="a").worksheet("학생")._ws == ("a", "학생")
+    assert client.opens == 2
+
+
+def test_slow_open_does_not_block_other_sheets():
+    client = FakeClient()
+    manager = _manager(client)
+    manager.client  # 인증 클라이언트는 미리 생성
+    client.gate["a"] = threading.Event()
+
+    slow = threading.Thread(target=manager.spreadsheet, kwargs={"key": "a"})
+    slow.start()
+    try:
+        done = threading.Event()
+        other = threading.Thread(target=lambda: (manager.spreadsheet(key="b"), done.set()))
+        other.start()
+        assert done.wait(2), "느린 열기 동안 다른 스프레드시트를 열지 못함"
+    finally:
+        client.gate["a"].set()
+        slow.join()
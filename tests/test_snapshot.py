@@ -0,0 +1,48 @@
+# tests/test_snapshot.py
+# 명단 스냅샷 저장/복원 (여러 프로세스가 같은 경로에 동시에 저장하는 경우 포함)
+import multiprocessing
+import os
+
+import pandas as pd
+
+from academy.snapshot import save_snapshot, load_snapshot
+
+
+def _frame(tag: str, n: int = 2000):
+    keyed = pd.DataFrame({"이름": [f"{tag}{i}" for i in range(n)], "상태": ["재원"] * n}, index=[f"k{i}" for i in range(n)])
+    sigs = pd.Series(range(n), index=keyed.index, dtype="int64")
+    return keyed, sigs
+
+
+def _writer(path: str, tag: str, rounds: int) -> None:
+    keyed, sigs = _frame(tag)
+    for _ in range(rounds):
+        save_snapshot(path, keyed, sigs, tag)
+
+
+def test_roundtrip(tmp_path):
+    path = str(tmp_path / "roster.sqlite3")
+    keyed, sigs = _frame("a")
+    save_snapshot(path, keyed, sigs, "v1")
+    got_keyed, got_sigs, version = load_snapshot(path)
+    pd.testing.assert_frame_equal(got_keyed, keyed, check_dtype=False)
+    assert got_sigs.tolist() == sigs.tolist()
+    assert version == "v1"
+    assert os.listdir(tmp_path) == ["roster.sqlite3"]  # 임시 파일이 남지 않음
+
+
+def test_concurrent_writers_leave_whole_snapshot(tmp_path):
+    path = str(tmp_path / "roster.sqlite3")
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_writer, args=(path, tag, 15)) for tag in ("app", "cli")]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(120)
+        assert p.exitcode == 0
+
+    keyed, sigs, version = load_snapshot(path)
+    # 어느 쪽이 마지막이든 한 프로세스가 쓴 내용 전체여야 함 (섞이거나 깨지지 않음)
+    assert version in ("app", "cli")
+    pd.testing.assert_frame_equal(keyed, _frame(version)[0], check_dtype=False)
+    assert os.listdir(tmp_path) == ["roster.sqlite3"]
@@ -0,0 +1,257 @@
+# tests/test_sync.py
+# RosterSync 증분 반영: 바뀐 행만 다시 정규화해도 매번 처음부터 만든 명단과 같아야 함
+import csv
+import os
+import random
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from academy import sync as sync_module
+from academy.bench import synthetic_roster
+from academy.config import COL_ID, COL_NAME, COL_PERIOD
+from academy.local_sheets import LocalSheetsClient
+from academy.render_cache import frame_fingerprint
+from academy.sync import RosterSync
+
+
+def _rows(cols):
+    return [list(r) for r in zip(*cols)]
+
+
+def _cols(rows):
+    return [list(c) for c in zip(*rows)]
+
+
+def assert_same_as_full(engine: RosterSync, header, rows):
+    """engine에 증분 반영한 결과 == 새 엔진에 한 번에 반영한 결과 (명단 + 보고서 캐시 지문)"""
+    got = engine.apply(header, _cols(rows))
+    expected = RosterSync().apply(header, _cols(rows))
+    pd.testing.assert_frame_equal(got, expected)
+    assert frame_fingerprint(got) == frame_fingerprint(expected)
+
+
+@pytest.fixture
+def roster():
+    header, cols = synthetic_roster(300, seed=3)
+    return header, _rows(cols)
+
+
+@pytest.fixture
+def normalized_rows(monkeypatch):
+    """normalize_roster가 다시 정규화한 행 수 기록"""
+    calls = []
+    original = sync_module.normalize_roster
+
+    def counting(df):
+        calls.append(len(df))
+        return original(df)
+
+    monkeypatch.setattr(sync_module, "normalize_roster", counting)
+    return calls
+
+
+def test_incremental_edits_deletes_reorders_inserts(roster, normalized_rows):
+    header, rows = roster
+    r = random.Random(0)
+    pi, ni, ii = header.index(COL_PERIOD), header.index(COL_NAME), header.index(COL_ID)
+    engine = RosterSync()
+    assert_same_as_full(engine, header, rows)
+
+    # 수정: 바뀐 행만 다시 정규화
+    for i in r.sample(range(len(rows)), 15):
+        rows[i][pi] = "월1,수3" if rows[i][pi] != "월1,수3" else "2"
+        rows[i][ni] = rows[i][ni] + " "
+    normalized_rows.clear()
+    assert_same_as_full(engine, header, rows)
+    assert normalized_rows[0] == 15  # 첫 호출이 증분 엔진, 두 번째는 비교용 새 엔진
+
+    # 삭제
+    for i in sorted(r.sample(range(len(rows)), 10), reverse=True):
+        del rows[i]
+    assert_same_as_full(engine, header, rows)
+
+    # 순서만 변경
+    r.shuffle(rows)
+    assert_same_as_full(engine, header, rows)
+
+    # 추가 (새 ID / 빈 ID)
+    for k in range(20):
+        new = list(rows[r.randrange(len(rows))])
+        new[ii] = "" if k % 5 == 0 else 10_000 + k
+        new[ni] = f"신입{k}"
+        rows.insert(r.randrange(len(rows) + 1), new)
+    assert_same_as_full(engine, header, rows)
+
+    # 변경 없음: 다시 정규화하지 않음
+    normalized_rows.clear()
+    assert_same_as_full(engine, header, rows)
+    assert normalized_rows == [len(rows)]  # 비교용 새 엔진 1번만
+
+
+def test_duplicate_ids(roster):
+    header, rows = roster
+    ii, ni = header.index(COL_ID), header.index(COL_NAME)
+    engine = RosterSync()
+    assert_same_as_full(engine, header, rows)
+
+    # 같은 ID가 여러 번: 등장 순서대로 #n 키
+    for i in (10, 20, 30):
+        rows[i][ii] = rows[5][ii] = 777
+    assert_same_as_full(engine, header, rows)
+
+    # 중복 중 두 번째 행만 수정, 그다음 첫 번째 행 삭제 (뒤 행들의 #n이 당겨짐)
+    rows[20][ni] = "중복수정"
+    assert_same_as_full(engine, header, rows)
+    del rows[5]
+    assert_same_as_full(engine, header, rows)
+
+    # ID 공백/NBSP 차이는 같은 ID
+    rows[10][ii] = " 777 "
+    assert_same_as_full(engine, header, rows)
+
+
+def test_header_change_rebuilds(roster):
+    header, rows = roster
+    engine = RosterSync()
+    assert_same_as_full(engine, header, rows)
+
+    # 관리용 컬럼 추가
+    header2 = header + ["메모"]
+    rows2 = [row + [f"m{i}"] for i, row in enumerate(rows)]
+    assert_same_as_full(engine, header2, rows2)
+
+    # 컬럼 순서 변경 + 헤더 공백
+    order = list(reversed(range(len(header2))))
+    header3 = [" " + header2[i] for i in order]
+    rows3 = [[row[i] for i in order] for row in rows2]
+    assert_same_as_full(engine, header3, rows3)
+
+    # 원래 헤더로 복귀
+    assert_same_as_full(engine, header, rows)
+
+
+def test_empty_then_refill(roster):
+    header, rows = roster
+    engine = RosterSync()
+    assert_same_as_full(engine, header, rows)
+    assert engine.apply(header, []).empty
+    assert_same_as_full(engine, header, rows)
+
+
+def _write_sheet(root, header, rows, stamp: int):
+    folder = os.path.join(root, "학생명단")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, "students.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows([header] + rows)
+    os.utime(path, (stamp, stamp))  # 수정시각이 바뀌어야 다시 받음
+
+
+def test_fetch_mode_switch(tmp_path, roster):
+    header, rows = roster
+    ni = header.index(COL_NAME)
+    engine = RosterSync(fetch_mode="columns")
+
+    for stamp, mode in enumerate(["columns", "records", "records", "columns"], start=1_700_000_000):
+        rows[stamp % len(rows)][ni] = f"바뀐이름{stamp}"
+        _write_sheet(tmp_path, header, rows, stamp)
+        sh = LocalSheetsClient(str(tmp_path)).open("학생명단")
+        engine.fetch_mode = mode
+        got = engine.sync(sh, "students")
+        expected = RosterSync(fetch_mode=mode).sync(sh, "students")
+        pd.testing.assert_frame_equal(got, expected)
+        assert frame_fingerprint(got) == frame_fingerprint(expected)
+
+
+class GatedSheet:
+    """수정시각 확인을 gate가 열릴 때까지 붙잡아 두는 가짜 스프레드시트 (호출 수 기록)"""
+
+    def __init__(self, header, rows, error: Exception = None):
+        self.records = [dict(zip(header, row)) for row in rows]
+        self.error = error
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.calls = 0
+
+    def get_lastUpdateTime(self):
+        self.calls += 1
+        self.entered.set()
+        self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return "v1"
+
+    def worksheet(self, title):
+        return self
+
+    def get_all_records(self):
+        return self.records
+
+
+def _refresh_all(engine, sheet, n):
+    """n개 스레드가 동시에 refresh -> (결과들, 오류들)"""
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(engine.refresh(lambda: sheet, "students"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    threads[0].start()
+    assert sheet.entered.wait(5)  # 첫 호출이 확인을 시작한 뒤에 나머지 호출
+    for t in threads[1:]:
+        t.start()
+    time.sleep(0.2)
+    sheet.gate.set()
+    for t in threads:
+        t.join(5)
+    return results, errors
+
+
+def test_refresh_single_flight(roster):
+    header, rows = roster
+    engine = RosterSync(fetch_mode="records")
+    sheet = GatedSheet(header, rows)
+    results, errors = _refresh_all(engine, sheet, 6)
+    assert errors == []
+    assert results == [True] * 6
+    assert sheet.calls == 1
+    assert len(engine.frame) == len(rows)
+    assert not engine.refreshing
+
+
+def test_refresh_min_interval(roster):
+    header, rows = roster
+    engine = RosterSync(fetch_mode="records")
+    sheet = GatedSheet(header, rows)
+    sheet.gate.set()
+    assert engine.refresh(lambda: sheet, "students", min_interval=60)
+    opened = []
+    assert engine.refresh(lambda: opened.append(1) or sheet, "students", min_interval=60) is False
+    assert opened == [] and sheet.calls == 1
+
+    engine.synced_at -= 61  # 간격이 지나면 다시 확인
+    assert engine.refresh(lambda: sheet, "students", min_interval=60)
+    assert sheet.calls == 2
+
+
+def test_refresh_error_shared_with_followers(roster):
+    header, rows = roster
+    engine = RosterSync(fetch_mode="records")
+    boom = ConnectionError("시트 연결 실패")
+    sheet = GatedSheet(header, rows, error=boom)
+    results, errors = _refresh_all(engine, sheet, 5)
+    assert results == []
+    assert len(errors) == 5 and all(e is boom for e in errors)
+    assert sheet.calls == 1
+    assert not engine.refreshing
+
+    # 실패 뒤에는 다음 호출이 새로 확인
+    sheet.error = None
+    assert engine.refresh(lambda: sheet, "students")
+    assert sheet.calls == 2
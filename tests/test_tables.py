@@ -0,0 +1,118 @@
+# tests/test_tables.py
+# 보고서 HTML 골든 테스트: 고정 seed 명단으로 만든 보고서가 tests/golden/ 파일과 바이트 단위로 같은지
+#   골든 다시 만들기 (출력 변경이 의도된 경우만): UPDATE_GOLDEN=1 python -m pytest tests/test_tables.py
+import datetime
+import os
+
+import pytest
+
+from academy.bench import synthetic_roster, synthetic_assignments
+from academy.batch import attendance_packet, date_range
+from academy.config import COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS
+from academy.sync import RosterSync
+from academy.tables import (
+    generate_total_list_html, generate_table1, generate_table2, generate_table3, generate_table4
+)
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+UPDATE = os.environ.get("UPDATE_GOLDEN") == "1"
+
+WEEK = date_range(datetime.date(2026, 10, 12), datetime.date(2026, 10, 18))  # 월 ~ 일
+
+# 이스케이프 확인용 학생 (시트에 실제로 들어올 수 있는 꺾쇠/앰퍼샌드). 월1/수2 재원이라 모든 보고서에 나옴
+SPECIAL = {
+    COL_NAME: ["<b>김민서</b>", "이&박", "최<준"],
+    COL_SCHOOL: ["대치중", "A&B고", "서울초"],
+    COL_GRADE: ["중2", "고1", "초4"],
+    COL_DAYS: ["월,수"] * 3,
+    COL_PERIOD: ["월1,수2"] * 3,
+    COL_STATUS: ["재원"] * 3,
+}
+ESCAPED = {"<b>김민서</b>": "&lt;b&gt;김민서&lt;/b&gt;", "이&박": "이&amp;박", "최<준": "최&lt;준", "A&B고": "A&amp;B고"}
+
+
+def golden_roster():
+    header, cols = synthetic_roster(80, seed=7)
+    for col, values in SPECIAL.items():
+        cols[header.index(col)][:len(values)] = values
+    return RosterSync().apply(header, cols)
+
+
+@pytest.fixture(scope="module")
+def df():
+    return golden_roster()
+
+
+def _assignments(df, d: datetime.date) -> dict:
+    return synthetic_assignments(df, d, seed=d.day)
+
+
+def reports(df) -> dict:
+    """골든 파일 이름 -> HTML (모든 보고서 변형)"""
+    out = {"total": generate_total_list_html(df[[COL_NAME, COL_SCHOOL, COL_GRADE, COL_DAYS, COL_PERIOD, COL_STATUS]])}
+    for school in (True, False):
+        for count in (True, False):
+            out[f"table1_{school:d}{count:d}"] = generate_table1(df, school, count, "2026.10")
+    out["table2"] = generate_table2(df, "2026-10")
+    for d in WEEK:
+        for paused in (False, True):
+            out[f"table3_{d.isoformat()}_{'paused' if paused else 'active'}"] = generate_table3(df, d, paused, _assignments(df, d))
+    for grade in (True, False):
+        out[f"table4_{grade:d}"] = generate_table4(df, grade, "2026.10")
+    return out
+
+
+def test_golden(df):
+    got = reports(df)
+    if UPDATE:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        for name, html in got.items():
+            with open(os.path.join(GOLDEN_DIR, f"{name}.html"), "w", encoding="utf-8") as f:
+                f.write(html)
+    for name, html in got.items():
+        with open(os.path.join(GOLDEN_DIR, f"{name}.html"), encoding="utf-8") as f:
+            assert html == f.read(), f"{name}.html 이 골든과 다름"
+
+
+def test_escapes_special_names(df):
+    for name, html in reports(df).items():
+        if name.startswith("table3") and not name.startswith(("table3_2026-10-12", "table3_2026-10-14")):
+            continue  # 특수 이름 학생은 월/수 출석부에만 있음
+        for raw, escaped in ESCAPED.items():
+            if raw == "A&B고" and not name.startswith(("total", "table1_1", "table4")):
+                continue  # 학교명이 그대로 나오는 보고서만
+            assert raw not in html, name
+            assert escaped in html, name
+
+
+def test_escapes_title_text(df):
+    assert "2026 &lt;10&gt; &amp;" in generate_table1(df, True, True, "2026 <10> &")
+    assert "2026 &lt;10&gt; &amp;" in generate_table4(df, True, "2026 <10> &")
+
+
+def test_table3_accepts_assignment_table(df):
+    from academy.assignments import assignment_table
+    for d in WEEK:
+        amap = _assignments(df, d)
+        assert generate_table3(df, d, False, assignment_table(amap)) == generate_table3(df, d, False, amap)
+
+
+def test_packet_matches_single_days(df):
+    states = {d.isoformat(): _assignments(df, d) for d in WEEK}
+    packet = attendance_packet(df, WEEK, False, states.__getitem__)
+    expected = "".join(
+        f"<div class='a4-print-box'><div class='report-view'>{generate_table3(df, d, False, states[d.isoformat()])}</div></div>"
+        for d in WEEK
+    )
+    assert packet == expected
+
+
+def test_table2_long_period_digits(df):
+    # 수업교시에 아주 긴 숫자열이 있어도 (C long 범위 밖) 탭이 죽지 않고 그 교시 줄이 생김
+    df = df.copy()
+    first = df.index[df[COL_NAME] == "<b>김민서</b>"][0]
+    df.loc[first, COL_PERIOD] = "99999999999999999999"
+    html = generate_table2(df, "2026-10")
+    row = html[html.index("99999999999999999999교시"):]
+    row = row[:row.index("</tr>")]
+    assert "&lt;b&gt;김민서&lt;/b&gt;" in row